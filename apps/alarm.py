@@ -14,6 +14,24 @@ Key configuration keys (most optional with sensible defaults):
 - notify_service: service to call for notifications (e.g., script.notify_all).
 - cameras: optional list of camera entity ids to include in alerts.
 - fire_temperature_threshold: numeric threshold for fire temperature sensor.
+- incremental_alerts: keep a live alert set updated from sensor events instead of rescanning all sensors (default true).
+- sensor_name_noise: words removed from friendly names in alarm messages, a list or a mapping of language to list.
+- journal_path: append-only journal of sensor, presence, arming, trigger and notification events; the ignore list,
+  unavailable sensors, last disarm time and alarm message are restored from it on start (see journal.py).
+- trigger_latency_slo: seconds from sensor change to sirens and notification before a trigger is flagged (default 2).
+- trigger_latency_sensor: optional sensor showing the last trigger latency and per-stage histograms.
+- burglar_window, burglar_window_sensors, burglar_window_zones: also trigger a burglar alarm when that many
+  distinct sensors (or zones from `sensor_zones`) became active within `burglar_window` seconds.
+- bridge_entities: zigbee bridge/coordinator entities that must be online for `bridge_stable_after` seconds
+  (default 300) before sensors and buttons are acted on (default: the zigbee2mqtt bridge connection state).
+  A bridge changing `bridge_flap_changes` times within `bridge_flap_window` seconds has to stay online for
+  the whole window; the analysis missed meanwhile runs once when the bridges are stable.
+- unavailable_history: unavailable periods kept per sensor (default 16).
+- unavailable_quarantine_count, unavailable_quarantine_window: ignore a sensor that became unavailable that many
+  times within the window (default 86400 seconds) until it calms down; 0 (default) disables the quarantine.
+- partitions: further alarm partitions (e.g. garage, shed) handled by the same app, each with its own
+  alarm_control_panel, sensor lists, sirens, lights, buttons and thresholds. The top-level config is the
+  partition `main`; presence, vacuum and zigbee health are evaluated once for all partitions.
 
 Example `apps.yaml` snippet :
 
@@ -31,19 +49,81 @@ alarm:
     notify_service: script.notify_all
     cameras:
         - camera.front_door
+    partitions:
+        garage:
+            alarm_control_panel: alarm_control_panel.garage
+            armed_away_binary_sensors:
+                - binary_sensor.garage_door
+            armed_away_sensor_threshold: 1
+            burglar_siren_switches:
+                - switch.garage_siren
 ```
 
 See module docstring and inline examples for usage.
 """
 
-from base import BaseApp
+from base import BaseApp, BridgeHealth, CallbackStats, DeadlineHeap, Histogram, cached_evaluation
+from journal import AlarmJournal, read_journal
+from array import array
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime, timezone
+import functools
+import math
 import re
 import inspect
-
+import time
+
+# stages of a traced alarm trigger after the sensor change, see `start_trigger_trace`
+TRIGGER_STAGES = ("analyze", "trigger", "panel", "siren", "notify")
+TRIGGER_LATENCY_BUCKETS = CallbackStats.LATENCY_BUCKETS + (30, 60)
+
+# words removed from friendly names in alarm messages, see `optimize_sensor_name`
+SENSOR_NAME_NOISE = ("bewegungsmelder", "fenstersensor", "türsensor", "rauchmelder", "sensor", "manipulation", "radar")
+
+# light feature flag for the `flash` option of light.turn_on
+LIGHT_SUPPORT_FLASH = 8
+# flash warning ticks (seconds) between two `flash: long` calls to lights that support it
+FLASH_EFFECT_INTERVAL = 10
+
+# default bridge gating analysis and buttons, see `BridgeHealth`
+ZIGBEE_BRIDGE = "binary_sensor.zigbee2mqtt_bridge_connection_state"
+
+# partition made of the top-level config, see `AlarmControl.setup_partitions`
+MAIN_PARTITION = "main"
+# per-partition state, swapped in by `AlarmControl.partition_scope`
+PARTITION_ATTRIBUTES = (
+    "_alarm_control_panel", "_alarm_control_buttons", "_alarm_lights",
+    "_fire_siren_switches", "_burglar_siren_switches",
+    "_sensors", "_sensors_ignored", "_sensor_index",
+    "_live_alerts", "_alert_deadlines", "_alert_timer", "_alert_timer_deadline",
+    "_arming_state", "_alarm_type", "_alarm_message", "_alarm_message_key", "_last_disarm_timestamp",
+    "_fire_sensor_threshold", "_water_sensor_threshold",
+    "_armed_home_sensor_threshold", "_armed_away_sensor_threshold",
+    "_armed_home_sensor_delay", "_armed_away_sensor_delay",
+    "_burglar_correlator", "_trace_origin", "_trace_analyze", "_trigger_trace",
+    "_flash_warning_handle", "_media_warning_handle", "_flash_count", "_media_warning_count",
+    "_flash_toggle_lights", "_flash_effect_lights",
+)
+
+
+def partition_callback(method):
+    """Decorator running an AlarmControl callback in the partition named by its `partition` kwarg.
+
+    Listeners and timers created for a partition pass `partition=<name>`
+    (see `AlarmControl.partition_kwargs`); without it the callback runs in
+    the main partition.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args):
+        kwargs = args[-1] if args and isinstance(args[-1], dict) else {}
+        with self.partition_scope(kwargs.get("partition")):
+            return method(self, *args)
+    return wrapper
 
 
 class AlarmControl(BaseApp):
+    SNAPSHOT_ENTITY_LISTS = BaseApp.SNAPSHOT_ENTITY_LISTS + ("_alarm_lights", "_fire_siren_switches", "_burglar_siren_switches")
 
     def initialize(self):
         """
@@ -152,6 +232,13 @@ class AlarmControl(BaseApp):
         }
 
 
+        # words stripped from sensor names, either one list or one per language
+        noise = self.args.get("sensor_name_noise", SENSOR_NAME_NOISE)
+        if isinstance(noise, dict):
+            noise = noise.get(self._language, SENSOR_NAME_NOISE)
+        self._sensor_name_pattern = compile_sensor_name_pattern(tuple(noise))
+        self._alarm_message_key = None
+
         # Setup sane defaults
         self._sensors = {
             'armed_home': {},
@@ -201,9 +288,13 @@ class AlarmControl(BaseApp):
         self._sensors['always']['smoke'] = self.args.get("fire_binary_sensors", [])
         self._sensors['always']['fire'] = self.args.get("fire_temperature_sensors", [])
 
-        self._sensors_ignored = []
-        # Track unavailable periods for sensors: entity_id -> {"start": datetime, "end": datetime|None}
-        self._sensors_unavailable = {}
+        self._sensors_ignored = set()
+        # last unavailable periods per sensor, see UnavailabilityLog
+        self._unavailable_quarantine_count = self.args.get("unavailable_quarantine_count", 0)
+        self._unavailable_quarantine_window = self.args.get("unavailable_quarantine_window", 24 * 60 * 60)
+        self._sensors_unavailable = UnavailabilityLog(max(self.args.get("unavailable_history", 16), self._unavailable_quarantine_count))
+        # sensors ignored for flapping between available and unavailable, shared by all partitions
+        self._sensors_quarantined = frozenset()
 
         # arming_state, group_name
 
@@ -216,21 +307,41 @@ class AlarmControl(BaseApp):
         self._armed_away_sensor_delay = 10
         self._armed_away_sensor_threshold = 2
 
+        # end-to-end trigger latency tracing (see start_trigger_trace)
+        self._trigger_latency_slo = self.args.get("trigger_latency_slo", 2)
+        self._trigger_latency_sensor = self.args.get("trigger_latency_sensor", None)
+        self._trigger_latency = {stage: Histogram(TRIGGER_LATENCY_BUCKETS) for stage in TRIGGER_STAGES + ("total",)}
+        self._trigger_slo_violations = 0
+        self._trace_origin = None
+        self._trace_analyze = None
+        self._trigger_trace = None
+
+        # event-time correlation of burglar sensors (see BurglarCorrelator)
+        self._burglar_window_sensors = self.args.get("burglar_window_sensors", 0)
+        self._burglar_window_zones = self.args.get("burglar_window_zones", 0)
+        self._sensor_zones = {sensor: zone for zone, sensors in self.args.get("sensor_zones", {}).items() for sensor in sensors}
+        self._burglar_correlator = None
+        burglar_window = self.args.get("burglar_window", 0)
+        if burglar_window > 0 and (self._burglar_window_sensors > 0 or self._burglar_window_zones > 0):
+            self._burglar_correlator = BurglarCorrelator(burglar_window, self.args.get("burglar_window_events", 256))
+
         self._sensor_listeners = {}
 
         # Iterate over sensors and set up listeners
         for arming_state, sensor_dict in self._sensors.items():
-            self.log(f"Setting up listeners for state {arming_state}", level="DEBUG")
+            self.log_debug("Setting up listeners for state %s", arming_state)
             for group_name, sensor_list in sensor_dict.items():  # Get group name and sensor list
-                self.log(f"Setting up listeners for group {group_name}", level="DEBUG")
+                self.log_debug("Setting up listeners for group %s", group_name)
                 for sensor in sensor_list:  # Iterate over individual sensors
-                    sensor_type = self.get_state(sensor, attribute = "device_class")
-                    self.log(f"[{sensor}] Setting up listener with type {sensor_type}", level="DEBUG")
+                    self.log_debug("[%s] Setting up listener", sensor)
                     if sensor in self._sensor_listeners:
-                        self.log(f"[{sensor}] Skipping sensor because we are already listening to it", level="DEBUG")
+                        self.log_debug("[%s] Skipping sensor because we are already listening to it", sensor)
                         continue
-                    self._sensor_listeners[sensor] = self.listen_state(self.sensor_change_callback, sensor)
-                    self._sensor_listeners[sensor + '_delayed'] = self.listen_state(self.sensor_change_callback, sensor, duration=self._armed_away_sensor_delay)
+                    # one listener per sensor, delayed re-checks run from the app's timer heap
+                    self._sensor_listeners[sensor] = self.listen_state(self.sensor_event_callback, sensor, attribute="all")
+
+        # reverse index used by is_sensor_monitored and get_alerts
+        self.rebuild_sensor_index()
 
         # controls
         self._alarm_control_buttons = self.args.get("alarm_control_buttons", [])
@@ -258,16 +369,11 @@ class AlarmControl(BaseApp):
         for button in self._alarm_control_buttons:
             self.listen_event(self.alarm_button_callback, entity_id=button, event_type="state_changed", event="state_changed")
 
-        # auto arm and disarm
-        i = 0
-        for sensor in self._device_trackers:
-            self.listen_state(self.presence_change_callback,
-                                sensor, old="home", duration=5 * 60 + i)
-            self.listen_state(self.presence_change_callback,
-                                sensor, new="home", duration=i)
-            self.listen_state(self.presence_change_callback,
-                                sensor, new="home", duration=5 * 60 + i)
-            i += 1
+        # auto arm and disarm, delays are staggered per tracker
+        self._presence_delays = {}
+        for i, sensor in enumerate(self._device_trackers):
+            self._presence_delays[sensor] = i
+            self.listen_state(self.presence_event_callback, sensor)
 
         if self._vacation_control:
             self.listen_state(self.presence_change_callback, self._vacation_control)
@@ -275,6 +381,18 @@ class AlarmControl(BaseApp):
         if self._guest_control:
             self.listen_state(self.presence_change_callback, self._guest_control)
 
+        # zigbee bridges gating analysis and buttons, tracked by listener
+        self._bridge_health = BridgeHealth(self.args.get("bridge_entities", [ZIGBEE_BRIDGE]),
+                                           stable_after=self.args.get("bridge_stable_after", 300),
+                                           flap_window=self.args.get("bridge_flap_window", 600),
+                                           flap_changes=self.args.get("bridge_flap_changes", 4))
+        for bridge in self._bridge_health.entities:
+            last_updated = self.get_last_updated(bridge)
+            since = last_updated if last_updated is not None else self.get_utc_time()
+            self._bridge_health.update(bridge, self.get_state(bridge), since.timestamp(), transition=False)
+            self.listen_state(self.bridge_change_callback, bridge)
+        self.schedule_bridge_recheck()
+
         self._flash_warning_handle = None
         self._media_warning_handle = None
 
@@ -290,6 +408,19 @@ class AlarmControl(BaseApp):
         self._alarm_type = None
         self._alarm_message = None
 
+        # append-only event journal, also used to restore state after a restart
+        self._journal = None
+        journal_path = self.args.get("journal_path")
+        if journal_path:
+            self.restore_from_journal(journal_path)
+            self._journal = AlarmJournal(journal_path,
+                                         max_bytes=self.args.get("journal_max_bytes", 5 * 1024 * 1024),
+                                         batch_size=self.args.get("journal_batch_size", 100),
+                                         keep_segments=self.args.get("journal_keep_segments", 10))
+            # starting point for replays: trackers that never change are otherwise unknown
+            for tracker in self._device_trackers:
+                self.record_journal("presence", tracker, None, self.get_state(tracker))
+
         # Init system
         self.stop_burglar_siren()
         self.stop_fire_siren()
@@ -308,6 +439,20 @@ class AlarmControl(BaseApp):
         self.notify(self.translate("system_start"), prio=1)
         self.notify_awtrix(self.translate("system_start"), "hass_alarm_system_state", 30, 60 * 5)
 
+        # live alert set, updated from sensor events (see update_sensor_alert)
+        self._live_alerts = None
+        if self.args.get("incremental_alerts", True):
+            self._live_alerts = {}
+            self._alert_deadlines = DeadlineHeap()
+            self._alert_timer = None
+            self._alert_timer_deadline = None
+            self.refresh_live_alerts()
+            for vacuum_cleaner in self._vacuum_cleaners:
+                self.listen_state(self.vacuum_change_callback, vacuum_cleaner)
+
+        # further panels with their own sensors, sharing the listeners above
+        self.setup_partitions(self.args.get("partitions", {}))
+
         # Set start time to now, aligning to the next full 10-minute mark
         self.run_every(self.periodic_time_callback, "now+10", 60*10)
 
@@ -315,13 +460,245 @@ class AlarmControl(BaseApp):
         """Cleanup on app termination.
 
         Stops any running sirens and disarms the alarm if it is not already
-        disarmed.
+        disarmed, in every partition. The journal writer is stopped last, so
+        these shutdown changes are still journaled.
         """
+        if not self.dispatch_to_partitions(self.shutdown_partition):
+            self.shutdown_partition()
+        journal = getattr(self, "_journal", None)
+        if journal is not None:
+            journal.stop()
+        super().terminate()
+
+    def shutdown_partition(self):
+        """Stop the sirens of the active partition and disarm its panel."""
         self.stop_burglar_siren()
         self.stop_fire_siren()
         if not self.is_alarm_disarmed():
             self.disarm_alarm()
 
+    def get_configured_entities(self):
+        """Return the configured entities including all sensor groups."""
+        entities = super().get_configured_entities()
+        for groups in getattr(self, "_sensors", {}).values():
+            for sensors in groups.values():
+                entities.update(sensors)
+        entities.add(self._alarm_control_panel)
+        for state in getattr(self, "_partitions", {}).values():
+            for groups in state["_sensors"].values():
+                for sensors in groups.values():
+                    entities.update(sensors)
+            entities.add(state["_alarm_control_panel"])
+        entities.discard(None)
+        return entities
+
+    def setup_partitions(self, partitions):
+        """
+        Set up further alarm partitions from the `partitions` config.
+
+        Each partition gets its own panel, sensor index, live alert set,
+        thresholds, sirens and lights (see `build_partition`), while sensor
+        listeners stay one per entity and trackers, vacuum cleaners and the
+        periodic timers are shared. Sensor events are dispatched to the
+        partitions monitoring the sensor, presence and timer callbacks to all
+        of them.
+
+        Args:
+            partitions (dict): partition name -> config overrides.
+        """
+        self._partitions = {}
+        self._sensor_partitions = {}
+        self._partition_evaluations = {}
+        self._active_partition = None
+        if not partitions:
+            return
+
+        for name, config in partitions.items():
+            if name == MAIN_PARTITION:
+                raise ValueError(f"Partition name {MAIN_PARTITION} is reserved for the top-level config")
+            self._partitions[name] = self.build_partition(config)
+
+        for name in self.get_partition_names():
+            with self.partition_scope(name):
+                for groups in self._sensors.values():
+                    for sensors in groups.values():
+                        for sensor in sensors:
+                            owners = self._sensor_partitions.setdefault(sensor, [])
+                            if name not in owners:
+                                owners.append(name)
+                            if sensor not in self._sensor_listeners:
+                                self._sensor_listeners[sensor] = self.listen_state(self.sensor_event_callback, sensor, attribute="all")
+                if name == MAIN_PARTITION:
+                    continue
+
+                if getattr(self, "_live_alerts", None) is not None:
+                    self.refresh_live_alerts()
+                self._arming_state = self.get_alarm_state()
+                self.listen_state(self.control_change_callback, self._alarm_control_panel, partition=name)
+                for button in self._alarm_control_buttons:
+                    self.listen_event(self.alarm_button_callback, entity_id=button, event_type="state_changed",
+                                      event="state_changed", partition=name)
+                self.stop_burglar_siren()
+                self.stop_fire_siren()
+                self.log(f"Got partition {name} with alarm state {self._arming_state} "
+                         f"and {len(self.get_sensor_index().memberships)} sensors")
+
+        self._sensor_partitions = {sensor: tuple(owners) for sensor, owners in self._sensor_partitions.items()}
+
+    def build_partition(self, config):
+        """
+        Return the initial state of a partition from its config.
+
+        Sensor lists use the same keys as the top-level config; thresholds
+        and delays not set in `config` are taken over from the main partition.
+        """
+        if "alarm_control_panel" not in config:
+            raise ValueError("Every partition needs an alarm_control_panel")
+        home = config.get("armed_home_binary_sensors", [])
+        home_images = config.get("armed_home_image_processing_sensors", [])
+        away = config.get("armed_away_binary_sensors", [])
+        away_images = config.get("armed_away_image_processing_sensors", [])
+        sensors = {
+            'armed_home': {'group1': home, 'group2': home_images},
+            'armed_away': {'group1': away, 'group2': away_images},
+            'armed_night': {'group1': home, 'group2': home_images},
+            'armed_vacation': {'group1': away, 'group2': away_images},
+            'disarmed': {},
+            'always': {
+                'water': config.get("water_binary_sensors", []),
+                'smoke': config.get("fire_binary_sensors", []),
+                'fire': config.get("fire_temperature_sensors", []),
+            },
+        }
+        correlator = getattr(self, "_burglar_correlator", None)
+        live = getattr(self, "_live_alerts", None) is not None
+        state = {
+            "_alarm_control_panel": config["alarm_control_panel"],
+            "_alarm_control_buttons": config.get("alarm_control_buttons", []),
+            "_alarm_lights": config.get("alarm_lights", []),
+            "_fire_siren_switches": config.get("fire_siren_switches", []),
+            "_burglar_siren_switches": config.get("burglar_siren_switches", []),
+            "_sensors": sensors,
+            "_sensors_ignored": set(),
+            "_sensor_index": None,
+            "_live_alerts": {} if live else None,
+            "_alert_deadlines": DeadlineHeap() if live else None,
+            "_alert_timer": None,
+            "_alert_timer_deadline": None,
+            "_arming_state": None,
+            "_alarm_type": None,
+            "_alarm_message": None,
+            "_alarm_message_key": None,
+            "_last_disarm_timestamp": None,
+            "_burglar_correlator": BurglarCorrelator(correlator.window, correlator.maxlen) if correlator is not None else None,
+            "_trace_origin": None,
+            "_trace_analyze": None,
+            "_trigger_trace": None,
+            "_flash_warning_handle": None,
+            "_media_warning_handle": None,
+            "_flash_count": 0,
+            "_media_warning_count": 0,
+            "_flash_toggle_lights": None,
+            "_flash_effect_lights": [],
+        }
+        for attr in ("fire_sensor_threshold", "water_sensor_threshold", "armed_home_sensor_threshold",
+                     "armed_away_sensor_threshold", "armed_home_sensor_delay", "armed_away_sensor_delay"):
+            state["_" + attr] = config.get(attr, getattr(self, "_" + attr))
+        return state
+
+    def get_partition_names(self):
+        """Return the names of all partitions, the main partition first."""
+        return (MAIN_PARTITION,) + tuple(getattr(self, "_partitions", {}))
+
+    def get_sensor_partitions(self, sensor):
+        """Return the partitions monitoring `sensor`, or (None,) without partitions."""
+        if not getattr(self, "_partitions", None):
+            return (None,)
+        return self._sensor_partitions.get(sensor, (MAIN_PARTITION,))
+
+    @contextmanager
+    def partition_scope(self, name):
+        """
+        Context manager making partition `name` the active one.
+
+        The partition's attributes (see `PARTITION_ATTRIBUTES`) are swapped
+        into the app for the duration of the block and written back to the
+        partition afterwards, so the alarm logic works on whichever partition
+        is active. The main partition lives in the app itself. Without
+        partitions, for `name` None or the already active partition this does
+        nothing. Callbacks run one at a time per app, which keeps the swap safe.
+        """
+        partitions = getattr(self, "_partitions", None)
+        active = getattr(self, "_active_partition", None)
+        if not partitions or name is None or name == active:
+            yield
+            return
+        if name == MAIN_PARTITION and active is not None:
+            raise RuntimeError(f"Cannot enter partition {MAIN_PARTITION} from partition {active}")
+
+        state = partitions.get(name) if name != MAIN_PARTITION else None
+        if name != MAIN_PARTITION and state is None:
+            raise KeyError(f"Unknown partition {name}")
+        # plain instance attributes, so the swap works on the instance dict
+        attributes = self.__dict__
+        saved = None
+        if state is not None:
+            saved = {attr: attributes.get(attr) for attr in PARTITION_ATTRIBUTES}
+            attributes.update(state)
+        self._active_partition = name
+        try:
+            yield
+        finally:
+            self._active_partition = active
+            if saved is not None:
+                state.update({attr: attributes.get(attr) for attr in PARTITION_ATTRIBUTES})
+                attributes.update(saved)
+
+    def partition_kwargs(self):
+        """Return the kwargs that route a timer or listener back to the active partition."""
+        name = getattr(self, "_active_partition", None)
+        return {"partition": name} if name not in (None, MAIN_PARTITION) else {}
+
+    def dispatch_to_partitions(self, method, *args, partitions=None):
+        """
+        Run `method(*args)` once per partition inside one evaluation scope.
+
+        Reads of shared entities (device trackers, guest/vacation modes,
+        vacuum cleaners, zigbee bridge) are cached by the first partition and
+        reused by the others.
+
+        Returns:
+            bool: False when there are no partitions or a partition is already
+            active, in which case the caller should just go on.
+        """
+        if not getattr(self, "_partitions", None) or getattr(self, "_active_partition", None) is not None:
+            return False
+        with self.evaluation_scope():
+            for name in partitions if partitions is not None else self.get_partition_names():
+                with self.partition_scope(name):
+                    method(*args)
+        return True
+
+    def get_partition_evaluation(self):
+        """
+        Return the analyze callable for the active partition.
+
+        Deferred (coalesced) evaluations run from a timer outside any
+        partition, so for partitions other than the main one the callable
+        enters the partition first and carries its own name for coalescing.
+        """
+        name = getattr(self, "_active_partition", None)
+        if name in (None, MAIN_PARTITION):
+            return self.analyze_and_trigger
+        evaluation = self._partition_evaluations.get(name)
+        if evaluation is None:
+            def evaluation():
+                with self.partition_scope(name):
+                    self.analyze_and_trigger()
+            evaluation.__name__ = f"analyze_and_trigger_{name}"
+            self._partition_evaluations[name] = evaluation
+        return evaluation
+
     def is_time_in_arm_night_window(self):
         """Return True when current time is within the auto-arm night window."""
         return self.now_is_between(self._alarm_arm_night_after_time, self._alarm_arm_night_before_time)
@@ -329,13 +706,11 @@ class AlarmControl(BaseApp):
     def set_alarm_light_color(self, color_name="green", brightness_pct=100):
         """Set configured alarm lights to the given color and brightness."""
         self.log(f"Setting alarm light to color {color_name} and brightness {brightness_pct}")
-        for light in self._alarm_lights:
-            self.call_service(
-                "light/turn_on", entity_id=light, color_name=color_name, brightness_pct=brightness_pct)
+        self.call_service_per_domain("turn_on", self._alarm_lights, color_name=color_name, brightness_pct=brightness_pct)
 
     def set_alarm_type(self, alarm_type):
         """Record the current alarm type (e.g., 'burglar', 'fire', 'water')."""
-        self.log(f"Setting alarm type to {alarm_type}", level = "DEBUG")
+        self.log_debug("Setting alarm type to %s", alarm_type)
         self._alarm_type = alarm_type
 
     def get_alarm_type(self):
@@ -344,28 +719,42 @@ class AlarmControl(BaseApp):
 
     def set_alarm_message(self, message):
         """Set the current alarm message and notify AWTRIX for display."""
-        self.log(f"Setting up alarm message: {message}", level = "DEBUG")
+        self.log_debug("Setting up alarm message: %s", message)
         self.notify_awtrix(message, "hass_alarm_msg")
         self._alarm_message = message
 
     def reset_alarm_message(self):
         """Clear the active alarm message and clear AWTRIX display."""
-        self.log("Resetting alarm message", level = "DEBUG")
+        self.log_debug("Resetting alarm message")
         self.reset_awtrix("hass_alarm_msg")
         self._alarm_message = None
+        self._alarm_message_key = None
 
     def get_alarm_message(self):
         """Return the currently set alarm message (or None)."""
         return self._alarm_message
 
+    @partition_callback
     def flash_warning(self, kwargs):
-        """Timer callback that toggles alarm lights repeatedly for a flash warning."""
-        for light in self._alarm_lights:
-            self.toggle(light)
+        """
+        Timer callback flashing the alarm lights once per second.
+
+        Lights without flash support are toggled with one service call per
+        domain; lights with it are sent `flash: long` every
+        `FLASH_EFFECT_INTERVAL` seconds and flash on their own in between.
+        """
+        toggled = getattr(self, "_flash_toggle_lights", None)
+        if toggled is None:
+            toggled = self._alarm_lights
+        flashing = getattr(self, "_flash_effect_lights", [])
+        if toggled:
+            self.call_service_per_domain("toggle", toggled)
+        if flashing and self._flash_count % FLASH_EFFECT_INTERVAL == 0:
+            self.call_service_per_domain("turn_on", flashing, flash="long")
         self._flash_count += 1
         self.log(f"Flash warning count {self._flash_count}")
         if self._flash_count < 60:
-            self._flash_warning_handle = self.run_in(self.flash_warning, 1)
+            self._flash_warning_handle = self.run_in(self.flash_warning, 1, **self.partition_kwargs())
 
     def start_flash_warning(self, color_name="red", brightness_pct=100):
         """Begin flashing configured alarm lights (color/brightness) repeatedly."""
@@ -374,9 +763,12 @@ class AlarmControl(BaseApp):
             return
         self.stop_flash_warning()
         self._flash_count = 0
+        self._flash_effect_lights = [light for light in self._alarm_lights
+                                     if int(self.get_state(light, attribute="supported_features") or 0) & LIGHT_SUPPORT_FLASH]
+        self._flash_toggle_lights = [light for light in self._alarm_lights if light not in self._flash_effect_lights]
         self.set_alarm_light_color(color_name, brightness_pct)
         self.log(f"Starting flash warning timer with color {color_name} and brightness {brightness_pct}")
-        self._flash_warning_handle = self.run_in(self.flash_warning, 1)
+        self._flash_warning_handle = self.run_in(self.flash_warning, 1, **self.partition_kwargs())
 
     def stop_flash_warning(self):
         """Stop any ongoing flash warning timer and finalize flash state."""
@@ -389,13 +781,14 @@ class AlarmControl(BaseApp):
             self._flash_count = 60
             self._flash_warning_handle = None
 
+    @partition_callback
     def media_warning(self, kwargs):
         """Timer loop to repeatedly send media notifications for an alarm."""
         self.media_warning_with_delay(self.get_alarm_message())
         self._media_warning_count += 1
         self.log(f"Media warning count {self._media_warning_count}")
         if self._media_warning_count < self._media_warning_max_count:
-            self._media_warning_handle = self.run_in(self.media_warning, self._media_warning_delay + 5)
+            self._media_warning_handle = self.run_in(self.media_warning, self._media_warning_delay + 5, **self.partition_kwargs())
 
     def media_warning_with_delay(self, message, delay=5):
         """Send each message with a delay"""
@@ -406,7 +799,7 @@ class AlarmControl(BaseApp):
         self.stop_media_warning()
         self._media_warning_count = 0
         self.log("Starting media warning timer")
-        self._media_warning_handle = self.run_in(self.media_warning, self._media_warning_initial_delay)
+        self._media_warning_handle = self.run_in(self.media_warning, self._media_warning_initial_delay, **self.partition_kwargs())
 
     def stop_media_warning(self):
         """Stop any ongoing repeating media notifications for alarms."""
@@ -422,32 +815,35 @@ class AlarmControl(BaseApp):
             self.log("Suppressed siren because of silent mode")
             return
 
-        for siren in self._burglar_siren_switches:
-            self.log(f"Turning on burglar siren {siren}")
-            self.turn_on(siren)
+        if self._burglar_siren_switches:
+            self.log(f"Turning on burglar sirens {self._burglar_siren_switches}")
+            self.call_service_per_domain("turn_on", self._burglar_siren_switches)
+        self.mark_trigger_stage("siren")
 
     def stop_burglar_siren(self):
         """Turn off configured burglar siren switches."""
-        for siren in self._burglar_siren_switches:
-            self.log(f"Turning off burglar siren {siren}")
-            self.turn_off(siren)
+        if self._burglar_siren_switches:
+            self.log(f"Turning off burglar sirens {self._burglar_siren_switches}")
+            self.call_service_per_domain("turn_off", self._burglar_siren_switches)
 
     def start_fire_siren(self):
         """Turn on configured fire siren switches."""
-        for siren in self._fire_siren_switches:
-            self.log(f"Turning on fire siren {siren}")
-            self.turn_on(siren)
+        if self._fire_siren_switches:
+            self.log(f"Turning on fire sirens {self._fire_siren_switches}")
+            self.call_service_per_domain("turn_on", self._fire_siren_switches)
+        self.mark_trigger_stage("siren")
 
     def stop_fire_siren(self):
         """Turn off configured fire siren switches."""
-        for siren in self._fire_siren_switches:
-            self.log(f"Turning off fire siren {siren}")
-            self.turn_off(siren)
+        if self._fire_siren_switches:
+            self.log(f"Turning off fire sirens {self._fire_siren_switches}")
+            self.call_service_per_domain("turn_off", self._fire_siren_switches)
 
     def debug_event(self, event_name, data, kwargs):
         """Utility handler to log debug events (used for troubleshooting)."""
         self.log(f"Debug event {event_name}:{data} {kwargs}")
 
+    @partition_callback
     def alarm_button_callback(self, event_name, data, kwargs):
         """Handle physical button events and map them to alarm actions.
 
@@ -464,11 +860,8 @@ class AlarmControl(BaseApp):
 
         self.log(f"Got event type {event_type}")
 
-        if self.get_state("binary_sensor.zigbee2mqtt_bridge_connection_state") != 'on':
-            self.log("Doing nothing because zigbee2mqtt_bridge_connection_state is not on")
-            return
-        if self.get_seconds_since_update("binary_sensor.zigbee2mqtt_bridge_connection_state") < 300:
-            self.log("Doing nothing because zigbee2mqtt_bridge_connection_state is not online more than 300 seconds")
+        if not self.is_bridge_stable():
+            self.log(f"Doing nothing because the zigbee bridge is {self.get_bridge_state()}")
             return
 
         if event_type == "single":
@@ -486,6 +879,48 @@ class AlarmControl(BaseApp):
         else:
             self.log("Ignoring event")
 
+    def is_bridge_stable(self):
+        """Return True when all bridges have been online long enough to trust sensors and buttons."""
+        health = getattr(self, "_bridge_health", None)
+        if health is None:
+            # app set up without initialize(): read the default bridge directly
+            return self.get_state(ZIGBEE_BRIDGE) == 'on' and self.get_seconds_since_update(ZIGBEE_BRIDGE) >= 300
+        return health.is_stable(self.get_utc_time().timestamp())
+
+    def get_bridge_state(self):
+        """Return the bridge health as 'stable', 'settling', 'flapping' or 'offline'."""
+        health = getattr(self, "_bridge_health", None)
+        if health is None:
+            return "stable" if self.is_bridge_stable() else "not stable"
+        return health.get_state(self.get_utc_time().timestamp())
+
+    def bridge_change_callback(self, entity, attribute, old, new, kwargs):
+        """Track a bridge going online or offline and re-plan the deferred analysis."""
+        now = self.get_utc_time().timestamp()
+        if self._bridge_health.update(entity, new, now):
+            self.log(f"Bridge {entity} changed from {old} to {new}, bridges are {self._bridge_health.get_state(now)}")
+            self.schedule_bridge_recheck()
+
+    def schedule_bridge_recheck(self):
+        """
+        Run `bridge_recheck` once the bridges are stable.
+
+        Sensor events while the bridges are offline, settling or flapping
+        are not analyzed; this single re-check replaces them. Every bridge
+        change moves it to the new `stable_at`.
+        """
+        delay = self._bridge_health.stable_at - self.get_utc_time().timestamp()
+        if delay == math.inf:
+            self.cancel_recheck(("bridge", "stable"))
+        elif delay > 0:
+            self.schedule_recheck(("bridge", "stable"), delay, self.bridge_recheck)
+
+    def bridge_recheck(self):
+        """Analyze all partitions once after the bridges became stable."""
+        if self.dispatch_to_partitions(self.bridge_recheck):
+            return
+        self.analyze_and_trigger()
+
     def button_arm_away(self, entity):
         """Arm the alarm in 'away' mode (via button action).
 
@@ -542,17 +977,91 @@ class AlarmControl(BaseApp):
 
         Returns a sensor_type string (e.g., 'door','motion') or None when unknown.
         """
-        for sensor_type, keywords in self._sensor_mapping.items():
-            if device_class in keywords:
-                return sensor_type
-        return None
+        return self.get_inverted_mapping("_sensor_mapping").get(device_class)
 
     def classify_alarm(self, device_class: str) -> str:
         """Map a sensor device_class to an alarm category (e.g., 'burglar', 'fire')."""
-        for sensor_type, keywords in self._alarm_mapping.items():
-            if device_class in keywords:
-                return sensor_type
-        return None
+        return self.get_inverted_mapping("_alarm_mapping").get(device_class)
+
+    def get_inverted_mapping(self, attr):
+        """Return a device_class -> key dict for the mapping stored in `attr`.
+
+        The first key listing a device_class wins, as in the original list
+        scan. The dict is rebuilt when the mapping object is replaced.
+        """
+        mapping = getattr(self, attr)
+        inverted = getattr(self, "_inverted_mappings", None)
+        if inverted is None:
+            inverted = self._inverted_mappings = {}
+        cached = inverted.get(attr)
+        if cached is None or cached[0] is not mapping:
+            lookup = {}
+            for key, device_classes in mapping.items():
+                for device_class in device_classes:
+                    lookup.setdefault(device_class, key)
+            cached = inverted[attr] = (mapping, lookup)
+        return cached[1]
+
+    def get_sensor_index(self):
+        """Return the reverse sensor index, rebuilding it when it is stale.
+
+        The index is rebuilt when `_sensors`, `_sensors_ignored` or
+        `_sensors_quarantined` is replaced or the ignore set grew or shrank;
+        call `rebuild_sensor_index()` after changing the sensor groups in place.
+        """
+        index = getattr(self, "_sensor_index", None)
+        quarantined = getattr(self, "_sensors_quarantined", frozenset())
+        if index is None or not index.is_current(self._sensors, self._sensors_ignored, quarantined):
+            index = self._sensor_index = SensorIndex(self._sensors, self._sensors_ignored, self.get_sensor_class, quarantined)
+        return index
+
+    def rebuild_sensor_index(self):
+        """Drop cached sensor metadata and rebuild the sensor index from the config."""
+        self._sensor_meta = {}
+        self._sensor_index = None
+        index = self.get_sensor_index()
+        if getattr(self, "_live_alerts", None) is not None:
+            self.refresh_live_alerts()
+        return index
+
+    def get_sensor_meta(self, sensor):
+        """Return the cached `SensorMeta` of a sensor, building it on first use.
+
+        Sensors without a device_class yet (e.g. not loaded by Home Assistant)
+        are looked up again on the next call. `sensor_event_callback`
+        drops an entry when the device_class or friendly_name changes.
+        """
+        cache = getattr(self, "_sensor_meta", None)
+        if cache is None:
+            cache = self._sensor_meta = {}
+        meta = cache.get(sensor)
+        if meta is None:
+            device_class = self.get_state(sensor, attribute="device_class")
+            sensor_category = self.classify_sensor(device_class)
+            timeout = None
+            if sensor_category == 'motion':
+                timeout = self._motion_timeout
+            elif sensor_category in ['door', 'window']:
+                timeout = self._opening_timeout
+            name = None
+            if self.get_state(sensor, attribute="friendly_name") is not None:
+                name = self.optimize_sensor_name(sensor)
+            meta = SensorMeta(device_class, sensor_category, self.classify_alarm(device_class), name, timeout)
+            if device_class is not None:
+                cache[sensor] = meta
+        return meta
+
+    def get_sensor_class(self, sensor):
+        """Return (device_class, alarm_category) for a sensor from its metadata."""
+        meta = self.get_sensor_meta(sensor)
+        return meta.device_class, meta.alarm_category
+
+    def invalidate_sensor_meta(self, sensor):
+        """Drop cached metadata of a sensor whose device_class or name changed."""
+        self.log_debug("[%s] device_class or friendly_name changed, refreshing sensor metadata", sensor)
+        getattr(self, "_sensor_meta", {}).pop(sensor, None)
+        self._sensor_index = None
+        self._alarm_message_key = None
 
     def is_sensor_monitored(self, sensor):
         """Return True if a sensor is currently monitored for alarm conditions.
@@ -560,18 +1069,15 @@ class AlarmControl(BaseApp):
         A sensor is monitored when it appears in the configured sensor lists for
         the current or always arming states, and is not present in the ignore list.
         """
-        desired_arming_states = ['always', self.get_alarm_state(), self._arming_state]
-
-        if sensor in self._sensors_ignored:
+        index = self.get_sensor_index()
+        if sensor in index.ignored:
             return False
 
-        for arming_state, groups in self._sensors.items():
-            if arming_state not in desired_arming_states:
-                continue
-            for group, sensors in groups.items():
-                if sensor in sensors:
-                    return True
-        return False
+        memberships = index.memberships.get(sensor)
+        if not memberships:
+            return False
+        desired_arming_states = ('always', self.get_alarm_state(), self._arming_state)
+        return any(arming_state in desired_arming_states for arming_state, _ in memberships)
 
     def check_sensor(self, sensor, desired_state = 'off', timeout = None):
         """Validate a sensor's state against expected condition and optional timeout.
@@ -579,16 +1085,14 @@ class AlarmControl(BaseApp):
         Returns False when the sensor is in an unexpected state or changed too
         recently; True when it is OK or when sensor state is invalid for checks.
         """
-        sensor_type = self.get_state(sensor, attribute = "device_class")
+        meta = self.get_sensor_meta(sensor)
+        sensor_type = meta.device_class
         sensor_state = self.get_state(sensor)
         last_update = self.get_seconds_since_update(sensor)
-        sensor_classification = self.classify_sensor(sensor_type)
+        sensor_classification = meta.sensor_category
 
         if timeout is None:
-            if sensor_classification == 'motion':
-                timeout = self._motion_timeout
-            elif sensor_classification in ['door', 'window']:
-                timeout = self._opening_timeout
+            timeout = meta.timeout
 
         # FIXME only count sensors if they are on for some time?
 
@@ -601,11 +1105,11 @@ class AlarmControl(BaseApp):
                 self.log(f"[{sensor}] Warning: Sensor temperature ({sensor_state}°C) exceeds the threshold of {self._fire_temperature_threshold}°C.", level="WARNING")
                 return False
             else:
-                self.log(f"[{sensor}] OK: Sensor temperature ({sensor_state}°C) is within the normal range.", level="DEBUG")
+                self.log_debug("[%s] OK: Sensor temperature (%s°C) is within the normal range.", sensor, sensor_state)
                 return True
 
         if sensor_classification == 'motion' and (self.count_cleaning_vacuum_cleaners() > 0 or self.count_returning_vacuum_cleaners() > 0):
-            self.log(f"[{sensor}] OK: Ignoring motion sensor because a vacuum cleaner is cleaning or returning to base.", level="DEBUG")
+            self.log_debug("[%s] OK: Ignoring motion sensor because a vacuum cleaner is cleaning or returning to base.", sensor)
             return True
 
         if sensor_state != desired_state:
@@ -618,19 +1122,19 @@ class AlarmControl(BaseApp):
             if unavailable is not None:
                 start = unavailable.get("start")
                 end = unavailable.get("end")
-                now = datetime.now(timezone.utc)
+                now = self.get_utc_time()
 
                 # If the sensor is currently unavailable and its start time is within the timeout window
                 if end is None and start is not None:
                     seconds_since_unavailable = (now - start).total_seconds()
                     if seconds_since_unavailable < timeout:
-                        self.log(f"[{sensor}] Ignoring sensor because it became unavailable {seconds_since_unavailable:.2f}s ago (within timeout {timeout}s)", level="DEBUG")
+                        self.log_debug("[%s] Ignoring sensor because it became unavailable %.2fs ago (within timeout %ss)", sensor, seconds_since_unavailable, timeout)
                         return True
 
                 # If the sensor was unavailable in the past and the end time is within the timeout window
                 if end is not None and (now - end).total_seconds() < timeout:
                     seconds_since_available = (now - end).total_seconds()
-                    self.log(f"[{sensor}] Ignoring sensor because it was unavailable until {seconds_since_available:.2f}s ago (within timeout {timeout}s)", level="DEBUG")
+                    self.log_debug("[%s] Ignoring sensor because it was unavailable until %.2fs ago (within timeout %ss)", sensor, seconds_since_available, timeout)
                     return True
 
             # Normal timeout handling: if last_update is more recent than timeout, consider it too recent
@@ -638,13 +1142,16 @@ class AlarmControl(BaseApp):
                 self.log(f"[{sensor}] Warning: Sensor is in state '{sensor_state}', but it changed {last_update:.2f} seconds ago, which is within the timeout period.", level="WARNING")
                 return False
 
-        self.log(f"[{sensor}] OK: Sensor is in the desired state ('{sensor_state}').", level="DEBUG")
+        self.log_debug("[%s] OK: Sensor is in the desired state ('%s').", sensor, sensor_state)
 
         return True
 
 
     def get_alerts(self, timeout = None, arming_state = None, alarm_type = None):
-        """Scan configured sensors and return a dict of alerts by alarm category.
+        """Return a dict of alerts by alarm category.
+
+        Served from the live alert set when it is enabled and no timeout
+        override is given; otherwise all relevant sensors are scanned.
 
         Args:
             timeout (float|None): per-sensor timeout override in seconds.
@@ -654,68 +1161,185 @@ class AlarmControl(BaseApp):
         Returns:
             dict: mapping alarm_category -> list of sensor entity_ids that triggered.
         """
-        alerts = {}
-
         if arming_state is None:
             arming_state = self.get_alarm_state()
+        if timeout is None and getattr(self, "_live_alerts", None) is not None:
+            return self.get_live_alerts(arming_state, alarm_type)
+        return self.scan_alerts(timeout, arming_state, alarm_type)
+
+    def get_live_alerts(self, arming_state, alarm_type = None):
+        """Return the live alerts relevant for an arming state, in configuration order."""
+        # the timer may not have fired yet for deadlines that just passed
+        if self.expire_alert_deadlines():
+            self.schedule_alert_timer()
+
+        index = self.get_sensor_index()
+        desired_arming_states = ('always', arming_state)
+        alerts = {}
+        for sensor, alarm_category in self._live_alerts.items():
+            if alarm_type is not None and alarm_category != alarm_type:
+                continue
+            if sensor in index.ignored:
+                continue
+            if not any(state in desired_arming_states for state, _ in index.memberships.get(sensor, ())):
+                continue
+            alerts.setdefault(alarm_category, []).append(sensor)
+        for sensors in alerts.values():
+            sensors.sort(key=index.positions.__getitem__)
+        return alerts
 
-        desired_arming_states = ['always', arming_state]
+    def update_sensor_alert(self, sensor, reschedule = True):
+        """Re-evaluate one sensor in the live alert set and track when it expires.
 
-        self.log(f"Looking for sensors in category {desired_arming_states}", level="DEBUG")
+        A sensor alerts like in `scan_alerts` with the default timeout. When
+        its state can change without an event (a timeout or unavailability
+        window running out) a deadline is queued so the sensor is evaluated
+        again at that time.
 
-        # Iterate over sensors and set up listeners
-        for arming_state, sensor_dict in self._sensors.items():
+        Returns:
+            bool: True if the sensor's entry in the live alert set changed.
+        """
+        meta = self.get_sensor_meta(sensor)
+        alerting = (meta.alarm_category is not None
+                    and self.get_state(sensor) not in [None, "unknown", "unavailable"]
+                    and not self.check_sensor(sensor, 'off'))
+
+        previous = self._live_alerts.get(sensor)
+        if alerting:
+            self._live_alerts[sensor] = meta.alarm_category
+        else:
+            self._live_alerts.pop(sensor, None)
 
-            if arming_state not in desired_arming_states:
-                self.log(f"Ignoring category {arming_state}", level="DEBUG")
-                continue
+        self._alert_deadlines.schedule(sensor, self.get_alert_deadline(sensor, meta.timeout))
+        if reschedule:
+            self.schedule_alert_timer()
+        return previous != self._live_alerts.get(sensor)
 
-            self.log(f"Checking category {arming_state}", level="DEBUG")
-            for group_name, sensor_list in sensor_dict.items():  # Get group name and sensor list
+    def get_alert_deadline(self, sensor, timeout):
+        """Return the epoch time a sensor's timeout-based checks run out, or None."""
+        if timeout is None:
+            return None
+        times = [self.get_last_updated(sensor)]
+        unavailable = self._sensors_unavailable.get(sensor)
+        if unavailable is not None:
+            times.append(unavailable.get("start") if unavailable.get("end") is None else unavailable.get("end"))
+        now = self.get_utc_time().timestamp()
+        deadlines = [t.timestamp() + timeout for t in times if t is not None]
+        deadlines = [deadline for deadline in deadlines if deadline > now]
+        return min(deadlines) if deadlines else None
+
+    def schedule_alert_timer(self):
+        """Point the single alert timer at the earliest queued deadline."""
+        deadline = self._alert_deadlines.next_deadline()
+        if deadline == self._alert_timer_deadline:
+            return
+        if self._alert_timer is not None:
+            self.cancel_timer(self._alert_timer)
+            self._alert_timer = None
+        self._alert_timer_deadline = deadline
+        if deadline is not None:
+            delay = max(0, math.ceil(deadline - self.get_utc_time().timestamp()))
+            self._alert_timer = self.run_in(self.alert_deadline_callback, delay, **self.partition_kwargs())
+
+    @partition_callback
+    def alert_deadline_callback(self, kwargs):
+        """Timer callback re-evaluating sensors whose deadline has passed."""
+        self._alert_timer = None
+        self._alert_timer_deadline = None
+        self.expire_alert_deadlines()
+        self.schedule_alert_timer()
+
+    def expire_alert_deadlines(self):
+        """Re-evaluate sensors whose deadline has passed, returning True if any did."""
+        due = self._alert_deadlines.pop_due(self.get_utc_time().timestamp())
+        for sensor in due:
+            self.update_sensor_alert(sensor, reschedule=False)
+        return bool(due)
+
+    def refresh_live_alerts(self, sensors = None):
+        """Re-evaluate sensors (default: all indexed sensors) in the live alert set.
 
-                self.log(f"Checking group {group_name} in category {arming_state}", level="DEBUG")
-                for sensor in sensor_list:  # Iterate over individual sensors
-                    sensor_type = self.get_state(sensor, attribute = "device_class")
-                    sensor_state = self.get_state(sensor)
-                    self.log(f"[{sensor}] Got {sensor_type} {sensor_state}", level="DEBUG")
+        Returns:
+            list: sensors whose live alert entry changed.
+        """
+        if sensors is None:
+            sensors = list(self.get_sensor_index().memberships)
+            # drop sensors that are no longer configured
+            for sensor in set(self._live_alerts) - set(sensors):
+                del self._live_alerts[sensor]
+        changed = [sensor for sensor in sensors if self.update_sensor_alert(sensor, reschedule=False)]
+        self.schedule_alert_timer()
+        return changed
+
+    def audit_live_alerts(self):
+        """Full rescan of the live alert set, reporting sensors that drifted."""
+        if getattr(self, "_live_alerts", None) is None:
+            return
+        changed = self.refresh_live_alerts()
+        if changed:
+            self.log(f"Live alert set was out of date for {changed}, repaired by audit", level="WARNING")
 
-                    alarm_category = self.classify_alarm(sensor_type)
+    def scan_alerts(self, timeout = None, arming_state = None, alarm_type = None):
+        """Scan configured sensors and return a dict of alerts by alarm category.
 
-                    if alarm_type is not None:
-                        if alarm_category != alarm_type:
-                            self.log(f"[{sensor}] Skipping {sensor_type} sensor because it is not in desired alarm category", level="DEBUG")
-                            continue
+        Args:
+            timeout (float|None): per-sensor timeout override in seconds.
+            arming_state (str|None): specific arming state to evaluate; defaults to current.
+            alarm_type (str|None): filter results to only this alarm category.
 
-                    if sensor in self._sensors_ignored:
-                        self.log(f"[{sensor}] Skipping {sensor_type} sensor because it is in ignore list", level="DEBUG")
-                        continue
+        Returns:
+            dict: mapping alarm_category -> list of sensor entity_ids that triggered.
+        """
+        alerts = {}
 
-                    if alarm_category is None:
-                        self.log(f"[{sensor}] Skipping {sensor_type} sensor because it is not a valid device class", level="DEBUG")
-                        continue
+        if arming_state is None:
+            arming_state = self.get_alarm_state()
+
+        desired_arming_states = ['always', arming_state]
+
+        self.log_debug("Looking for sensors in category %s", desired_arming_states)
+
+        index = self.get_sensor_index()
+        for indexed_state in ('always', arming_state):
+            self.log_debug("Checking category %s", indexed_state)
+            for sensor, sensor_type, alarm_category in index.by_arming_state.get(indexed_state, ()):
+                if sensor_type is None:
+                    # device_class was not known when the index was built
+                    sensor_type, alarm_category = self.get_sensor_class(sensor)
+
+                if alarm_type is not None and alarm_category != alarm_type:
+                    self.log_debug("[%s] Skipping %s sensor because it is not in desired alarm category", sensor, sensor_type)
+                    continue
+
+                if alarm_category is None:
+                    self.log_debug("[%s] Skipping %s sensor because it is not a valid device class", sensor, sensor_type)
+                    continue
 
-                    if sensor_state in [None, "unknown", "unavailable"]:
-                        self.log(f"[{sensor}] Skipping {sensor_type} sensor because the state is invalid ({sensor_state})", level="DEBUG")
-                        continue  # Skip invalid states
+                sensor_state = self.get_state(sensor)
+                self.log_debug("[%s] Got %s %s", sensor, sensor_type, sensor_state)
+                if sensor_state in [None, "unknown", "unavailable"]:
+                    self.log_debug("[%s] Skipping %s sensor because the state is invalid (%s)", sensor, sensor_type, sensor_state)
+                    continue  # Skip invalid states
 
-                    if not self.check_sensor(sensor, 'off', timeout):
-                        if alarm_category not in alerts:
-                            alerts[alarm_category] = []  # Initialize as an empty list
-                        if sensor not in alerts[alarm_category]:
-                            alerts[alarm_category].append(sensor)
+                if not self.check_sensor(sensor, 'off', timeout):
+                    if alarm_category not in alerts:
+                        alerts[alarm_category] = []  # Initialize as an empty list
+                    if sensor not in alerts[alarm_category]:
+                        alerts[alarm_category].append(sensor)
 
         return alerts
 
     def ignore_sensors(self, arming_state):
-        """Add currently alerting sensors for the given arming_state to the ignore list."""
+        """Replace the ignore set with the currently alerting sensors for the given arming_state."""
         alerts = self.get_alerts(0, arming_state)
-        self._sensors_ignored = []
+        ignored = set()
 
         for alarm_type, sensor_list in alerts.items():
             for sensor in sensor_list:
-                if sensor not in self._sensors_ignored:
-                    self.log(f"[{sensor}] adding sensor to ignore list", level="DEBUG")
-                    self._sensors_ignored.append(sensor)
+                if sensor not in ignored:
+                    self.log_debug("[%s] adding sensor to ignore list", sensor)
+                    ignored.add(sensor)
+        self._sensors_ignored = ignored
 
     def count_alerts_by_arming_state(self, arming_state, timeout = None):
         """Return the total number of alerting sensors for a given arming state."""
@@ -723,7 +1347,7 @@ class AlarmControl(BaseApp):
 
         # Count items in each category
         category_counts = {category: len(items) for category, items in alerts.items()}
-        self.log(f"Found these alerts: {alerts}", level="DEBUG")
+        self.log_debug("Found these alerts: %s", alerts)
         total_count = sum(category_counts.values())
 
         return total_count
@@ -762,7 +1386,7 @@ class AlarmControl(BaseApp):
             return False
 
         # Get current time in UTC
-        now = datetime.now(timezone.utc)
+        now = self.get_utc_time()
 
         # Calculate seconds since the last external change
         last_change = self._last_disarm_timestamp
@@ -892,6 +1516,7 @@ class AlarmControl(BaseApp):
             return
 
 
+    @cached_evaluation
     def analyze_and_trigger(self):
         """
         Analyze current sensor alerts and trigger an alarm if thresholds are met.
@@ -901,14 +1526,14 @@ class AlarmControl(BaseApp):
         thresholds are exceeded the corresponding alarm is triggered.
         """
         self.log("Starting analyze_and_trigger")
+        # the oldest sensor change this evaluation answers for
+        self._trace_analyze = (getattr(self, "_trace_origin", None), time.monotonic())
+        self._trace_origin = None
 
         self.log(f"System is in state {self.get_alarm_state()}")
 
-        if self.get_state("binary_sensor.zigbee2mqtt_bridge_connection_state") != 'on':
-            self.log("Doing nothing because zigbee2mqtt_bridge_connection_state is not on")
-            return
-        if self.get_seconds_since_update("binary_sensor.zigbee2mqtt_bridge_connection_state") < 300:
-            self.log("Doing nothing because zigbee2mqtt_bridge_connection_state is not online more than 300 seconds")
+        if not self.is_bridge_stable():
+            self.log(f"Doing nothing because the zigbee bridge is {self.get_bridge_state()}")
             return
 
         self.log(f"There are {self.count_home_device_trackers()} device_trackers home and {self.count_not_home_device_trackers()} device_trackers not home")
@@ -925,13 +1550,20 @@ class AlarmControl(BaseApp):
 
         if self.is_alarm_triggered():
             alerts = self.get_alerts(None, self._arming_state, self._alarm_type)
-            self.log("Updating alarm message")
-            self.set_alarm_message(self.create_alarm_message(alerts))
+            key = self.get_alarm_message_key(alerts)
+            if key != getattr(self, "_alarm_message_key", None):
+                self.log("Updating alarm message")
+                self.set_alarm_message(self.create_alarm_message(alerts))
+                self._alarm_message_key = key
             self.log("Doing nothing because alarm is already triggered")
             return
 
         self.log("Fetching current alerts")
         alerts = self.get_alerts()
+        correlated = self.get_correlated_burglar_sensors()
+        if correlated:
+            burglar = alerts.get('burglar', [])
+            alerts = {**alerts, 'burglar': burglar + [sensor for sensor in correlated if sensor not in burglar]}
 
         if sum(len(v) for v in alerts.values()) == 0:
             self.log("Doing nothing because there are no alerts")
@@ -951,6 +1583,11 @@ class AlarmControl(BaseApp):
             self.trigger_alarm('water', alerts)
             return
 
+        if correlated:
+            self.log(f"Triggering burglar alarm, correlated sensors {correlated}", level="WARNING")
+            self.trigger_alarm('burglar', alerts)
+            return
+
         if self.is_alarm_armed_away() or self.is_alarm_armed_vacation():
             self.log(f"Checking burglar alerts, found {len(alerts.get('burglar', []))}, threshold {self.get_armed_away_sensor_threshold()}")
             if len(alerts.get('burglar', [])) >= self.get_armed_away_sensor_threshold():
@@ -972,9 +1609,10 @@ class AlarmControl(BaseApp):
         """
         Normalize a sensor friendly name for human-readable messages.
 
-        Removes common words (in multiple languages), punctuation and trims
-        whitespace so the resulting short name can be used in spoken/printed
-        alarm messages.
+        Removes common words (`sensor_name_noise`, by default German and
+        English device words), punctuation and trims whitespace so the
+        resulting short name can be used in spoken/printed alarm messages.
+        Results are cached per friendly name, see `normalize_sensor_name`.
 
         Args:
             sensor (str): entity id of the sensor.
@@ -983,17 +1621,26 @@ class AlarmControl(BaseApp):
             str: optimized short sensor name.
         """
         name = self.get_state(sensor, attribute = "friendly_name")
-        name = name.replace("/", " ")
-        name = name.replace("_", " ")
-        name = re.sub(r"(?i)bewegungsmelder", "", name)
-        name = re.sub(r"(?i)fenstersensor", "", name)
-        name = re.sub(r"(?i)türsensor", "", name)
-        name = re.sub(r"(?i)rauchmelder", "", name)
-        name = re.sub(r"(?i)sensor", "", name)
-        name = re.sub(r"(?i)manipulation", "", name)
-        name = re.sub(r"(?i)radar", "", name)
-        name = name.strip()
-        return name
+        pattern = getattr(self, "_sensor_name_pattern", None)
+        if pattern is None:
+            pattern = compile_sensor_name_pattern(SENSOR_NAME_NOISE)
+        return normalize_sensor_name(name, pattern)
+
+    def get_alarm_message_key(self, alerts):
+        """
+        Return a hashable summary of what an alarm message is built from.
+
+        The message of a triggered alarm is only rebuilt (and sent to AWTRIX
+        again) when this key changes.
+
+        Args:
+            alerts (dict): mapping alarm_category -> list of sensors.
+
+        Returns:
+            tuple: alarm type, language and the sorted alerts.
+        """
+        return (self._alarm_type, self._language,
+                tuple(sorted((alarm_type, tuple(sensors)) for alarm_type, sensors in alerts.items())))
 
     def create_alarm_message(self, alerts):
         """
@@ -1011,18 +1658,18 @@ class AlarmControl(BaseApp):
         self.log(f"Creating alarm message based on these alerts: {alerts}")
 
         for alarm_type, sensor_list in alerts.items():
-            self.log(f"Alarm Type: {alarm_type}", level="DEBUG")
+            self.log_debug("Alarm Type: %s", alarm_type)
 
             if alarm_type != self._alarm_type:
-                self.log(f"Skipping alerts of type {alarm_type} because it does not match the current alarm type {self._alarm_type}", level="DEBUG")
+                self.log_debug("Skipping alerts of type %s because it does not match the current alarm type %s", alarm_type, self._alarm_type)
                 continue
 
             translation_key = alarm_type + '_alert'
             messages.append(self.translate(translation_key))
             for sensor in sensor_list:
-                name = self.optimize_sensor_name(sensor)
-                sensor_type = self.get_state(sensor, attribute = "device_class")
-                sensor_category = self.classify_sensor(sensor_type)
+                meta = self.get_sensor_meta(sensor)
+                name = meta.name if meta.name is not None else self.optimize_sensor_name(sensor)
+                sensor_category = meta.sensor_category
                 if sensors_by_category.get(sensor_category) is None:
                     sensors_by_category[sensor_category] = []
                 if name not in sensors_by_category[sensor_category]:
@@ -1093,9 +1740,14 @@ class AlarmControl(BaseApp):
 
         self.set_alarm_type(alarm_type)
         self.set_alarm_message(self.create_alarm_message(alerts))
+        self._alarm_message_key = self.get_alarm_message_key(alerts)
+        self.record_journal("trigger", data={"alarm_type": alarm_type, "alerts": alerts})
+        self.record_journal_state()
         #self.notify(message)
         #self.add_alarm_message(message)
+        self.start_trigger_trace(alarm_type)
         self.call_alarm_control_panel("alarm_trigger")
+        self.mark_trigger_stage("trigger")
 
     def periodic_time_callback(self, kwargs):
         """
@@ -1104,11 +1756,24 @@ class AlarmControl(BaseApp):
         This is typically scheduled via run_daily/run_every to re-evaluate
         auto-arming and to check for newly triggered sensors.
         """
+        if self.dispatch_to_partitions(self.periodic_time_callback, kwargs):
+            return
         self.log(f"{inspect.currentframe().f_code.co_name}")
 
+        self.audit_live_alerts()
+        self.release_quarantined_sensors()
         self.setup()
         self.analyze_and_trigger()
 
+    def vacuum_change_callback(self, entity, attribute, old, new, kwargs):
+        """Re-evaluate motion sensors, which are ignored while a vacuum cleaner runs."""
+        if self.dispatch_to_partitions(self.vacuum_change_callback, entity, attribute, old, new, kwargs):
+            return
+        self.log_debug("[%s] vacuum cleaner changed from %s to %s", entity, old, new)
+        motion_sensors = [sensor for sensor in self.get_sensor_index().memberships
+                          if self.get_sensor_meta(sensor).sensor_category == 'motion']
+        self.refresh_live_alerts(motion_sensors)
+
     def presence_change_callback(self, entity, attribute, old, new, kwargs):
         """
         Callback for presence (device_tracker) changes.
@@ -1116,6 +1781,8 @@ class AlarmControl(BaseApp):
         If someone returns home the alarm may be automatically disarmed. In
         all cases this triggers a re-evaluation via `setup()`.
         """
+        if self.dispatch_to_partitions(self.presence_change_callback, entity, attribute, old, new, kwargs):
+            return
         self.log(f"{inspect.currentframe().f_code.co_name} from {entity}:{attribute} {old}->{new}")
 
         if entity in self._device_trackers and new == 'home':
@@ -1126,6 +1793,75 @@ class AlarmControl(BaseApp):
 
         self.setup()
 
+    def presence_event_callback(self, entity, attribute, old, new, kwargs):
+        """
+        Single listener per device tracker.
+
+        Replays the former duration listeners through `schedule_recheck`:
+        leaving home is re-checked after 5 minutes, arriving home immediately
+        (or after the tracker's stagger delay) and again after 5 minutes.
+        Another state change cancels the pending re-checks.
+        """
+        self.record_journal("presence", entity, old, new)
+        delay = self._presence_delays.get(entity, 0)
+        for key in ((entity, "left"), (entity, "arrived"), (entity, "stayed")):
+            self.cancel_recheck(key)
+
+        if old == "home":
+            self.schedule_recheck((entity, "left"), 5 * 60 + delay, self.presence_recheck, entity, old, new)
+        if new == "home":
+            if delay:
+                self.schedule_recheck((entity, "arrived"), delay, self.presence_recheck, entity, old, new)
+            else:
+                self.presence_change_callback(entity, "state", old, new, {})
+            self.schedule_recheck((entity, "stayed"), 5 * 60 + delay, self.presence_recheck, entity, old, new)
+
+    def presence_recheck(self, entity, old, new):
+        """Run the presence callback for a tracker still in the state it changed to."""
+        self.presence_change_callback(entity, "state", old, new, {})
+
+    def sensor_event_callback(self, entity, attribute, old, new, kwargs):
+        """
+        Single listener per alarm sensor, registered with attribute="all".
+
+        State changes run `sensor_change_callback` right away and again after
+        `_armed_away_sensor_delay` seconds if the state still holds.
+        Attribute-only updates refresh the sensor metadata when needed and
+        the live alert entry, since they move last_updated too.
+        """
+        old = old or {}
+        new = new or {}
+        old_attributes = old.get("attributes", {})
+        new_attributes = new.get("attributes", {})
+        if any(old_attributes.get(key) != new_attributes.get(key) for key in ("device_class", "friendly_name")):
+            self.invalidate_sensor_meta(entity)
+
+        old_state = old.get("state")
+        new_state = new.get("state")
+        if old_state == new_state:
+            for partition in self.get_sensor_partitions(entity):
+                with self.partition_scope(partition):
+                    if getattr(self, "_live_alerts", None) is not None and entity in self.get_sensor_index().memberships:
+                        self.update_sensor_alert(entity)
+            return
+
+        self.record_journal("sensor", entity, old_state, new_state,
+                            {key: new_attributes.get(key) for key in ("device_class", "friendly_name")})
+        for partition in self.get_sensor_partitions(entity):
+            key = (entity, "delayed") if partition is None else (entity, "delayed", partition)
+            with self.partition_scope(partition):
+                self.sensor_change_callback(entity, "state", old_state, new_state, kwargs)
+                if self._armed_away_sensor_delay:
+                    self.schedule_recheck(key, self._armed_away_sensor_delay,
+                                          self.sensor_recheck, entity, old_state, new_state, partition)
+                else:
+                    self.cancel_recheck(key)
+
+    def sensor_recheck(self, entity, old, new, partition=None):
+        """Run the delayed sensor check for a sensor still in the state it changed to."""
+        with self.partition_scope(partition):
+            self.sensor_change_callback(entity, "state", old, new, {})
+
     def sensor_change_callback(self, entity, attribute, old, new, kwargs):
         """
         Generic sensor state change callback.
@@ -1135,26 +1871,285 @@ class AlarmControl(BaseApp):
         """
         self.log(f"{inspect.currentframe().f_code.co_name} from {entity}:{attribute} {old}->{new}")
 
-        now = datetime.now(timezone.utc)
+        now = self.get_utc_time()
 
-        # Sensor became unavailable: record start time
+        # Sensor became unavailable: start a period (once, partitions share the log)
         if new == 'unavailable' and old != 'unavailable':
-            self.log(f"[{entity}] sensor became unavailable at {now.isoformat()}", level="DEBUG")
-            self._sensors_unavailable[entity] = {"start": now, "end": None}
+            self.log_debug("[%s] sensor became unavailable at %s", entity, now.isoformat())
+            if self._sensors_unavailable.start(entity, now.timestamp()):
+                self.check_sensor_quarantine(entity, now.timestamp())
             if entity not in self._sensors_ignored:
-                self.log(f"[{entity}] adding sensor to ignore list because it became unavailable", level="DEBUG")
-                self._sensors_ignored.append(entity)
+                self.log_debug("[%s] adding sensor to ignore list because it became unavailable", entity)
+                # replaced rather than changed in place, so the sensor index notices
+                self._sensors_ignored = set(self._sensors_ignored) | {entity}
 
         # Sensor became available again: record end time
         elif old == 'unavailable' and new != 'unavailable':
-            self.log(f"[{entity}] sensor became available at {now.isoformat()}", level="DEBUG")
-            if entity in self._sensors_unavailable:
-                # set end timestamp for the unavailable period
-                self._sensors_unavailable[entity]["end"] = now
+            self.log_debug("[%s] sensor became available at %s", entity, now.isoformat())
+            self._sensors_unavailable.end(entity, now.timestamp())
+
+        if 'unavailable' in (old, new) and old != new:
+            self.record_journal_state()
+
+        if getattr(self, "_live_alerts", None) is not None and entity in self.get_sensor_index().memberships:
+            self.update_sensor_alert(entity)
+
+        if getattr(self, "_burglar_correlator", None) is not None and old != new:
+            self.record_burglar_event(entity, new)
 
         if self.is_sensor_monitored(entity):
-            self.analyze_and_trigger()
+            if getattr(self, "_trace_origin", None) is None:
+                self._trace_origin = (entity, time.monotonic())
+            # fire and water sensors are never delayed by trigger coalescing
+            immediate = self.get_sensor_meta(entity).alarm_category in ('fire', 'water')
+            self.request_evaluation(self.get_partition_evaluation(), immediate=immediate)
+
+    def check_sensor_quarantine(self, sensor, now):
+        """Quarantine a sensor that became unavailable too often within the quarantine window."""
+        if not self._unavailable_quarantine_count or sensor in self._sensors_quarantined:
+            return
+        count = self._sensors_unavailable.count_since(sensor, now - self._unavailable_quarantine_window)
+        if count >= self._unavailable_quarantine_count:
+            self.log(f"[{sensor}] became unavailable {count} times within {self._unavailable_quarantine_window}s, "
+                     "ignoring it until it is stable", level="WARNING")
+            self._sensors_quarantined = self._sensors_quarantined | {sensor}
+
+    def release_quarantined_sensors(self):
+        """Release quarantined sensors that are available and below the flap threshold again."""
+        if not getattr(self, "_sensors_quarantined", None):
+            return
+        now = self.get_utc_time().timestamp()
+        since = now - self._unavailable_quarantine_window
+        released = {sensor for sensor in self._sensors_quarantined
+                    if self._sensors_unavailable.count_since(sensor, since) < self._unavailable_quarantine_count
+                    and not self._sensors_unavailable.is_unavailable(sensor)}
+        if released:
+            self.log(f"Releasing quarantined sensors {sorted(released)}")
+            self._sensors_quarantined = self._sensors_quarantined - released
+
+    def get_unavailable_stats(self, window = None):
+        """
+        Return how often each sensor became unavailable within `window` seconds.
+
+        Args:
+            window (float|None): defaults to `unavailable_quarantine_window`.
+
+        Returns:
+            dict: sensor -> number of unavailable periods started in the window.
+        """
+        if window is None:
+            window = self._unavailable_quarantine_window
+        since = self.get_utc_time().timestamp() - window
+        return {sensor: self._sensors_unavailable.count_since(sensor, since) for sensor in self._sensors_unavailable}
+
+    def record_journal(self, kind, entity=None, old=None, new=None, data=None):
+        """
+        Append an event to the journal, if one is configured.
+
+        Writing happens on the journal's background thread, so this only
+        queues the record.
+
+        Args:
+            kind (str): 'sensor', 'presence', 'arming', 'trigger', 'notification' or 'state'.
+            entity (str|None): entity id the event is about.
+            old, new: previous and new state for transitions.
+            data (dict|None): extra details.
+        """
+        journal = getattr(self, "_journal", None)
+        if journal is not None:
+            journal.record(self.get_utc_time().timestamp(), kind, entity, old, new, data)
+
+    def record_journal_state(self):
+        """Journal the in-memory state that `restore_from_journal` brings back."""
+        if getattr(self, "_journal", None) is None:
+            return
+        last_disarm = self._last_disarm_timestamp.isoformat() if self._last_disarm_timestamp is not None else None
+        data = {
+            "ignored": sorted(self._sensors_ignored),
+            "unavailable": self._sensors_unavailable.to_dict(),
+            "quarantined": sorted(getattr(self, "_sensors_quarantined", ())),
+            "last_disarm": last_disarm,
+            "alarm_type": self._alarm_type,
+            "message": self._alarm_message,
+        }
+        data.update(self.partition_kwargs())
+        self.record_journal("state", data=data)
+
+    def restore_from_journal(self, path):
+        """
+        Restore the ignore set, unavailable periods, quarantined sensors, last
+        disarm time and alarm message from the newest 'state' record of a journal.
+        Records of other partitions than the main one are not restored.
+
+        Args:
+            path (str): journal path as configured in `journal_path`.
+        """
+        state = None
+        for record in read_journal(path):
+            if record.get("kind") == "state" and "partition" not in (record.get("data") or {}):
+                state = record.get("data")
+        if not state:
+            return
+
+        def parse(value):
+            return datetime.fromisoformat(value) if value else None
+
+        self._sensors_ignored = set(state.get("ignored", []))
+        capacity = getattr(self._sensors_unavailable, "capacity", UnavailabilityLog.DEFAULT_CAPACITY)
+        self._sensors_unavailable = UnavailabilityLog.from_dict(state.get("unavailable", {}), capacity)
+        self._sensors_quarantined = frozenset(state.get("quarantined", []))
+        self._last_disarm_timestamp = parse(state.get("last_disarm"))
+        self._alarm_type = state.get("alarm_type")
+        self._alarm_message = state.get("message")
+        self.log(f"Restored state from journal {path}: {len(self._sensors_ignored)} ignored, "
+                 f"{len(self._sensors_unavailable)} unavailable sensors")
+
+    def notify(self, message, title=None, prio=0):
+        """Journal the notification, then send it like `BaseApp.notify`."""
+        self.record_journal("notification", data={"message": message, "title": title, "prio": prio})
+        super().notify(message, title, prio)
+        self.mark_trigger_stage("notify")
+
+    def start_trigger_trace(self, alarm_type):
+        """
+        Begin tracing an alarm trigger.
+
+        The trace starts at the oldest sensor change that the current
+        `analyze_and_trigger` run answers for, or now for triggers without
+        one (e.g. buttons). Later stages are added by `mark_trigger_stage`
+        and the trace is closed by `finish_trigger_trace` once the panel
+        reports 'triggered' and the notification went out. All times are
+        `time.monotonic()` seconds.
+
+        Args:
+            alarm_type (str): alarm category being triggered.
+        """
+        if getattr(self, "_trigger_latency", None) is None:
+            return
+        now = time.monotonic()
+        origin, analyzed = getattr(self, "_trace_analyze", None) or (None, None)
+        self._trace_analyze = None
+        stages = []
+        if origin is not None:
+            stages.append(("sensor", origin[1]))
+            stages.append(("analyze", analyzed))
+        else:
+            stages.append(("sensor", now))
+        self._trigger_trace = {"sensor": origin[0] if origin else None, "alarm_type": alarm_type, "stages": stages}
+
+    def mark_trigger_stage(self, stage):
+        """Record that the active trigger trace reached `stage`; stages only move forward."""
+        trace = getattr(self, "_trigger_trace", None)
+        if trace is None:
+            return
+        last = trace["stages"][-1][0]
+        if last != "sensor" and TRIGGER_STAGES.index(stage) <= TRIGGER_STAGES.index(last):
+            return
+        trace["stages"].append((stage, time.monotonic()))
+
+    def finish_trigger_trace(self):
+        """
+        Close the active trigger trace.
+
+        Stage latencies (time since the previous stage) and the total go into
+        the per-stage histograms. A total above `trigger_latency_slo` is
+        logged as a warning and journaled. A configured
+        `trigger_latency_sensor` is updated either way.
+        """
+        trace = getattr(self, "_trigger_trace", None)
+        if trace is None:
+            return
+        self._trigger_trace = None
+        stages = trace["stages"]
+        breakdown = {}
+        for (_, previous), (stage, at) in zip(stages, stages[1:]):
+            breakdown[stage] = at - previous
+            self._trigger_latency[stage].observe(at - previous)
+        total = stages[-1][1] - stages[0][1]
+        self._trigger_latency["total"].observe(total)
+
+        summary = ", ".join(f"{stage} {seconds * 1000:.1f} ms" for stage, seconds in breakdown.items())
+        if total > self._trigger_latency_slo:
+            self._trigger_slo_violations += 1
+            self.log(f"Alarm trigger from {trace['sensor']} took {total * 1000:.0f} ms, above the SLO of "
+                     f"{self._trigger_latency_slo * 1000:.0f} ms ({summary})", level="WARNING")
+            self.record_journal("latency", trace["sensor"], data={
+                "alarm_type": trace["alarm_type"], "total": total, "stages": breakdown, "slo": self._trigger_latency_slo})
+        else:
+            self.log(f"Alarm trigger from {trace['sensor']} took {total * 1000:.0f} ms ({summary})")
+
+        if self._trigger_latency_sensor:
+            self.set_state(self._trigger_latency_sensor, state=round(total * 1000, 1),
+                           attributes={"unit_of_measurement": "ms", "slo_ms": self._trigger_latency_slo * 1000,
+                                       "slo_violations": self._trigger_slo_violations,
+                                       "last_stages_ms": {stage: round(seconds * 1000, 1) for stage, seconds in breakdown.items()},
+                                       "stages": self.get_trigger_latency_stats()})
+
+    def get_trigger_latency_stats(self):
+        """
+        Return per-stage trigger latency statistics.
+
+        Returns:
+            dict: stage -> count, avg_ms, p50_ms and p99_ms, for the stages in
+            `TRIGGER_STAGES` plus 'total'. Percentiles are bucket upper bounds.
+        """
+        stats = {}
+        for stage, histogram in getattr(self, "_trigger_latency", {}).items():
+            stats[stage] = {
+                "count": histogram.count,
+                "avg_ms": histogram.sum / histogram.count * 1000 if histogram.count else 0.0,
+                "p50_ms": histogram.quantile(0.5) * 1000,
+                "p99_ms": histogram.quantile(0.99) * 1000,
+            }
+        return stats
+
+    def record_burglar_event(self, sensor, state):
+        """
+        Add a burglar sensor activation to the correlation window.
+
+        Only sensors that switched to an active state and are monitored
+        (not ignored) for the current arming state are recorded; motion is
+        skipped while a vacuum cleaner runs, like in `check_sensor`.
+
+        Args:
+            sensor (str): entity id of the sensor.
+            state (str): its new state.
+        """
+        if state in ('off', None, 'unknown', 'unavailable'):
+            return
+        meta = self.get_sensor_meta(sensor)
+        if meta.alarm_category != 'burglar' or not self.is_sensor_monitored(sensor):
+            return
+        if meta.sensor_category == 'motion' and (self.count_cleaning_vacuum_cleaners() > 0 or self.count_returning_vacuum_cleaners() > 0):
+            return
+        zone = self._sensor_zones.get(sensor, sensor)
+        self.log_debug("[%s] recording burglar event in zone %s", sensor, zone)
+        self._burglar_correlator.add(self.get_utc_time().timestamp(), sensor, zone)
 
+    def get_correlated_burglar_sensors(self):
+        """
+        Return the sensors of the correlation window if it exceeds a threshold.
+
+        Returns:
+            list: distinct sensors seen within `burglar_window` seconds when at
+            least `burglar_window_sensors` sensors or `burglar_window_zones`
+            zones are involved, otherwise an empty list.
+        """
+        correlator = getattr(self, "_burglar_correlator", None)
+        if correlator is None:
+            return []
+        if not (self.is_alarm_armed_away() or self.is_alarm_armed_vacation()
+                or self.is_alarm_armed_home() or self.is_alarm_armed_night()):
+            return []
+        now = self.get_utc_time().timestamp()
+        sensors = correlator.distinct_sensors(now)
+        zones = correlator.distinct_zones(now)
+        self.log_debug("Burglar window holds %s sensors in %s zones", sensors, zones)
+        if (0 < self._burglar_window_sensors <= sensors) or (0 < self._burglar_window_zones <= zones):
+            return correlator.get_sensors()
+        return []
+
+    @partition_callback
     def control_change_callback(self, entity, attribute, old, new, kwargs):
         """
         Handler for changes to the alarm control panel entity.
@@ -1164,11 +2159,13 @@ class AlarmControl(BaseApp):
         alarm system state.
         """
         self.log(f"{inspect.currentframe().f_code.co_name} from {entity}:{attribute} {old}->{new}")
+        self.record_journal("arming", entity, old, new)
 
         message = self.translate("alarm_system_" + self.get_alarm_state())
         message_prio = 1
 
         if self.is_alarm_triggered():
+            self.mark_trigger_stage("panel")
             self.start_flash_warning('red')
             self.start_media_warning()
             if self.get_alarm_type() == 'burglar':
@@ -1186,6 +2183,10 @@ class AlarmControl(BaseApp):
             if not self.is_time_in_night_window():
                 self.start_flash_warning('yellow', 50)
 
+        if getattr(self, "_burglar_correlator", None) is not None and (self.is_alarm_armed() or self.is_alarm_disarmed()):
+            # every arming session starts with an empty window
+            self._burglar_correlator.clear()
+
         if self.is_alarm_armed():
             self.reset_alarm_message()
             self._arming_state = self.get_alarm_state()
@@ -1195,8 +2196,8 @@ class AlarmControl(BaseApp):
 
         if self.is_alarm_disarmed():
             self.reset_alarm_message()
-            self._last_disarm_timestamp = datetime.now(timezone.utc)
-            self._sensors_ignored = []
+            self._last_disarm_timestamp = self.get_utc_time()
+            self._sensors_ignored = set()
             self.set_alarm_light_color('green', 10)
 
         if self.is_alarm_disarmed() or self.is_alarm_armed():
@@ -1206,8 +2207,11 @@ class AlarmControl(BaseApp):
             self.stop_flash_warning()
             self.set_alarm_type(None)
 
+        self.record_journal_state()
         self.notify(message, prio=message_prio)
         self.notify_awtrix(message, "hass_alarm_system_state", 60, 60 * 60 * 1)
+        if self.is_alarm_triggered():
+            self.finish_trigger_trace()
 
     # Threshold getter functions for dynamic adjustment
     def get_fire_sensor_threshold(self):
@@ -1250,3 +2254,252 @@ class AlarmControl(BaseApp):
         if self.count_returning_vacuum_cleaners() > 0 or self.count_cleaning_vacuum_cleaners() > 0:
             return 1
         return self._armed_away_sensor_threshold
+
+
+class SensorMeta:
+    """Cached classification of an alarm sensor, see `AlarmControl.get_sensor_meta`."""
+
+    __slots__ = ("device_class", "sensor_category", "alarm_category", "name", "timeout")
+
+    def __init__(self, device_class, sensor_category, alarm_category, name, timeout):
+        self.device_class = device_class
+        self.sensor_category = sensor_category
+        self.alarm_category = alarm_category
+        self.name = name
+        self.timeout = timeout
+
+
+class SensorIndex:
+    """Reverse index over `AlarmControl._sensors`.
+
+    - `memberships`: sensor -> frozenset of (arming_state, group)
+    - `positions`: sensor -> position of its first occurrence in the config
+    - `by_arming_state`: arming_state -> tuple of (sensor, device_class,
+      alarm_category) in configuration order, without duplicates and
+      without ignored or quarantined sensors
+    """
+
+    def __init__(self, sensors, ignored, get_sensor_class, quarantined=frozenset()):
+        self.sensors = sensors
+        self.ignored_list = ignored
+        self.ignored_len = len(ignored)
+        self.quarantined = quarantined
+        self.ignored = frozenset(ignored) | quarantined
+
+        memberships = {}
+        self.positions = {}
+        self.by_arming_state = {}
+        for arming_state, groups in sensors.items():
+            entries = []
+            seen = set()
+            for group, sensor_list in groups.items():
+                for sensor in sensor_list:
+                    memberships.setdefault(sensor, set()).add((arming_state, group))
+                    self.positions.setdefault(sensor, len(self.positions))
+                    if sensor in seen or sensor in self.ignored:
+                        continue
+                    seen.add(sensor)
+                    entries.append((sensor, *get_sensor_class(sensor)))
+            self.by_arming_state[arming_state] = tuple(entries)
+        self.memberships = {sensor: frozenset(groups) for sensor, groups in memberships.items()}
+
+    def is_current(self, sensors, ignored, quarantined=frozenset()):
+        """Return True if the index was built from these config, ignore and quarantine sets."""
+        return (sensors is self.sensors and ignored is self.ignored_list and len(ignored) == self.ignored_len
+                and quarantined is self.quarantined)
+
+
+class BurglarCorrelator:
+    """Sliding time window over burglar sensor activations.
+
+    Events are (timestamp, sensor, zone) tuples in a bounded deque. Counters
+    per sensor and zone are kept in step with it, so the number of distinct
+    sensors or zones within the window is known without a rescan. Every
+    event is appended and evicted once, which keeps updates O(1) amortized.
+    """
+
+    def __init__(self, window, maxlen=256):
+        self.window = window
+        self.maxlen = maxlen
+        self.events = deque()
+        self.sensors = {}
+        self.zones = {}
+
+    def add(self, timestamp, sensor, zone):
+        """Record an activation; the oldest event is dropped when full."""
+        self.expire(timestamp)
+        if len(self.events) >= self.maxlen:
+            self._evict()
+        self.events.append((timestamp, sensor, zone))
+        self.sensors[sensor] = self.sensors.get(sensor, 0) + 1
+        self.zones[zone] = self.zones.get(zone, 0) + 1
+
+    def expire(self, now):
+        """Drop events older than the window."""
+        cutoff = now - self.window
+        while self.events and self.events[0][0] < cutoff:
+            self._evict()
+
+    def _evict(self):
+        _, sensor, zone = self.events.popleft()
+        for counts, key in ((self.sensors, sensor), (self.zones, zone)):
+            if counts[key] == 1:
+                del counts[key]
+            else:
+                counts[key] -= 1
+
+    def distinct_sensors(self, now):
+        """Number of distinct sensors active within the window."""
+        self.expire(now)
+        return len(self.sensors)
+
+    def distinct_zones(self, now):
+        """Number of distinct zones active within the window."""
+        self.expire(now)
+        return len(self.zones)
+
+    def get_sensors(self):
+        """Distinct sensors currently in the window."""
+        return list(self.sensors)
+
+    def clear(self):
+        self.events.clear()
+        self.sensors.clear()
+        self.zones.clear()
+
+
+class UnavailabilityLog:
+    """Last unavailable periods per sensor in fixed-size ring buffers.
+
+    Each sensor has one `array('d')` of 2 * `capacity` epoch seconds holding
+    (start, end) pairs, where an open period has end NaN. Older periods are
+    overwritten, so memory per sensor is constant however long the app runs.
+
+    `get(sensor)` returns the latest period as {"start": datetime, "end":
+    datetime|None}, which is also the shape of a plain dict used in its place.
+    """
+
+    DEFAULT_CAPACITY = 16
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = max(1, capacity)
+        self._rings = {}
+        self._written = {}
+
+    def __contains__(self, sensor):
+        return sensor in self._rings
+
+    def __iter__(self):
+        return iter(self._rings)
+
+    def __len__(self):
+        return len(self._rings)
+
+    def start(self, sensor, timestamp):
+        """Open a period; returns False if the sensor is already unavailable."""
+        if self.is_unavailable(sensor):
+            return False
+        ring = self._rings.get(sensor)
+        if ring is None:
+            ring = self._rings[sensor] = array('d', [math.nan]) * (2 * self.capacity)
+        written = self._written.get(sensor, 0)
+        slot = (written % self.capacity) * 2
+        ring[slot] = timestamp
+        ring[slot + 1] = math.nan
+        self._written[sensor] = written + 1
+        return True
+
+    def end(self, sensor, timestamp):
+        """Close the open period of a sensor; returns False if there is none."""
+        if not self.is_unavailable(sensor):
+            return False
+        slot = ((self._written[sensor] - 1) % self.capacity) * 2
+        self._rings[sensor][slot + 1] = timestamp
+        return True
+
+    def is_unavailable(self, sensor):
+        """True when the latest period of the sensor is still open."""
+        written = self._written.get(sensor)
+        if not written:
+            return False
+        return math.isnan(self._rings[sensor][((written - 1) % self.capacity) * 2 + 1])
+
+    def periods(self, sensor):
+        """Return the kept (start, end|None) periods of a sensor, oldest first."""
+        written = self._written.get(sensor, 0)
+        ring = self._rings.get(sensor)
+        result = []
+        for n in range(max(0, written - self.capacity), written):
+            slot = (n % self.capacity) * 2
+            end = ring[slot + 1]
+            result.append((ring[slot], None if math.isnan(end) else end))
+        return result
+
+    def count_since(self, sensor, since):
+        """Number of kept periods of a sensor that started at or after `since`."""
+        written = self._written.get(sensor, 0)
+        ring = self._rings.get(sensor)
+        count = 0
+        for n in range(written - 1, max(0, written - self.capacity) - 1, -1):
+            if ring[(n % self.capacity) * 2] < since:
+                break
+            count += 1
+        return count
+
+    def get(self, sensor, default=None):
+        """Return the latest period of a sensor as datetimes, or `default`."""
+        written = self._written.get(sensor)
+        if not written:
+            return default
+        slot = ((written - 1) % self.capacity) * 2
+        start, end = self._rings[sensor][slot], self._rings[sensor][slot + 1]
+        return {"start": datetime.fromtimestamp(start, timezone.utc),
+                "end": None if math.isnan(end) else datetime.fromtimestamp(end, timezone.utc)}
+
+    def items(self):
+        """Yield (sensor, latest period) pairs like `dict.items()`."""
+        for sensor in self._rings:
+            yield sensor, self.get(sensor)
+
+    def to_dict(self):
+        """Return sensor -> list of [start, end|None] epoch seconds, oldest first."""
+        return {sensor: [list(period) for period in self.periods(sensor)] for sensor in self._rings}
+
+    @classmethod
+    def from_dict(cls, data, capacity=DEFAULT_CAPACITY):
+        """Inverse of `to_dict`; also reads the former {"start": iso, "end": iso} form."""
+        log = cls(capacity)
+        for sensor, periods in data.items():
+            if isinstance(periods, dict):
+                periods = [[datetime.fromisoformat(periods[key]).timestamp() if periods.get(key) else None
+                            for key in ("start", "end")]]
+            for start, end in periods:
+                if start is None:
+                    continue
+                log.start(sensor, start)
+                if end is not None:
+                    log.end(sensor, end)
+        return log
+
+
+@functools.lru_cache(maxsize=None)
+def compile_sensor_name_pattern(words):
+    """Compile one case-insensitive alternation of `words`, longest first."""
+    ordered = sorted(set(words), key=len, reverse=True)
+    return re.compile("|".join(re.escape(word) for word in ordered), re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=1024)
+def normalize_sensor_name(name, pattern):
+    """
+    Shorten a friendly name for alarm messages.
+
+    Args:
+        name (str): friendly name of the sensor.
+        pattern (re.Pattern): words to remove, from `compile_sensor_name_pattern`.
+
+    Returns:
+        str: name without slashes, underscores and the matched words.
+    """
+    name = name.replace("/", " ").replace("_", " ")
+    return pattern.sub("", name).strip()
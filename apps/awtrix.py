@@ -116,7 +116,7 @@ class AwtrixControl(BaseApp):
             kwargs (dict): additional AppDaemon kwargs.
         """
         self.log(f"{inspect.currentframe().f_code.co_name} from {entity}:{attribute} {old}->{new}")
-        self.setup()
+        self.request_evaluation(self.setup)
 
     def send_mqtt(self, prefix, payload):
         """Publish a JSON payload to each configured AWTRIX MQTT prefix.
@@ -10,18 +10,51 @@ Common args provided by `BaseApp` (all optional unless noted):
 - night_start, night_end, night_start_workday, night_end_workday
 - notify_service, awtrix_prefixes, tts_devices
 - external_change_timeout, internal_change_timeout
+- incremental_counters, state_counter_reconcile_interval
+- async_notifications, notify_queue_size, notify_concurrency, notify_retries, notify_retry_backoff
+- coalesce_window, coalesce_max_latency
+- state_snapshot, state_snapshot_min_entities, state_snapshot_ratio
+- callback_sample_rate, callback_stats_sensor, callback_stats_file, callback_stats_interval
 
 See module docstrings and inline examples for canonical usage and common options used across apps.
 """
 
 import appdaemon.plugins.hass.hassapi as hass
 from datetime import datetime, timezone, timedelta, date
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+import bisect
+import functools
+import heapq
+import itertools
 import json
+import math
 import inspect
+import logging
+import os
+import queue
+import threading
+import time
 
 
+def cached_evaluation(method):
+    """Decorator that runs an app method inside `BaseApp.evaluation_scope()`.
+
+    Use it on the top-level decision methods (e.g. `update_climate`) so every
+    `get_state` read made during one pass is fetched from AppDaemon only once.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.evaluation_scope():
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class BaseApp(hass.Hass):
+    COUNTED_ENTITY_LISTS = ("_opening_sensors", "_motion_sensors", "_device_trackers",
+                            "_awake_sensors", "_lights", "_vacuum_cleaners")
+    SNAPSHOT_ENTITY_LISTS = COUNTED_ENTITY_LISTS + ("_illumination_sensors", "_media_players")
+
     def initialize(self):
         """Initialize BaseApp defaults and log configuration.
 
@@ -30,8 +63,12 @@ class BaseApp(hass.Hass):
         instance attributes, and writes a short configuration summary to the
         AppDaemon log.
         """
+        self.refresh_log_level()
         self.log(f"Initializing {self.__class__.__name__}")
 
+        # callback instrumentation, set up first so every listener is wrapped
+        self.setup_callback_instrumentation()
+
         # setup sane defaults
         self._opening_sensors = self.args.get("opening_sensors", [])
         self._motion_sensors = self.args.get("motion_sensors", [])
@@ -78,6 +115,12 @@ class BaseApp(hass.Hass):
         self._workday_tomorrow_sensor = self.args.get("workday_tomorrow_sensor", None)
         self._holiday_sensor = self.args.get("holiday_sensor", None)
 
+        # night windows are resolved once per day (see NightSchedule)
+        self._night_schedule = NightSchedule(self)
+        for sensor in (self._workday_sensor, self._workday_tomorrow_sensor, self._holiday_sensor):
+            if sensor is not None:
+                self.listen_state(self.night_schedule_callback, sensor)
+
         self._external_change_timeout = int(self.args.get("external_change_timeout", 3600*2))
         self._internal_change_timeout = int(self.args.get("internal_change_timeout", 10))
         self._internal_change_timestamp = None
@@ -85,6 +128,49 @@ class BaseApp(hass.Hass):
         self._internal_change_count = 0
         self._external_change_count = 0
 
+        # per-evaluation state cache (see evaluation_scope)
+        self._state_cache = None
+        self._state_snapshot = None
+        self._state_snapshot_mode = self.args.get("state_snapshot", "auto")
+        self._state_snapshot_min_entities = int(self.args.get("state_snapshot_min_entities", 50))
+        self._state_snapshot_ratio = float(self.args.get("state_snapshot_ratio", 0.3))
+        self._use_state_snapshot = None
+        self._state_cache_hits = 0
+        self._state_cache_misses = 0
+        self._evaluation_count = 0
+
+        # parsed last_updated timestamps (see get_last_updated)
+        self._last_updated_cache = {}
+
+        # event-maintained counters (see setup_state_counters)
+        self._state_counters = {}
+        if self.args.get("incremental_counters", False):
+            self.setup_state_counters()
+
+        # coalescing of evaluation triggers (see request_evaluation)
+        self._coalesce_window = float(self.args.get("coalesce_window", 0))
+        self._coalesce_max_latency = float(self.args.get("coalesce_max_latency", 1))
+        self._pending_evaluations = {}
+        self._evaluations_requested = 0
+        self._evaluations_run = 0
+
+        # delayed re-checks replacing listen_state(duration=...) (see schedule_recheck)
+        self._rechecks = DeadlineHeap()
+        self._recheck_calls = {}
+        self._recheck_timer = None
+        self._recheck_timer_deadline = None
+
+        # optional background notification dispatch (see NotificationDispatcher)
+        self._notification_dispatcher = None
+        if self.args.get("async_notifications", False):
+            self._notification_dispatcher = NotificationDispatcher(
+                self,
+                queue_size=int(self.args.get("notify_queue_size", 100)),
+                concurrency=self.args.get("notify_concurrency", 1),
+                retries=int(self.args.get("notify_retries", 2)),
+                backoff=float(self.args.get("notify_retry_backoff", 1.0)),
+            )
+
         # log current config
         self.log(f"Got opening sensors {self._opening_sensors}")
         self.log(f"Got opening timeout {self._opening_timeout}")
@@ -110,6 +196,9 @@ class BaseApp(hass.Hass):
 
     def log(self, message, level="INFO", *args, **kwargs):
         """Custom log function to ensure UTF-8 output and handle args/kwargs properly."""
+        if level == "DEBUG" and not self.is_debug_enabled():
+            return
+
         # Format the message if args are passed
         if args or kwargs:
             message = message % (*args, *kwargs.values())
@@ -117,6 +206,529 @@ class BaseApp(hass.Hass):
         # Ensure the message is a string before passing it to super().log()
         super().log(str(message), level=level, ascii_encode=False)
 
+    def log_debug(self, message, *args):
+        """Log a DEBUG message, formatting it only when DEBUG is enabled.
+
+        Use this on hot paths instead of `self.log(f"...", level="DEBUG")`.
+
+        Args:
+            message (str|callable): %-style format string, or a callable that
+                returns the message when building it is expensive.
+            *args: values interpolated into `message`.
+        """
+        if not self.is_debug_enabled():
+            return
+        if callable(message):
+            message = message()
+        elif args:
+            message = message % args
+        self.log(message, level="DEBUG")
+
+    def is_debug_enabled(self):
+        """Return True if DEBUG messages reach the app log.
+
+        The effective level is looked up once and cached per app; call
+        `refresh_log_level` after changing it at runtime.
+        """
+        enabled = getattr(self, "_debug_enabled", None)
+        if enabled is None:
+            try:
+                enabled = self.get_main_log().isEnabledFor(logging.DEBUG)
+            except Exception:
+                # no logger available (e.g. tests) -> keep DEBUG output
+                enabled = True
+            self._debug_enabled = enabled
+        return enabled
+
+    def refresh_log_level(self):
+        """Drop the cached effective log level."""
+        self._debug_enabled = None
+
+    def set_log_level(self, level):
+        """Set the app log level and refresh the cached effective level."""
+        super().set_log_level(level)
+        self.refresh_log_level()
+
+    def get_state(self, entity_id=None, attribute=None, default=None, **kwargs):
+        """Return an entity state, served from the evaluation cache when active.
+
+        Outside of an `evaluation_scope()` this is a plain pass-through to
+        AppDaemon. Inside a scope every (entity, attribute) pair is fetched
+        once and repeated reads are answered from a local dict. Reads of the
+        whole namespace (no entity_id) and reads from threads other than the
+        one running the scope are never cached.
+
+        Args:
+            entity_id (str|None): entity to query.
+            attribute (str|None): optional attribute name.
+            default: value returned when the state/attribute is missing.
+
+        Returns:
+            The state or attribute value, or `default` when missing.
+        """
+        thread = threading.get_ident()
+        counts = getattr(self, "_callback_counts", None)
+        if counts is not None and getattr(self, "_callback_counts_thread", thread) == thread:
+            counts[0] += 1
+
+        cache = getattr(self, "_state_cache", None)
+        if cache is None or entity_id is None or getattr(self, "_state_cache_thread", thread) != thread:
+            return super().get_state(entity_id, attribute=attribute, default=default, **kwargs)
+
+        key = (entity_id, attribute, kwargs.get("namespace"))
+        if key in cache:
+            self._state_cache_hits += 1
+            value = cache[key]
+        else:
+            self._state_cache_misses += 1
+            snapshot = getattr(self, "_state_snapshot", None)
+            if snapshot is not None and "." in entity_id and not kwargs:
+                value = self.read_state_snapshot(snapshot, entity_id, attribute)
+            else:
+                value = super().get_state(entity_id, attribute=attribute, **kwargs)
+            cache[key] = value
+
+        if value is None:
+            return default
+        return value
+
+    @contextmanager
+    def evaluation_scope(self):
+        """Context manager that caches `get_state` reads for one evaluation pass.
+
+        The cache is created on entry and dropped on exit, so state is never
+        served across callbacks. Nested scopes reuse the outermost cache.
+
+        When `use_state_snapshot()` says so, the whole namespace is fetched
+        once on entry and entity reads are answered from that snapshot.
+        """
+        if getattr(self, "_state_cache", None) is not None:
+            yield
+            return
+
+        if not hasattr(self, "_state_cache_hits"):
+            self._state_cache_hits = 0
+            self._state_cache_misses = 0
+            self._evaluation_count = 0
+
+        hits = self._state_cache_hits
+        misses = self._state_cache_misses
+        self._state_cache = {}
+        self._state_cache_thread = threading.get_ident()
+        self._state_snapshot = None
+        if self.use_state_snapshot():
+            snapshot = super().get_state()
+            if isinstance(snapshot, dict):
+                self._state_snapshot = snapshot
+                self._state_snapshot_count = getattr(self, "_state_snapshot_count", 0) + 1
+        try:
+            yield
+        finally:
+            self._state_cache = None
+            self._state_snapshot = None
+            self._evaluation_count += 1
+            self.log_debug("Evaluation finished with %s state cache hits and %s misses", self._state_cache_hits - hits, self._state_cache_misses - misses)
+
+    def get_state_cache_stats(self):
+        """Return cumulative evaluation cache counters.
+
+        Returns:
+            dict: evaluations, hits, misses and hit_ratio (0..1).
+        """
+        hits = getattr(self, "_state_cache_hits", 0)
+        misses = getattr(self, "_state_cache_misses", 0)
+        total = hits + misses
+        return {
+            "evaluations": getattr(self, "_evaluation_count", 0),
+            "snapshots": getattr(self, "_state_snapshot_count", 0),
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / total if total else 0.0,
+        }
+
+    def get_configured_entities(self):
+        """Return the set of entity ids in the app's `SNAPSHOT_ENTITY_LISTS`."""
+        entities = set()
+        for attr in self.SNAPSHOT_ENTITY_LISTS:
+            entities.update(entity for entity in getattr(self, attr, None) or [] if isinstance(entity, str))
+        return entities
+
+    def use_state_snapshot(self):
+        """Return True if evaluations should read a whole-namespace snapshot.
+
+        `state_snapshot` selects the strategy: "always", "never" or "auto"
+        (default). Fetching the namespace costs roughly in proportion to its
+        size, so in auto mode a snapshot is used once the app has at least
+        `state_snapshot_min_entities` configured entities and they make up at
+        least `state_snapshot_ratio` of the namespace. The decision is made on
+        the first evaluation, after the subclass has read its config.
+        """
+        use = getattr(self, "_use_state_snapshot", None)
+        if use is None:
+            mode = str(getattr(self, "_state_snapshot_mode", "never")).lower()
+            if mode == "auto":
+                count = len(self.get_configured_entities())
+                use = False
+                if count >= self._state_snapshot_min_entities:
+                    namespace = super().get_state()
+                    size = len(namespace) if isinstance(namespace, dict) else 0
+                    use = size > 0 and count >= size * self._state_snapshot_ratio
+                    self.log(f"Configured with {count} of {size} entities, {'using' if use else 'not using'} state snapshots")
+            else:
+                use = mode in ("always", "true")
+            self._use_state_snapshot = use
+        return use
+
+    @staticmethod
+    def read_state_snapshot(snapshot, entity_id, attribute=None):
+        """Resolve an entity state or attribute from a `get_state()` namespace dict.
+
+        Mirrors AppDaemon: None reads the state, "all" the full state dict,
+        last_updated/last_changed come from the top level and anything else
+        from the attributes.
+        """
+        entry = snapshot.get(entity_id)
+        if entry is None:
+            return None
+        if attribute is None:
+            return entry.get("state")
+        if attribute == "all":
+            return entry
+        if attribute in entry and attribute not in ("attributes", "entity_id"):
+            return entry[attribute]
+        return entry.get("attributes", {}).get(attribute)
+
+    def request_evaluation(self, callback, immediate=False):
+        """Run an evaluation, coalescing bursts of triggers into a single run.
+
+        With `coalesce_window` > 0 the call is deferred until no further
+        trigger arrived for that many seconds, but never longer than
+        `coalesce_max_latency` after the first trigger. Triggers arriving
+        meanwhile are merged into the pending run.
+
+        Args:
+            callback (callable): evaluation method, e.g. `self.update_climate`.
+            immediate (bool): bypass coalescing for safety-critical triggers.
+        """
+        self._evaluations_requested = getattr(self, "_evaluations_requested", 0) + 1
+        window = getattr(self, "_coalesce_window", 0)
+        pending = getattr(self, "_pending_evaluations", {})
+        name = getattr(callback, "__name__", repr(callback))
+
+        if immediate or window <= 0:
+            entry = pending.pop(name, None)
+            if entry is not None:
+                # the pending run is covered by this one
+                self.cancel_timer(entry["handle"])
+            self.run_evaluation(callback)
+            return
+
+        now = self.get_utc_time().timestamp()
+        entry = pending.get(name)
+        if entry is not None:
+            entry["last"] = now
+            return
+
+        pending[name] = {
+            "callback": callback,
+            "first": now,
+            "last": now,
+            "handle": self.run_in(self.coalesced_evaluation_callback, window, evaluation=name),
+        }
+
+    def coalesced_evaluation_callback(self, kwargs):
+        """Timer callback running a coalesced evaluation once triggers settle."""
+        entry = self._pending_evaluations.get(kwargs["evaluation"])
+        if entry is None:
+            return
+
+        now = self.get_utc_time().timestamp()
+        quiet = now - entry["last"]
+        remaining = self._coalesce_max_latency - (now - entry["first"])
+        if quiet < self._coalesce_window and remaining > 0:
+            delay = min(self._coalesce_window - quiet, remaining)
+            entry["handle"] = self.run_in(self.coalesced_evaluation_callback, delay, evaluation=kwargs["evaluation"])
+            return
+
+        del self._pending_evaluations[kwargs["evaluation"]]
+        self.run_evaluation(entry["callback"])
+
+    def run_evaluation(self, callback):
+        """Run an evaluation callback and count it."""
+        self._evaluations_run = getattr(self, "_evaluations_run", 0) + 1
+        callback()
+
+    def get_evaluation_stats(self):
+        """Return counters for requested, executed and coalesced evaluations.
+
+        Returns:
+            dict: requested, run, pending and saved (requests merged into another run).
+        """
+        requested = getattr(self, "_evaluations_requested", 0)
+        run = getattr(self, "_evaluations_run", 0)
+        pending = len(getattr(self, "_pending_evaluations", {}))
+        return {
+            "requested": requested,
+            "run": run,
+            "pending": pending,
+            "saved": max(0, requested - run - pending),
+        }
+
+    def setup_callback_instrumentation(self):
+        """Read the instrumentation args and register the publish triggers.
+
+        With `callback_sample_rate` > 0 every callback registered through
+        `listen_state`, `listen_event`, `run_in`, `run_every` or `run_daily`
+        is wrapped by `instrument_callback`. The default of 0 registers the
+        callbacks unchanged, so there is no per-call overhead.
+
+        Stats are published on the `callback_stats` event and, with
+        `callback_stats_interval` > 0, periodically.
+        """
+        self._callback_sample_rate = min(1.0, float(self.args.get("callback_sample_rate", 0)))
+        self._callback_stats = {}
+        self._callback_counts = None
+        if self._callback_sample_rate <= 0:
+            return
+
+        self._callback_stats_sensor = self.args.get(
+            "callback_stats_sensor", f"sensor.{self.name}_callback_stats")
+        self._callback_stats_file = self.args.get("callback_stats_file", None)
+        self.listen_event(self.callback_stats_event_callback, "callback_stats")
+        interval = int(self.args.get("callback_stats_interval", 0))
+        if interval > 0:
+            self.run_every(self.callback_stats_time_callback, f"now+{interval}", interval)
+
+    def instrument_callback(self, callback):
+        """Wrap a callback to record latency, get_state/call_service counts and errors.
+
+        Every invocation is counted; with a sample rate below 1 only that
+        fraction of the calls is timed. Exceptions are recorded and re-raised
+        so AppDaemon still logs them.
+
+        Args:
+            callback (callable): callback about to be registered.
+
+        Returns:
+            callable: the wrapper, or `callback` itself when instrumentation is off.
+        """
+        rate = getattr(self, "_callback_sample_rate", 0)
+        if rate <= 0 or getattr(callback, "_instrumented", False):
+            return callback
+
+        name = getattr(callback, "__name__", repr(callback))
+        stats = self._callback_stats.setdefault(name, CallbackStats())
+
+        @functools.wraps(callback)
+        def wrapper(*args, **kwargs):
+            stats.invocations += 1
+            stats.credit += rate
+            # nested callbacks are accounted to the outer one
+            if stats.credit < 1 or self._callback_counts is not None:
+                return callback(*args, **kwargs)
+            stats.credit -= 1
+
+            self._callback_counts_thread = threading.get_ident()
+            counts = self._callback_counts = [0, 0]
+            failed = False
+            start = time.perf_counter()
+            try:
+                return callback(*args, **kwargs)
+            except Exception:
+                failed = True
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+                self._callback_counts = None
+                stats.record(elapsed, counts[0], counts[1], failed)
+
+        wrapper._instrumented = True
+        return wrapper
+
+    def listen_state(self, callback, *args, **kwargs):
+        """Register a state listener, instrumented when sampling is enabled."""
+        return super().listen_state(self.instrument_callback(callback), *args, **kwargs)
+
+    def listen_event(self, callback, *args, **kwargs):
+        """Register an event listener, instrumented when sampling is enabled."""
+        return super().listen_event(self.instrument_callback(callback), *args, **kwargs)
+
+    def run_in(self, callback, *args, **kwargs):
+        """Schedule a one-shot timer, instrumented when sampling is enabled."""
+        return super().run_in(self.instrument_callback(callback), *args, **kwargs)
+
+    def run_every(self, callback, *args, **kwargs):
+        """Schedule a repeating timer, instrumented when sampling is enabled."""
+        return super().run_every(self.instrument_callback(callback), *args, **kwargs)
+
+    def run_daily(self, callback, *args, **kwargs):
+        """Schedule a daily timer, instrumented when sampling is enabled."""
+        return super().run_daily(self.instrument_callback(callback), *args, **kwargs)
+
+    def call_service(self, service, **kwargs):
+        """Call a Home Assistant service, counting it for the running callback.
+
+        Cached reads of the target entities are dropped, so the rest of an
+        evaluation pass does not act on the state before the call. Calls from
+        other threads (e.g. notification dispatcher workers) leave the
+        per-pass cache, snapshot and counters of the callback thread alone.
+        """
+        thread = threading.get_ident()
+        counts = getattr(self, "_callback_counts", None)
+        if counts is not None and getattr(self, "_callback_counts_thread", thread) == thread:
+            counts[1] += 1
+        cache = getattr(self, "_state_cache", None)
+        if cache and kwargs.get("entity_id") and getattr(self, "_state_cache_thread", thread) == thread:
+            targets = kwargs["entity_id"]
+            targets = {targets} if isinstance(targets, str) else set(targets)
+            for key in [key for key in cache if key[0] in targets]:
+                del cache[key]
+            # the snapshot would answer with the old state as well
+            self._state_snapshot = None
+        return super().call_service(service, **kwargs)
+
+    def call_service_per_domain(self, action, entities, **data):
+        """Call `<domain>/<action>` once per domain for a list of entities.
+
+        Home Assistant accepts a list in `entity_id`, so switching N entities
+        of a domain costs one service call instead of N. A single entity is
+        passed as a plain string. The payload in `data` is shared by all calls.
+
+        Args:
+            action (str): service name without domain, e.g. "turn_on" or "toggle".
+            entities (list[str]): entity ids, possibly of several domains.
+            **data: service data, e.g. brightness_pct.
+
+        Returns:
+            int: number of service calls made.
+        """
+        domains = {}
+        for entity in entities:
+            domains.setdefault(entity.split(".", 1)[0], []).append(entity)
+        for domain, members in domains.items():
+            self.call_service(f"{domain}/{action}", entity_id=members[0] if len(members) == 1 else members, **data)
+        return len(domains)
+
+    def get_callback_stats(self):
+        """Return per-callback instrumentation summaries.
+
+        Returns:
+            dict: callback name -> invocations, sampled, errors, latency and
+            get_state/call_service figures (see `CallbackStats.summary`).
+        """
+        return {name: stats.summary() for name, stats in getattr(self, "_callback_stats", {}).items()}
+
+    def publish_callback_stats(self):
+        """Publish callback stats as an HA sensor and, if configured, a Prometheus file."""
+        stats = self.get_callback_stats()
+        self.set_state(self._callback_stats_sensor,
+                       state=sum(item["invocations"] for item in stats.values()),
+                       attributes={"unit_of_measurement": "calls", "callbacks": stats})
+
+        if self._callback_stats_file:
+            # write-then-rename so the textfile collector never reads a partial file
+            tmp = f"{self._callback_stats_file}.tmp"
+            with open(tmp, "w", encoding="utf8") as f:
+                f.write(self.format_prometheus_metrics())
+            os.replace(tmp, self._callback_stats_file)
+
+    def format_prometheus_metrics(self):
+        """Return the callback stats in the Prometheus text exposition format."""
+        app = self.name.replace("\\", "\\\\").replace('"', '\\"')
+        lines = []
+        histograms = (
+            ("latency", "appdaemon_callback_duration_seconds", "Wall time of sampled callbacks."),
+            ("get_state", "appdaemon_callback_get_state_calls", "get_state calls per sampled callback."),
+            ("call_service", "appdaemon_callback_service_calls", "call_service calls per sampled callback."),
+        )
+        for attribute, metric, description in histograms:
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} histogram")
+            for name, stats in self._callback_stats.items():
+                labels = f'app="{app}",callback="{name}"'
+                histogram = getattr(stats, attribute)
+                for bound, count in histogram.cumulative():
+                    le = "+Inf" if bound == float("inf") else repr(float(bound))
+                    lines.append(f'{metric}_bucket{{{labels},le="{le}"}} {count}')
+                lines.append(f"{metric}_sum{{{labels}}} {histogram.sum}")
+                lines.append(f"{metric}_count{{{labels}}} {histogram.count}")
+
+        counters = (
+            ("invocations", "appdaemon_callback_invocations_total", "Callback invocations."),
+            ("errors", "appdaemon_callback_errors_total", "Sampled callbacks that raised."),
+        )
+        for attribute, metric, description in counters:
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} counter")
+            for name, stats in self._callback_stats.items():
+                lines.append(f'{metric}{{app="{app}",callback="{name}"}} {getattr(stats, attribute)}')
+        return "\n".join(lines) + "\n"
+
+    def callback_stats_event_callback(self, event_name, data, kwargs):
+        """Publish callback stats on the `callback_stats` event.
+
+        The event may carry an `app` to address a single app.
+        """
+        if data.get("app") not in (None, self.name):
+            return
+        self.publish_callback_stats()
+
+    def callback_stats_time_callback(self, kwargs):
+        """Publish callback stats periodically."""
+        self.publish_callback_stats()
+
+    def schedule_recheck(self, key, delay, callback, *args):
+        """Call `callback(*args)` after `delay` seconds unless the key is rescheduled.
+
+        All re-checks of an app share one heap and one `run_in` timer, which
+        is cheaper than a `listen_state(..., duration=...)` registration per
+        entity. Scheduling an existing key replaces its pending call.
+
+        Args:
+            key (hashable): identifies the re-check, e.g. (entity, "delayed").
+            delay (float): seconds from now.
+            callback (callable): function to call when due.
+            *args: arguments passed to `callback`.
+        """
+        self._recheck_calls[key] = (callback, args)
+        self._rechecks.schedule(key, self.get_utc_time().timestamp() + delay)
+        self.schedule_recheck_timer()
+
+    def cancel_recheck(self, key):
+        """Drop a pending re-check; unknown keys are ignored."""
+        if self._recheck_calls.pop(key, None) is not None:
+            self._rechecks.schedule(key, None)
+
+    def schedule_recheck_timer(self):
+        """Make sure the single re-check timer fires by the earliest pending deadline.
+
+        A timer that fires too early is harmless (it just re-arms itself), so
+        the timer is only replaced when a deadline moves ahead of it. Timers
+        are aligned to whole seconds so deadlines close together share one.
+        """
+        deadline = self._rechecks.next_deadline()
+        if deadline is None:
+            return
+        deadline = math.ceil(deadline)
+        if self._recheck_timer is not None:
+            if self._recheck_timer_deadline <= deadline:
+                return
+            self.cancel_timer(self._recheck_timer)
+        self._recheck_timer_deadline = deadline
+        delay = max(0, deadline - self.get_utc_time().timestamp())
+        self._recheck_timer = self.run_in(self.recheck_timer_callback, delay)
+
+    def recheck_timer_callback(self, kwargs):
+        """Timer callback running the re-checks that are due."""
+        self._recheck_timer = None
+        self._recheck_timer_deadline = None
+        for key in self._rechecks.pop_due(self.get_utc_time().timestamp()):
+            call = self._recheck_calls.pop(key, None)
+            if call is not None:
+                callback, args = call
+                callback(*args)
+        self.schedule_recheck_timer()
+
     def get_utc_time(self):
         """Return the current UTC datetime.
 
@@ -146,10 +758,10 @@ class BaseApp(hass.Hass):
         if self.is_holiday_today():
             return False
         if self._workday_sensor is None:
-            self.log("using workday fallback for today", level = "DEBUG")
+            self.log_debug("using workday fallback for today")
             today = date.today()
             return today.weekday() < 5  # Monday-Friday are workdays
-        self.log(f"workday today state {self.get_state(self._workday_sensor)}", level = "DEBUG")
+        self.log_debug(lambda: f"workday today state {self.get_state(self._workday_sensor)}")
         return self.get_state(self._workday_sensor) == 'on'
 
     def is_workday_tomorrow(self):
@@ -162,10 +774,10 @@ class BaseApp(hass.Hass):
             bool: True when tomorrow is a workday.
         """
         if self._workday_tomorrow_sensor is None:
-            self.log("using workday fallback for tomorrow", level = "DEBUG")
+            self.log_debug("using workday fallback for tomorrow")
             tomorrow = date.today() + timedelta(days=1)
             return tomorrow.weekday() < 5  # Returns True for Monday-Friday
-        self.log(f"workday tomorrow state {self.get_state(self._workday_tomorrow_sensor)}", level = "DEBUG")
+        self.log_debug(lambda: f"workday tomorrow state {self.get_state(self._workday_tomorrow_sensor)}")
         return self.get_state(self._workday_tomorrow_sensor) == 'on'
 
     def is_holiday_today(self):
@@ -189,19 +801,46 @@ class BaseApp(hass.Hass):
         today_workday = self.is_workday_today()
         tomorrow_workday = self.is_workday_tomorrow()
 
-        self.log(f"today_workday {today_workday} tomorrow_workday {tomorrow_workday}", level = "DEBUG")
+        self.log_debug("today_workday %s tomorrow_workday %s", today_workday, tomorrow_workday)
 
         night_start = self._night_start_workday if tomorrow_workday else self._night_start
         night_end = self._night_end_workday if today_workday else self._night_end
         return night_start, night_end
 
+    def get_local_timezone(self):
+        """Return the tzinfo used to interpret the configured night times.
+
+        Uses the AppDaemon timezone when available, otherwise the system
+        local timezone.
+        """
+        tz = getattr(self, "_local_timezone", None)
+        if tz is None:
+            try:
+                from zoneinfo import ZoneInfo
+                tz = ZoneInfo(self.get_timezone())
+            except Exception:
+                tz = datetime.now().astimezone().tzinfo
+            self._local_timezone = tz
+        return tz
+
+    def night_schedule_callback(self, entity, attribute, old, new, kwargs):
+        """Invalidate the night schedule when a workday/holiday sensor changes."""
+        if old != new and self._night_schedule is not None:
+            self.log_debug("%s changed from %s to %s, resetting night schedule", entity, old, new)
+            self._night_schedule.invalidate()
+
     def is_time_in_night_window(self):
         """Return True if the current time is within the configured night window.
 
-        Uses `get_night_times` to consider workday-specific windows.
+        Uses the precomputed `NightSchedule` when set up in `initialize`,
+        otherwise `get_night_times` to consider workday-specific windows.
         """
+        schedule = getattr(self, "_night_schedule", None)
+        if schedule is not None:
+            return schedule.is_night(self.get_utc_time())
+
         night_start, night_end = self.get_night_times()
-        self.log(f"night start {night_start} night end {night_end}", level = "DEBUG")
+        self.log_debug("night start %s night end %s", night_start, night_end)
         return self.now_is_between(night_start, night_end)
 
     def in_silent_mode(self):
@@ -225,7 +864,11 @@ class BaseApp(hass.Hass):
         Returns:
             int: number of seconds until night end; 0 if night already ended.
         """
-        now = datetime.now(timezone.utc)
+        schedule = getattr(self, "_night_schedule", None)
+        if schedule is not None:
+            return schedule.seconds_until_night_end(self.get_utc_time())
+
+        now = self.get_utc_time()
         night_start, night_end = self.get_night_times()
         night_end_time = datetime.strptime(night_end, "%H:%M:%S").time()
         night_end_datetime = datetime.combine(now.date(), night_end_time, tzinfo=timezone.utc)
@@ -242,6 +885,84 @@ class BaseApp(hass.Hass):
         seconds_left = int((night_end_datetime - now).total_seconds())
         return seconds_left
 
+    def setup_state_counters(self):
+        """Maintain event-driven counters for the common entity lists.
+
+        Seeds one `StateCounter` per list (opening/motion sensors, device
+        trackers, awake sensors, lights and vacuum cleaners) from the current
+        state, listens for changes and schedules a periodic reconcile against
+        a full scan.
+        """
+        self._state_counters = {}
+        categories = {}
+        for attr in self.COUNTED_ENTITY_LISTS:
+            entities = getattr(self, attr, [])
+            counter = StateCounter(entities)
+            self._state_counters[attr] = counter
+            self.seed_state_counter(counter)
+            for entity in entities:
+                categories.setdefault(entity, []).append(attr)
+
+        for entity, attrs in categories.items():
+            self.listen_state(self.state_counter_callback, entity, attribute="all", categories=attrs)
+
+        interval = int(self.args.get("state_counter_reconcile_interval", 60*15))
+        self.run_every(self.reconcile_state_counters, f"now+{interval}", interval)
+        self.log(f"Maintaining state counters for {len(categories)} entities")
+
+    def seed_state_counter(self, counter):
+        """Fill a counter from current state, oldest update first.
+
+        Returns:
+            int: number of entities whose stored state changed.
+        """
+        entries = []
+        for entity in counter.entities:
+            entries.append((self.get_last_updated(entity), entity, self.get_state(entity)))
+
+        drift = 0
+        epoch = datetime.min.replace(tzinfo=timezone.utc)
+        for last_updated, entity, state in sorted(entries, key=lambda e: e[0] or epoch):
+            if counter.update(entity, state, last_updated):
+                drift = drift + 1
+        return drift
+
+    def get_state_counter(self, attr):
+        """Return the live counter for an entity list attribute, if any.
+
+        A counter is only used while the list it was built for is still the
+        one configured on the app; otherwise callers fall back to a scan.
+        """
+        counters = getattr(self, "_state_counters", None)
+        if not counters:
+            return None
+        counter = counters.get(attr)
+        if counter is None or counter.entities is not getattr(self, attr, None):
+            return None
+        return counter
+
+    def state_counter_callback(self, entity, attribute, old, new, kwargs):
+        """Update state counters on a state change event."""
+        if isinstance(new, dict):
+            state = new.get("state")
+            last_updated_str = new.get("last_updated")
+        else:
+            state = new
+            last_updated_str = None
+        last_updated = self.parse_last_updated(entity, last_updated_str) if last_updated_str else None
+
+        for attr in kwargs.get("categories", []):
+            counter = self._state_counters.get(attr)
+            if counter is not None:
+                counter.update(entity, state, last_updated)
+
+    def reconcile_state_counters(self, kwargs=None):
+        """Compare counters with a full scan and fix any drift."""
+        for attr, counter in getattr(self, "_state_counters", {}).items():
+            drift = self.seed_state_counter(counter)
+            if drift > 0:
+                self.log(f"Reconciled {drift} drifted entities in {attr.strip('_')} counter", level="WARNING")
+
     def count_opening_sensors(self, state = None):
         """Count opening sensors, optionally filtered by state.
 
@@ -257,11 +978,18 @@ class BaseApp(hass.Hass):
         if state is None:
             return len(self._opening_sensors)
 
+        counter = self.get_state_counter("_opening_sensors")
+        if counter is not None:
+            now = self.get_utc_time()
+            return counter.count(state) + counter.count_recent(self._opening_timeout, now, exclude_state=state)
+
         count = 0
         for sensor in self._opening_sensors:
             if self.get_state(sensor) == state:
                 count = count + 1
-            elif self.get_seconds_since_update(sensor) is not None and self.get_seconds_since_update(sensor) < self._opening_timeout:
+                continue
+            seconds = self.get_seconds_since_update(sensor)
+            if seconds is not None and seconds < self._opening_timeout:
                 count = count + 1
         return count
 
@@ -298,11 +1026,18 @@ class BaseApp(hass.Hass):
         if state is None:
             return len(self._motion_sensors)
 
+        counter = self.get_state_counter("_motion_sensors")
+        if counter is not None:
+            now = self.get_utc_time()
+            return counter.count(state) + counter.count_recent(self._motion_timeout, now, exclude_state=state)
+
         count = 0
         for sensor in self._motion_sensors:
             if self.get_state(sensor) == state:
                 count = count + 1
-            elif self.get_seconds_since_update(sensor) is not None and self.get_seconds_since_update(sensor) < self._motion_timeout:
+                continue
+            seconds = self.get_seconds_since_update(sensor)
+            if seconds is not None and seconds < self._motion_timeout:
                 count = count + 1
         return count
 
@@ -316,15 +1051,25 @@ class BaseApp(hass.Hass):
         Returns:
             float|None: seconds since last motion or None.
         """
+        counter = self.get_state_counter("_motion_sensors")
+        if counter is not None:
+            if counter.count("on") > 0:
+                return 0
+            last_updated = counter.last_updated()
+            if last_updated is None:
+                return None
+            return (self.get_utc_time() - last_updated).total_seconds()
+
         last_motion = None
         for sensor in self._motion_sensors:
             if self.get_state(sensor) == "on":
                 return 0
+            seconds = self.get_seconds_since_update(sensor)
             if last_motion is None:
                 # FIXME
-                last_motion = self.get_seconds_since_update(sensor)
-            elif self.get_seconds_since_update(sensor) is not None and self.get_seconds_since_update(sensor) < last_motion:
-                last_motion = self.get_seconds_since_update(sensor)
+                last_motion = seconds
+            elif seconds is not None and seconds < last_motion:
+                last_motion = seconds
         return last_motion
 
     def count_on_motion_sensors(self):
@@ -345,32 +1090,83 @@ class BaseApp(hass.Hass):
         """
         return self.count_motion_sensors("off")
 
-    def get_seconds_since_update(self, entity):
+    def get_seconds_since_update(self, entity, now=None):
         """Return seconds elapsed since the entity's last_updated attribute.
 
+        The parsed timestamp is cached per entity and only re-parsed when the
+        raw `last_updated` string changes.
+
         Args:
             entity (str): entity_id to query.
+            now (datetime|None): reference UTC time, defaults to now.
 
         Returns:
             float|None: seconds since last update or None if unavailable.
         """
-        last_updated_str = self.get_state(entity, attribute="last_updated")
+        last_updated = self.get_last_updated(entity)
+        if last_updated is None:
+            return None
 
-        if last_updated_str:
-            # Convert ISO string to datetime object
-            last_updated = datetime.fromisoformat(last_updated_str.replace("Z", "+00:00"))
+        if now is None:
+            now = self.get_utc_time()
+        return (now - last_updated).total_seconds()
 
-            # Get current time in UTC
-            now = datetime.now(timezone.utc)
+    def get_seconds_since_update_many(self, entities):
+        """Return seconds since last update for several entities at once.
 
-            # Calculate time difference in seconds
-            seconds_elapsed = (now - last_updated).total_seconds()
+        All ages are computed against a single `now`, so the values are
+        comparable with each other.
 
-            self.log(f"{entity} was last updated {seconds_elapsed:.2f} seconds ago.", level = "DEBUG")
-            return seconds_elapsed
-        else:
-            self.log(f"Could not retrieve last_updated for {entity}.", level = "DEBUG")
+        Args:
+            entities (list[str]): entity_ids to query.
+
+        Returns:
+            dict: entity_id -> seconds (float) or None if unavailable.
+        """
+        now = self.get_utc_time()
+        return {entity: self.get_seconds_since_update(entity, now=now) for entity in entities}
+
+    def get_last_updated(self, entity):
+        """Return the entity's last_updated attribute as a UTC datetime.
+
+        Args:
+            entity (str): entity_id to query.
+
+        Returns:
+            datetime|None: parsed timestamp or None if unavailable.
+        """
+        last_updated_str = self.get_state(entity, attribute="last_updated")
+        if not last_updated_str:
+            cache = getattr(self, "_last_updated_cache", None)
+            if cache is not None:
+                cache.pop(entity, None)
+            self.log_debug("Could not retrieve last_updated for %s.", entity)
             return None
+        return self.parse_last_updated(entity, last_updated_str)
+
+    def parse_last_updated(self, entity, last_updated_str):
+        """Parse a raw last_updated string, reusing the cached value if unchanged.
+
+        Args:
+            entity (str): entity_id the value belongs to.
+            last_updated_str (str): ISO timestamp as reported by Home Assistant.
+
+        Returns:
+            datetime: timezone-aware UTC datetime.
+        """
+        cache = getattr(self, "_last_updated_cache", None)
+        if cache is None:
+            cache = self._last_updated_cache = {}
+
+        cached = cache.get(entity)
+        if cached is not None and cached[0] == last_updated_str:
+            return cached[1]
+
+        # Convert ISO string to datetime object
+        last_updated = datetime.fromisoformat(last_updated_str.replace("Z", "+00:00"))
+        cache[entity] = (last_updated_str, last_updated)
+        self.log_debug("%s was last updated at %s.", entity, last_updated_str)
+        return last_updated
 
     def record_internal_change(self):
         """Record that this app made an internal change.
@@ -379,7 +1175,7 @@ class BaseApp(hass.Hass):
         distinguish internal vs external changes to entities.
         """
         self.log("Recording internal change")
-        self._internal_change_timestamp = datetime.now(timezone.utc)
+        self._internal_change_timestamp = self.get_utc_time()
         self._internal_change_count = self._internal_change_count + 1
 
     def record_external_change(self):
@@ -388,7 +1184,7 @@ class BaseApp(hass.Hass):
         Stores a timestamp and increments an external change counter.
         """
         self.log("Recording external change")
-        self._external_change_timestamp = datetime.now(timezone.utc)
+        self._external_change_timestamp = self.get_utc_time()
         self._external_change_count = self._external_change_count + 1
 
     def reset_internal_change_records(self):
@@ -431,11 +1227,11 @@ class BaseApp(hass.Hass):
         last_internal_change = self.get_last_internal_change()
 
         if last_internal_change is None:
-            self.log("Current change is considered external. There was not any internal change recorded.", level = "DEBUG")
+            self.log_debug("Current change is considered external. There was not any internal change recorded.")
             return True
 
         # Get current time in UTC
-        now = datetime.now(timezone.utc)
+        now = self.get_utc_time()
 
         # Calculate seconds since the last internal change
         seconds_ago = (now - last_internal_change).total_seconds()
@@ -445,14 +1241,14 @@ class BaseApp(hass.Hass):
         remaining_time = max(0, timeout - seconds_ago)
 
         # Improved logging
-        self.log(f"Last internal change: {last_internal_change}, Now: {now}, Elapsed: {seconds_ago:.2f}s, Timeout: {timeout}s, Remaining: {remaining_time:.2f}s", level = "DEBUG")
+        self.log_debug("Last internal change: %s, Now: %s, Elapsed: %.2fs, Timeout: %ss, Remaining: %.2fs", last_internal_change, now, seconds_ago, timeout, remaining_time)
 
         # Determine if the change is external
         if remaining_time > 0:
-            self.log(f"Current change is considered internal. Last recorded internal change was recorded {seconds_ago:.2f} seconds ago which is inside of timeout {timeout:.2f} window.", level = "DEBUG")
+            self.log_debug("Current change is considered internal. Last recorded internal change was recorded %.2f seconds ago which is inside of timeout %.2f window.", seconds_ago, timeout)
             return False
 
-        self.log(f"Current change is considered external. Last recorded internal change was recorded {seconds_ago:.2f} seconds ago which is outside of timeout {timeout:.2f} window.", level = "DEBUG")
+        self.log_debug("Current change is considered external. Last recorded internal change was recorded %.2f seconds ago which is outside of timeout %.2f window.", seconds_ago, timeout)
         return True
 
     def is_last_change_external(self):
@@ -476,21 +1272,21 @@ class BaseApp(hass.Hass):
         - Otherwise, wait for the external timeout window to expire.
         """
         if not self.is_last_change_external():
-            self.log("No external change detected. Internal change is allowed.", level = "DEBUG")
+            self.log_debug("No external change detected. Internal change is allowed.")
             return True
 
         if self.is_nobody_at_home() and self.count_on_motion_sensors() == 0:
-            self.log("Nobody is at home and there is no motion. Internal change is allowed.", level = "DEBUG")
+            self.log_debug("Nobody is at home and there is no motion. Internal change is allowed.")
             return True
 
         remaining_time = self.get_remaining_seconds_before_internal_change_is_allowed()
 
         # Determine if internal change is allowed
         if remaining_time > 0:
-            self.log(f"Internal change is NOT allowed yet. Wait {remaining_time:.2f} more seconds.", level = "DEBUG")
+            self.log_debug("Internal change is NOT allowed yet. Wait %.2f more seconds.", remaining_time)
             return False
 
-        self.log("Internal change is now allowed.", level = "DEBUG")
+        self.log_debug("Internal change is now allowed.")
         return True
 
     def get_remaining_seconds_before_internal_change_is_allowed(self):
@@ -500,14 +1296,14 @@ class BaseApp(hass.Hass):
         computes timeout - elapsed_seconds and returns a non-negative value.
         """
         if not self.is_last_change_external():
-            self.log("No external change detected. Remaining time: 0 seconds", level="DEBUG")
+            self.log_debug("No external change detected. Remaining time: 0 seconds")
             return 0
 
-        now = datetime.now(timezone.utc).replace(microsecond=0)  # Remove milliseconds
+        now = self.get_utc_time().replace(microsecond=0)  # Remove milliseconds
         last_change = self.get_last_external_change()
 
         if last_change is None:
-            self.log("No record of last external change. Returning full timeout.", level="DEBUG")
+            self.log_debug("No record of last external change. Returning full timeout.")
             return self.get_external_change_timeout()
 
         last_change = last_change.replace(microsecond=0)  # Remove milliseconds
@@ -521,9 +1317,8 @@ class BaseApp(hass.Hass):
 
         remaining_time = max(0, timeout - seconds_ago)
 
-        self.log(f"Last external change: {last_change}, Now: {now}, "
-                f"Elapsed: {seconds_ago}s, Timeout: {timeout}s, Remaining: {remaining_time}s",
-                level="DEBUG")
+        self.log_debug("Last external change: %s, Now: %s, Elapsed: %ss, Timeout: %ss, Remaining: %ss",
+                       last_change, now, seconds_ago, timeout, remaining_time)
 
         return remaining_time
 
@@ -538,7 +1333,7 @@ class BaseApp(hass.Hass):
         Returns:
             int: number of matching media players.
         """
-        self.log(f"Count media players in state {state} and sources {sources}", level="DEBUG")
+        self.log_debug("Count media players in state %s and sources %s", state, sources)
         if state is None:
             return len(self._media_players)
 
@@ -547,15 +1342,16 @@ class BaseApp(hass.Hass):
 
         count = 0
         for sensor in self._media_players:
-            self.log(f"Media player {sensor} is in state {self.get_state(sensor)}", level="DEBUG")
-            if self.get_state(sensor) == state:
+            sensor_state = self.get_state(sensor)
+            self.log_debug("Media player %s is in state %s", sensor, sensor_state)
+            if sensor_state == state:
                 if len(sources) == 0:
                     count = count + 1
                 else:
                     if self.get_state(sensor, attribute = "source") in sources:
                         count = count + 1
 
-        self.log(f"found {count} media players in state {state} and sources {sources}", level = "DEBUG")
+        self.log_debug("found %s media players in state %s and sources %s", count, state, sources)
         return count
 
     def count_playing_media_players(self):
@@ -595,17 +1391,22 @@ class BaseApp(hass.Hass):
         Returns:
             int: number of vacuum cleaners matching the state or total when state is None.
         """
-        self.log(f"Count vacuum cleaners in state {state}", level="DEBUG")
+        self.log_debug("Count vacuum cleaners in state %s", state)
         if state is None:
             return len(self._vacuum_cleaners)
 
+        counter = self.get_state_counter("_vacuum_cleaners")
+        if counter is not None:
+            return counter.count(state)
+
         count = 0
         for sensor in self._vacuum_cleaners:
-            self.log(f"Vacuum cleaner {sensor} is in state {self.get_state(sensor)}", level="DEBUG")
-            if self.get_state(sensor) == state:
+            sensor_state = self.get_state(sensor)
+            self.log_debug("Vacuum cleaner %s is in state %s", sensor, sensor_state)
+            if sensor_state == state:
                 count = count + 1
 
-        self.log(f"found {count} vacuum cleaners in state {state}", level = "DEBUG")
+        self.log_debug("found %s vacuum cleaners in state %s", count, state)
         return count
 
     def count_cleaning_vacuum_cleaners(self):
@@ -645,17 +1446,22 @@ class BaseApp(hass.Hass):
         Returns:
             int: number of lights matching the state or total when state is None.
         """
-        self.log(f"count lights in state {state}", level = "DEBUG")
+        self.log_debug("count lights in state %s", state)
         if state is None:
             return len(self._lights)
 
+        counter = self.get_state_counter("_lights")
+        if counter is not None:
+            return counter.count(state)
+
         count = 0
         for sensor in self._lights:
-            self.log(f"light {sensor} is in state {self.get_state(sensor)}", level = "DEBUG")
-            if self.get_state(sensor) == state:
+            sensor_state = self.get_state(sensor)
+            self.log_debug("light %s is in state %s", sensor, sensor_state)
+            if sensor_state == state:
                 count = count + 1
 
-        self.log(f"found {count} lights in state {state}", level = "DEBUG")
+        self.log_debug("found %s lights in state %s", count, state)
         return count
 
     def count_on_lights(self):
@@ -686,17 +1492,22 @@ class BaseApp(hass.Hass):
         Returns:
             int: number of device trackers matching the state or total when state is None.
         """
-        self.log(f"count device trackers in state {state}", level = "DEBUG")
+        self.log_debug("count device trackers in state %s", state)
         if state is None:
             return len(self._device_trackers)
 
+        counter = self.get_state_counter("_device_trackers")
+        if counter is not None:
+            return counter.count(state)
+
         count = 0
         for sensor in self._device_trackers:
-            self.log(f"device tracker {sensor} is in state {self.get_state(sensor)}", level = "DEBUG")
-            if self.get_state(sensor) == state:
+            sensor_state = self.get_state(sensor)
+            self.log_debug("device tracker %s is in state %s", sensor, sensor_state)
+            if sensor_state == state:
                 count = count + 1
 
-        self.log(f"found {count} device trackers in state {state}", level = "DEBUG")
+        self.log_debug("found %s device trackers in state %s", count, state)
         return count
 
     def count_home_device_trackers(self):
@@ -727,17 +1538,22 @@ class BaseApp(hass.Hass):
         Returns:
             int: number of awake sensors matching the state or total when state is None.
         """
-        self.log(f"count awake sensors in state {state}", level = "DEBUG")
+        self.log_debug("count awake sensors in state %s", state)
         if state is None:
             return len(self._awake_sensors)
 
+        counter = self.get_state_counter("_awake_sensors")
+        if counter is not None:
+            return counter.count(state)
+
         count = 0
         for sensor in self._awake_sensors:
-            self.log(f"awake sensor {sensor} is in state {self.get_state(sensor)}", level = "DEBUG")
-            if self.get_state(sensor) == state:
+            sensor_state = self.get_state(sensor)
+            self.log_debug("awake sensor %s is in state %s", sensor, sensor_state)
+            if sensor_state == state:
                 count = count + 1
 
-        self.log(f"found {count} awake sensor in state {state}", level = "DEBUG")
+        self.log_debug("found %s awake sensor in state %s", count, state)
         return count
 
     def count_on_awake_sensors(self):
@@ -793,13 +1609,13 @@ class BaseApp(hass.Hass):
             bool: True if someone is at home, False otherwise.
         """
         if self.count_home_device_trackers() > 0:
-            self.log("found device trackers", level = "DEBUG")
+            self.log_debug("found device trackers")
             return True
         if self.in_guest_mode():
-            self.log("found guest mode", level = "DEBUG")
+            self.log_debug("found guest mode")
             return True
         if self.in_vacation_mode():
-            self.log("found vacation mode", level = "DEBUG")
+            self.log_debug("found vacation mode")
             return False
         return False
 
@@ -1085,26 +1901,68 @@ class BaseApp(hass.Hass):
         if self.is_time_in_night_window() and prio > 0:
             self.log("Ignoring notify alexa due to sleep time")
         else:
-            self.notify_media(message = message, title = title, prio = prio)
+            self.dispatch_notification("media", prio, self.notify_media, message = message, title = title, prio = prio)
 
-        self.notify_telegram(message, title)
-        self.notify_notify(message, title)
+        if getattr(self, "_notification_dispatcher", None) is None:
+            self.notify_telegram(message, title)
+            self.notify_notify(message, title)
+        else:
+            # one job per recipient so the channel concurrency applies
+            for user_id in self._telegram_user_ids:
+                self.dispatch_notification("telegram", prio, self.notify_telegram, message, title, user_ids=[user_id])
+            for target in self._notify_targets:
+                self.dispatch_notification("mobile", prio, self.notify_notify, message, title, targets=[target])
 
         if prio == 0:
-            self.notify_persistent(message, title)
+            self.dispatch_notification("persistent", prio, self.notify_persistent, message, title)
 
-    def notify_telegram(self, message, title=None):
+    def dispatch_notification(self, channel, priority, func, *args, **kwargs):
+        """Run a notification function now or hand it to the dispatcher.
+
+        Args:
+            channel (str): dispatcher channel ('media', 'telegram', 'mobile', 'persistent').
+            priority (int): message priority, 0 is dispatched first.
+            func (callable): notification function to call.
+            *args, **kwargs: passed to `func`.
+        """
+        dispatcher = getattr(self, "_notification_dispatcher", None)
+        if dispatcher is None:
+            func(*args, **kwargs)
+            return
+        dispatcher.submit(channel, priority, func, *args, **kwargs)
+
+    def get_notification_metrics(self):
+        """Return per-channel dispatcher metrics, empty when dispatch is synchronous.
+
+        Returns:
+            dict: channel -> depth, sent, failed, retried, dropped and latency values.
+        """
+        dispatcher = getattr(self, "_notification_dispatcher", None)
+        if dispatcher is None:
+            return {}
+        return dispatcher.get_metrics()
+
+    def terminate(self):
+        """Stop background workers on app termination."""
+        dispatcher = getattr(self, "_notification_dispatcher", None)
+        if dispatcher is not None:
+            dispatcher.stop()
+
+    def notify_telegram(self, message, title=None, user_ids=None):
         """
         Send a short message to configured Telegram users.
 
         Args:
             message (str): message text to send.
             title (str|None): optional title/prefix. Defaults to class name.
+            user_ids (list|None): recipients, defaults to all configured users.
         """
         if title is None:
             title = self.__class__.__name__
+        if user_ids is None:
+            user_ids = self._telegram_user_ids
 
-        for user_id in self._telegram_user_ids:
+        for user_id in user_ids:
             self.log(f"Calling service telegram_bot/send_message with user_id {user_id} and message: {message}")
             self.call_service('telegram_bot/send_message',
                                 service_data={
@@ -1115,18 +1973,21 @@ class BaseApp(hass.Hass):
                                 }
             )
 
-    def notify_notify(self, message, title=None):
+    def notify_notify(self, message, title=None, targets=None):
         """
         Send a mobile notification to configured notify targets.
 
         Args:
             message (str): message text to send.
             title (str|None): optional title/prefix. Defaults to class name.
+            targets (list|None): mobile app targets, defaults to all configured targets.
         """
         if title is None:
             title = self.__class__.__name__
+        if targets is None:
+            targets = self._notify_targets
 
-        for target in self._notify_targets:
+        for target in targets:
             service_name = f"notify/mobile_app_{target}"
             self.log(f"Calling service {service_name} message: {message}")
             self.call_service(service_name,
@@ -1267,7 +2128,7 @@ class BaseApp(hass.Hass):
             language = 'en-US'
             if self._language == 'german':
                 language = 'de-DE'
-            self.log(f"Setting TTS language to {language}", level="DEBUG")
+            self.log_debug("Setting TTS language to %s", language)
             for media_player in self._tts_devices:
                 self.log(f"Calling service media_player/volume_set with media_player {media_player} and voulme: {volume_level}")
                 self.call_service("media_player/volume_set", entity_id=media_player, volume_level=volume_level)
@@ -1332,3 +2193,446 @@ class BaseApp(hass.Hass):
             str: translated string or a 'Missing translation' placeholder.
         """
         return self._translation.get(self._language, {}).get(message, f"Missing translation: {message}")
+
+
+class StateCounter:
+    """Per-state counts for a fixed list of entities, updated from state events.
+
+    Besides the counts it keeps the entities ordered by their last update so
+    "changed within the last N seconds" checks only walk the recent tail.
+    """
+
+    def __init__(self, entities):
+        self.entities = entities
+        self._states = {}
+        self._counts = {}
+        self._updated = OrderedDict()
+
+    def update(self, entity, state, last_updated=None):
+        """Record a new state (and optionally last_updated) for an entity.
+
+        Returns:
+            bool: True if the stored state changed.
+        """
+        old = self._states.get(entity)
+        changed = entity not in self._states or old != state
+        if changed:
+            if entity in self._states:
+                self._counts[old] -= 1
+            self._states[entity] = state
+            self._counts[state] = self._counts.get(state, 0) + 1
+        if last_updated is not None and self._updated.get(entity) != last_updated:
+            self._updated.pop(entity, None)
+            self._updated[entity] = last_updated
+        return changed
+
+    def count(self, state):
+        """Return the number of entities currently in `state`."""
+        return self._counts.get(state, 0)
+
+    def count_recent(self, seconds, now, exclude_state=None):
+        """Count entities updated less than `seconds` before `now`.
+
+        Args:
+            seconds (float): recency window.
+            now (datetime): reference UTC time.
+            exclude_state (str|None): skip entities currently in this state.
+
+        Returns:
+            int: number of recently updated entities.
+        """
+        count = 0
+        for entity, last_updated in reversed(self._updated.items()):
+            if (now - last_updated).total_seconds() >= seconds:
+                break
+            if exclude_state is None or self._states.get(entity) != exclude_state:
+                count = count + 1
+        return count
+
+    def last_updated(self):
+        """Return the most recent last_updated timestamp or None."""
+        if not self._updated:
+            return None
+        return next(reversed(self._updated.values()))
+
+    def snapshot(self):
+        """Return a copy of the entity -> state map."""
+        return dict(self._states)
+
+
+class NightSchedule:
+    """Night windows for today and tomorrow, resolved to epoch seconds.
+
+    The windows are built from the app's night settings and workday/holiday
+    state on first use each local day, so `is_night` is a plain integer
+    comparison. Call `invalidate` when a workday or holiday sensor changes.
+    """
+
+    def __init__(self, app):
+        self._app = app
+        self._day = None
+        self._windows = ()
+
+    def invalidate(self):
+        """Force the windows to be resolved again on next use."""
+        self._day = None
+
+    def windows(self, now):
+        """Return ((start, end), ...) for the nights ending today and tomorrow.
+
+        Args:
+            now (datetime): timezone-aware current time.
+
+        Returns:
+            tuple: (start, end) pairs as integer epoch seconds.
+        """
+        tz = self._app.get_local_timezone()
+        day = now.astimezone(tz).date()
+        if day != self._day:
+            self._windows = self._resolve(day, tz)
+            self._day = day
+        return self._windows
+
+    def _resolve(self, day, tz):
+        app = self._app
+        windows = []
+        # the night ending on a day uses that day's workday state
+        for offset, workday in enumerate((app.is_workday_today(), app.is_workday_tomorrow())):
+            end_day = day + timedelta(days=offset)
+            start_time = datetime.strptime(app._night_start_workday if workday else app._night_start, "%H:%M:%S").time()
+            end_time = datetime.strptime(app._night_end_workday if workday else app._night_end, "%H:%M:%S").time()
+            start_day = end_day - timedelta(days=1) if start_time > end_time else end_day
+            start = int(datetime.combine(start_day, start_time, tzinfo=tz).timestamp())
+            end = int(datetime.combine(end_day, end_time, tzinfo=tz).timestamp())
+            windows.append((start, end))
+        app.log_debug("Resolved night windows for %s: %s", day, windows)
+        return tuple(windows)
+
+    def is_night(self, now):
+        """Return True if `now` lies within one of the night windows."""
+        timestamp = int(now.timestamp())
+        for start, end in self.windows(now):
+            if start <= timestamp < end:
+                return True
+        return False
+
+    def seconds_until_night_end(self, now):
+        """Return seconds until the next night end, 0 if none is ahead."""
+        timestamp = int(now.timestamp())
+        for start, end in self.windows(now):
+            if timestamp < end:
+                return end - timestamp
+        return 0
+
+
+class NotificationDispatcher:
+    """Background notification delivery with one bounded queue per channel.
+
+    Each channel has its own worker threads (`concurrency`), so a slow
+    integration only delays its own channel. Jobs are ordered by priority,
+    lower first, then by submission order. Failed jobs are retried with
+    exponential backoff. When a queue is full, urgent (prio 0) jobs run
+    synchronously in the caller and other jobs are dropped.
+    """
+
+    CHANNELS = ("media", "telegram", "mobile", "persistent")
+
+    def __init__(self, app, queue_size=100, concurrency=1, retries=2, backoff=1.0):
+        self._app = app
+        self._retries = retries
+        self._backoff = backoff
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._queues = {}
+        self._workers = []
+        self._metrics = {}
+        for channel in self.CHANNELS:
+            limit = concurrency.get(channel, 1) if isinstance(concurrency, dict) else concurrency
+            self._queues[channel] = queue.PriorityQueue(maxsize=queue_size)
+            self._metrics[channel] = {"sent": 0, "failed": 0, "retried": 0, "dropped": 0,
+                                      "latency_last": 0.0, "latency_max": 0.0, "latency_total": 0.0}
+            for i in range(max(1, int(limit))):
+                worker = threading.Thread(target=self._run, args=(channel,),
+                                          name=f"{app.__class__.__name__}-notify-{channel}-{i}", daemon=True)
+                worker.start()
+                self._workers.append((channel, worker))
+
+    def submit(self, channel, priority, func, *args, **kwargs):
+        """Queue a notification job and return immediately.
+
+        Returns:
+            bool: True if the job was queued or run, False if it was dropped.
+        """
+        job = (priority, next(self._sequence), time.monotonic(), func, args, kwargs)
+        try:
+            self._queues[channel].put_nowait(job)
+            return True
+        except queue.Full:
+            pass
+
+        if priority == 0:
+            self._app.log(f"Notification queue {channel} is full, sending urgent message synchronously", level="WARNING")
+            self._deliver(channel, job)
+            return True
+
+        with self._lock:
+            self._metrics[channel]["dropped"] += 1
+        self._app.log(f"Notification queue {channel} is full, dropping message", level="WARNING")
+        return False
+
+    def _run(self, channel):
+        jobs = self._queues[channel]
+        while True:
+            job = jobs.get()
+            try:
+                if job[3] is None:
+                    return
+                self._deliver(channel, job)
+            finally:
+                jobs.task_done()
+
+    def _deliver(self, channel, job):
+        _, _, queued_at, func, args, kwargs = job
+        delay = self._backoff
+        for attempt in range(self._retries + 1):
+            try:
+                func(*args, **kwargs)
+                break
+            except Exception as e:
+                if attempt >= self._retries:
+                    with self._lock:
+                        self._metrics[channel]["failed"] += 1
+                    self._app.log(f"Notification via {channel} failed after {attempt + 1} attempts: {e}", level="ERROR")
+                    return
+                with self._lock:
+                    self._metrics[channel]["retried"] += 1
+                self._app.log(f"Notification via {channel} failed ({e}), retrying in {delay}s", level="WARNING")
+                time.sleep(delay)
+                delay = delay * 2
+
+        latency = time.monotonic() - queued_at
+        with self._lock:
+            metrics = self._metrics[channel]
+            metrics["sent"] += 1
+            metrics["latency_last"] = latency
+            metrics["latency_max"] = max(metrics["latency_max"], latency)
+            metrics["latency_total"] += latency
+
+    def join(self):
+        """Block until all queued jobs are processed."""
+        for jobs in self._queues.values():
+            jobs.join()
+
+    def stop(self, timeout=5):
+        """Let workers finish queued jobs and exit."""
+        for channel, _ in self._workers:
+            # sorts after every real job regardless of priority
+            try:
+                self._queues[channel].put((float("inf"), next(self._sequence), 0, None, (), {}), timeout=timeout)
+            except queue.Full:
+                self._app.log(f"Notification queue {channel} did not drain, abandoning worker", level="WARNING")
+        for _, worker in self._workers:
+            worker.join(timeout)
+        self._workers = []
+
+    def get_metrics(self):
+        """Return per-channel queue depth, counters and latency (seconds)."""
+        result = {}
+        with self._lock:
+            for channel, metrics in self._metrics.items():
+                entry = dict(metrics)
+                entry["depth"] = self._queues[channel].qsize()
+                entry["latency_avg"] = metrics["latency_total"] / metrics["sent"] if metrics["sent"] else 0.0
+                del entry["latency_total"]
+                result[channel] = entry
+        return result
+
+
+class Histogram:
+    """Fixed-size histogram with Prometheus-style `le` buckets.
+
+    Memory does not grow with the number of observations: values are only
+    counted into the bucket of the first upper bound they do not exceed,
+    with a final +Inf bucket for the rest.
+    """
+
+    def __init__(self, bounds):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self):
+        """Return [(upper_bound, observations <= bound)] including +Inf."""
+        return list(zip(self.bounds + (float("inf"),), itertools.accumulate(self.counts)))
+
+    def quantile(self, q):
+        """Return the upper bound of the bucket holding quantile `q`.
+
+        Values beyond the last bound report that bound, like Prometheus'
+        `histogram_quantile`.
+        """
+        if not self.count:
+            return 0
+        rank = q * self.count
+        for bound, seen in self.cumulative():
+            if seen >= rank:
+                return bound if bound != float("inf") else self.bounds[-1]
+        return self.bounds[-1]
+
+
+class CallbackStats:
+    """Instrumentation of one callback, see `BaseApp.instrument_callback`."""
+
+    LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+    COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+    def __init__(self):
+        self.invocations = 0
+        self.errors = 0
+        self.credit = 0.0
+        self.latency = Histogram(self.LATENCY_BUCKETS)
+        self.get_state = Histogram(self.COUNT_BUCKETS)
+        self.call_service = Histogram(self.COUNT_BUCKETS)
+
+    def record(self, seconds, get_state, call_service, failed=False):
+        self.latency.observe(seconds)
+        self.get_state.observe(get_state)
+        self.call_service.observe(call_service)
+        if failed:
+            self.errors += 1
+
+    def summary(self):
+        sampled = self.latency.count
+        return {
+            "invocations": self.invocations,
+            "sampled": sampled,
+            "errors": self.errors,
+            "latency_avg_ms": round(self.latency.sum / sampled * 1000, 3) if sampled else 0,
+            "latency_p50_ms": self.latency.quantile(0.5) * 1000,
+            "latency_p99_ms": self.latency.quantile(0.99) * 1000,
+            "get_state_avg": round(self.get_state.sum / sampled, 2) if sampled else 0,
+            "call_service_avg": round(self.call_service.sum / sampled, 2) if sampled else 0,
+        }
+
+
+class DeadlineHeap:
+    """Min-heap of per-key deadlines with lazy removal.
+
+    Each key has at most one live deadline; rescheduling or removing a key
+    leaves its old heap entry behind, which is skipped when it surfaces.
+    Deadlines are plain numbers, e.g. epoch seconds.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._deadlines = {}
+        self._sequence = itertools.count()
+
+    def __len__(self):
+        return len(self._deadlines)
+
+    def __contains__(self, key):
+        return key in self._deadlines
+
+    def schedule(self, key, when):
+        """Set the deadline of `key`, or remove it when `when` is None."""
+        if when is None:
+            self._deadlines.pop(key, None)
+            return
+        if self._deadlines.get(key) == when:
+            return
+        self._deadlines[key] = when
+        heapq.heappush(self._heap, (when, next(self._sequence), key))
+
+    def next_deadline(self):
+        """Return the earliest live deadline, or None when empty."""
+        heap = self._heap
+        while heap and self._deadlines.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def pop_due(self, now):
+        """Remove and return the keys whose deadline is <= `now`, earliest first."""
+        due = []
+        while True:
+            when = self.next_deadline()
+            if when is None or when > now:
+                return due
+            key = heapq.heappop(self._heap)[2]
+            del self._deadlines[key]
+            due.append(key)
+
+
+class BridgeHealth:
+    """Connection health of zigbee bridges/coordinators, kept from state events.
+
+    `stable_at` is the epoch time from which all bridges have been online
+    long enough (`stable_after` seconds since the last change), or infinity
+    while one is offline, so the gate check is a single comparison. A
+    bridge changing `flap_changes` times within `flap_window` seconds is
+    flapping and has to stay online for the whole window instead.
+    """
+
+    ONLINE_STATES = ("on", "online", "connected")
+
+    def __init__(self, entities, stable_after=300, flap_window=600, flap_changes=4):
+        self.entities = list(entities)
+        self.stable_after = stable_after
+        self.flap_window = flap_window
+        self.flap_changes = flap_changes
+        self.stable_at = math.inf
+        self._online = {}
+        self._changed = {}
+        self._changes = deque()
+
+    def update(self, entity, state, timestamp, transition=True):
+        """Record the state of a bridge at epoch `timestamp`.
+
+        Args:
+            transition (bool): False when seeding from the current state,
+                which does not count towards flapping.
+
+        Returns:
+            bool: True if the bridge went online or offline.
+        """
+        online = state in self.ONLINE_STATES
+        if entity in self._online and self._online[entity] == online:
+            return False
+        if transition and entity in self._online:
+            self._changes.append(timestamp)
+        self._online[entity] = online
+        self._changed[entity] = timestamp
+        self._recompute(timestamp)
+        return True
+
+    def _recompute(self, now):
+        if len(self._online) < len(self.entities) or not all(self._online.values()):
+            self.stable_at = math.inf
+            return
+        settle = self.flap_window if self.is_flapping(now) else self.stable_after
+        self.stable_at = max(self._changed.values()) + settle
+
+    def is_flapping(self, now):
+        """True when the bridges changed `flap_changes` times within the flap window."""
+        cutoff = now - self.flap_window
+        while self._changes and self._changes[0] < cutoff:
+            self._changes.popleft()
+        return len(self._changes) >= self.flap_changes
+
+    def is_stable(self, now):
+        """True when all bridges have been online long enough at epoch `now`."""
+        return now >= self.stable_at
+
+    def get_state(self, now):
+        """Return 'stable', 'settling', 'flapping' or 'offline'."""
+        if self.stable_at == math.inf:
+            return "offline"
+        if now >= self.stable_at:
+            return "stable"
+        return "flapping" if self.is_flapping(now) else "settling"
@@ -33,12 +33,28 @@ climate_control:
 See module docstring and inline examples for usage.
 """
 
-from base import BaseApp
+from base import BaseApp, cached_evaluation
 import inspect
 
 
+# climate services and their data key, in the order changes are applied
+CLIMATE_SERVICES = (
+    ("set_hvac_mode", "hvac_mode"),
+    ("set_temperature", "temperature"),
+    ("set_fan_mode", "fan_mode"),
+    ("set_preset_mode", "preset_mode"),
+)
+
+# attributes of a climate entity whose changes are recorded as control changes
+CLIMATE_CONTROL_ATTRIBUTES = ("temperature", "hvac_mode", "fan_mode", "preset_mode",
+                              "swing_mode", "swing_horizontal_mode")
+# attributes whose changes re-evaluate the climate once the entity has settled
+CLIMATE_RECHECK_ATTRIBUTES = ("temperature", "hvac_mode", "fan_mode", "preset_mode")
+CLIMATE_RECHECK_DELAY = 60
+
 
 class ClimateControl(BaseApp):
+    SNAPSHOT_ENTITY_LISTS = BaseApp.SNAPSHOT_ENTITY_LISTS + ("_climate_controls",)
 
     def initialize(self):
         super().initialize()
@@ -167,22 +183,10 @@ class ClimateControl(BaseApp):
             self.log(f"Listening for {vars(self)['_' + temptype + '_temperature_control']}")
             self.listen_state(self.sensor_change_callback, vars(self)['_' + temptype + '_temperature_control'] )
 
-        # change based on climate control
+        # change based on climate control: one listener per entity, record
+        # changes right away and act on them once the entity has settled
         for climate_control in self._climate_controls:
-            # record changes
-            self.listen_state(self.control_change_callback, climate_control)
-            self.listen_state(self.control_change_callback, climate_control, attribute="temperature")
-            self.listen_state(self.control_change_callback, climate_control, attribute="hvac_mode")
-            self.listen_state(self.control_change_callback, climate_control, attribute="fan_mode")
-            self.listen_state(self.control_change_callback, climate_control, attribute="preset_mode")
-            self.listen_state(self.control_change_callback, climate_control, attribute="swing_mode")
-            self.listen_state(self.control_change_callback, climate_control, attribute="swing_horizontal_mode")
-            # act on changes delayed
-            self.listen_state(self.sensor_change_callback, climate_control, duration=60)
-            self.listen_state(self.sensor_change_callback, climate_control, attribute="temperature", duration=60)
-            self.listen_state(self.sensor_change_callback, climate_control, attribute="hvac_mode", duration=60)
-            self.listen_state(self.sensor_change_callback, climate_control, attribute="fan_mode", duration=60)
-            self.listen_state(self.sensor_change_callback, climate_control, attribute="preset_mode", duration=60)
+            self.listen_state(self.climate_event_callback, climate_control, attribute="all")
 
         # listen for time changes
         if(self._night_start is not None):
@@ -208,19 +212,28 @@ class ClimateControl(BaseApp):
         # Set start time to now, aligning to the next full 10-minute mark
         self.run_every(self.periodic_time_callback, "now+10", 10 * 60)
 
-    def is_overheating(self):
+    def is_overheating(self, state=None):
         """Return True if external temperature indicates overheating.
 
         Uses configured max overheat allowance to determine if the external
         temperature significantly exceeds the desired temperature.
 
+        Args:
+            state (DesiredClimateState|None): inputs of the current pass; read
+                from Home Assistant when omitted.
+
         Returns:
             bool
         """
-        if self.get_external_temperature() is None:
+        if state is not None:
+            external_temperature = state.external_temperature
+        else:
+            external_temperature = self.get_external_temperature()
+        if external_temperature is None:
             return False
 
-        if self.get_external_temperature() > self.get_desired_temperature() + self._max_overheat_allowance:
+        desired_temperature = state.temperature if state is not None else self.get_desired_temperature()
+        if external_temperature > desired_temperature + self._max_overheat_allowance:
             return True
         
         return False
@@ -252,12 +265,13 @@ class ClimateControl(BaseApp):
             return True
         return False
 
-    def is_aqi_okay(self):
+    def is_aqi_okay(self, state=None):
         """Return True if AQI measurement is below configured threshold.
 
         Returns True if no AQI sensor is configured or the reading is unavailable.
+        The reading of `state` is used when given.
         """
-        value_sensor = self.get_aqi_measurement()
+        value_sensor = state.aqi if state is not None else self.get_aqi_measurement()
         if value_sensor is None:
             return True
 
@@ -266,12 +280,13 @@ class ClimateControl(BaseApp):
 
         return True
 
-    def is_voc_okay(self):
+    def is_voc_okay(self, state=None):
         """Return True if VOC measurement is below configured threshold.
 
         Returns True if no VOC sensor is configured or the reading is unavailable.
+        The reading of `state` is used when given.
         """
-        value_sensor = self.get_voc_measurement()
+        value_sensor = state.voc if state is not None else self.get_voc_measurement()
         if value_sensor is None:
             return True
 
@@ -280,12 +295,13 @@ class ClimateControl(BaseApp):
 
         return True
 
-    def is_co2_okay(self):
+    def is_co2_okay(self, state=None):
         """Return True if CO2 measurement is below configured threshold.
 
         Returns True if no CO2 sensor is configured or the reading is unavailable.
+        The reading of `state` is used when given.
         """
-        value_sensor = self.get_co2_measurement()
+        value_sensor = state.co2 if state is not None else self.get_co2_measurement()
         if value_sensor is None:
             return True
 
@@ -312,12 +328,15 @@ class ClimateControl(BaseApp):
         else:
             return False
 
-    def get_current_status(self):
+    def get_current_status(self, summer=None):
         """Determine the current climate status string.
 
         Possible return values: 'summer', 'open', 'vacation', 'night', 'home', 'away', 'motion'.
+
+        Args:
+            summer (bool|None): result of `is_summer()` when already known.
         """
-        if self.is_summer():
+        if self.is_summer() if summer is None else summer:
             return "summer"
         elif(self.count_on_opening_sensors() > 0):
             return "open"
@@ -460,21 +479,26 @@ class ClimateControl(BaseApp):
             float or None: desired temperature (including offset) or None if not set.
         """
         if vars(self)['_' + status + '_temperature_control'] is None:
-            self.log(f"{'self._' + status + '_temperature_control'} is None", level="DEBUG")
+            self.log_debug("self._%s_temperature_control is None", status)
             if vars(self)['_' + status + '_temperature'] is None:
-                self.log(f"{'self._' + status + '_temperature'} is None", level="DEBUG")
+                self.log_debug("self._%s_temperature is None", status)
                 return None
             return float(vars(self)['_' + status+ '_temperature']) + float(self._offset_temperature)
         else:
             return float(self.get_state(vars(self)['_' + status + '_temperature_control'])) + float(self._offset_temperature)
 
-    def get_desired_temperature(self):
+    def get_desired_temperature(self, status=None):
         """Return the effective desired temperature considering status and minimum.
 
         Returns the desired temperature for the current status, bounded by the
         configured minimum temperature.
+
+        Args:
+            status (str|None): status when already known, see `get_current_status()`.
         """
-        desired_temp = self.get_desired_temperature_by_status(self.get_current_status())
+        if status is None:
+            status = self.get_current_status()
+        desired_temp = self.get_desired_temperature_by_status(status)
         if desired_temp is None:
             return self._min_temperature
         return float(max(desired_temp, self._min_temperature))
@@ -483,48 +507,53 @@ class ClimateControl(BaseApp):
         """Return the desired HVAC mode configured for a given status."""
         return vars(self)['_' + status + '_hvac_mode']
 
-    def get_desired_hvac_mode(self, entity_id = None):
+    def get_desired_hvac_mode(self, entity_id = None, state = None):
         """Compute desired HVAC mode for the current status and entity.
 
         The computed mode considers overheating, air quality and device fan support.
 
         Args:
             entity_id (str|None): optional climate entity id used to check feature support.
+            state (DesiredClimateState|None): inputs of the current pass; read
+                from Home Assistant when omitted.
 
         Returns:
             str: desired hvac mode string.
         """
-        desired_mode = self.get_desired_hvac_mode_by_status(self.get_current_status())
+        if state is None:
+            state = self.get_desired_climate_state()
+
+        desired_mode = self.get_desired_hvac_mode_by_status(state.status)
 
         fan_supported = False
         if entity_id is not None:
             fan_supported = self.is_fan_mode_supported(entity_id, 'Auto')
 
-        if self.is_overheating():
+        if self.is_overheating(state):
             if (
                 fan_supported
-                and self.is_somebody_at_home()
-                and self.count_on_opening_sensors() == 0
-                and self.get_external_temperature() > self._fan_overheat_temperature
-                and not self.is_summer()
-                and not self.is_time_in_night_window()
+                and state.somebody_home
+                and state.open_openings == 0
+                and state.external_temperature > self._fan_overheat_temperature
+                and not state.summer
+                and not state.night
             ):              
                 desired_mode = 'fan_only'
             else:
                 desired_mode = 'off'
-            self.log(f"Setting desired hvac mode to off {desired_mode} to overheat", level="DEBUG")
+            self.log_debug("Setting desired hvac mode to off %s to overheat", desired_mode)
 
         if desired_mode == 'off' and fan_supported:
             # If air quality is poor, someone is home, no windows are open and
             # either it's not night or night-time cleanup is allowed, then use
             # fan_only instead of remaining off.
-            air_bad = (not self.is_aqi_okay()) or (not self.is_voc_okay())
-            someone_home = self.is_somebody_at_home()
-            windows_closed = self.count_on_opening_sensors() == 0
-            night_ok = (not self.is_time_in_night_window()) or self.is_cleanup_air_at_night_enabled()
+            air_bad = (not self.is_aqi_okay(state)) or (not self.is_voc_okay(state))
+            someone_home = state.somebody_home
+            windows_closed = state.open_openings == 0
+            night_ok = (not state.night) or self.is_cleanup_air_at_night_enabled()
 
             if air_bad and someone_home and windows_closed and night_ok:
-                self.log("Setting desired hvac mode to fan_only due to bad air", level="DEBUG")
+                self.log_debug("Setting desired hvac mode to fan_only due to bad air")
                 desired_mode = 'fan_only'
 
         return desired_mode
@@ -562,11 +591,12 @@ class ClimateControl(BaseApp):
         """Return the current fan mode attribute of a climate entity."""
         return self.get_state(entity_id, attribute = "fan_mode")
 
-    def get_desired_fan_mode(self, entity_id = None):
+    def get_desired_fan_mode(self, entity_id = None, state = None):
         """Compute the desired fan mode based on air quality and time.
 
         If an entity is provided, the function first checks whether the entity
         supports the configured 'Auto' option. Returns None when unsupported.
+        Night window and air quality are taken from `state` when given.
         """
         desired_mode = "Auto"
 
@@ -574,7 +604,8 @@ class ClimateControl(BaseApp):
             if not self.is_fan_mode_supported(entity_id, 'Auto'):
                 return None
 
-        if self.is_time_in_night_window():
+        night = state.night if state is not None else self.is_time_in_night_window()
+        if night:
             return desired_mode
 
         mapping = {
@@ -584,9 +615,9 @@ class ClimateControl(BaseApp):
             3: 'High',
         }
 
+        aqi_reading = state.aqi if state is not None else self.get_aqi_measurement()
         aqi_value = 0
-        if self.get_aqi_measurement() is not None:
-            aqi_reading = self.get_aqi_measurement()
+        if aqi_reading is not None:
             if aqi_reading > self._aqi_threshold * 3:
                 aqi_value = 3
             elif aqi_reading > self._aqi_threshold * 2:
@@ -596,9 +627,9 @@ class ClimateControl(BaseApp):
             elif aqi_reading > self._aqi_threshold:
                 aqi_value = 0
 
+        voc_reading = state.voc if state is not None else self.get_voc_measurement()
         voc_value = 0
-        if self.get_voc_measurement() is not None:
-            voc_reading = self.get_voc_measurement()
+        if voc_reading is not None:
             if voc_reading > self._voc_threshold * 10:
                 voc_value = 3
             elif voc_reading > self._voc_threshold * 3:
@@ -612,28 +643,44 @@ class ClimateControl(BaseApp):
 
         return desired_mode
 
-    def set_optimal_fan_mode(self, entity_id):
-        """Set the fan mode on the entity to the computed optimal value.
+    def get_fan_mode_change(self, entity_id, state):
+        """Return the fan mode to set on the entity, or None when nothing should change.
 
         Performs support checks and avoids changes during cooling/summer.
         """
-        if self.get_desired_fan_mode() is None:
+        desired_mode = state.fan_modes.get(entity_id)
+
+        if desired_mode is None:
             self.log(f"[{entity_id}] Cannot set optimal fan mode: Desired setting is None.", level="ERROR")
-            return
+            return None
 
-        if self.is_summer() and self.is_cooling(entity_id):
+        if state.summer and self.is_cooling(entity_id):
             self.log(f"[{entity_id}] Cannot set optimal fan mode: Device is cooling during summer.")
-            return
+            return None
 
-        if self.get_current_fan_mode(entity_id) == self.get_desired_fan_mode():
+        if self.get_current_fan_mode(entity_id) == desired_mode:
             self.log(f"[{entity_id}] Optimal fan mode is already set.")
-            return
+            return None
 
-        if not self.is_fan_mode_supported(entity_id, self.get_desired_fan_mode(entity_id)):
-            self.log(f"[{entity_id}] Cannot set optimal fan mode: Device does not support fan mode {self.get_desired_fan_mode(entity_id)}.", level="ERROR")
-            return
+        if not self.is_fan_mode_supported(entity_id, desired_mode):
+            self.log(f"[{entity_id}] Cannot set optimal fan mode: Device does not support fan mode {desired_mode}.", level="ERROR")
+            return None
+
+        return desired_mode
 
-        self.set_fan_mode(entity_id, self.get_desired_fan_mode(entity_id))
+    def set_optimal_fan_mode(self, entity_id, state = None):
+        """Set the fan mode on the entity to the computed optimal value.
+
+        Args:
+            entity_id (str): climate entity id.
+            state (DesiredClimateState|None): desired state of the current pass;
+                computed for `entity_id` when omitted.
+        """
+        if state is None:
+            state = self.get_desired_climate_state([entity_id])
+        fan_mode = self.get_fan_mode_change(entity_id, state)
+        if fan_mode is not None:
+            self.set_fan_mode(entity_id, fan_mode)
 
     def get_current_preset_mode(self, entity_id):
         """Return the current preset_mode attribute for a climate entity."""
@@ -652,73 +699,190 @@ class ClimateControl(BaseApp):
 
         return desired_mode
 
-    def set_optimal_preset_mode(self, entity_id):
-        """Set the optimal preset mode on the entity, with checks for support and state."""
-        if self.get_desired_preset_mode() is None:
+    def get_preset_mode_change(self, entity_id, state):
+        """Return the preset mode to set on the entity, or None when nothing should change."""
+        desired_mode = state.preset_modes.get(entity_id)
+
+        if desired_mode is None:
             self.log(f"[{entity_id}] Cannot set optimal preset mode: Desired setting is None.")
-            return
+            return None
 
-        if self.is_summer() and self.is_cooling(entity_id):
+        if state.summer and self.is_cooling(entity_id):
             self.log(f"[{entity_id}] Cannot set optimal preset mode: Device is cooling during summer.")
-            return
+            return None
 
-        if self.get_current_preset_mode(entity_id) == self.get_desired_preset_mode():
+        if self.get_current_preset_mode(entity_id) == desired_mode:
             self.log(f"[{entity_id}] Optimal preset mode is already set.")
-            return
+            return None
 
-        if not self.is_preset_mode_supported(entity_id, self.get_desired_preset_mode(entity_id)):
-            self.log(f"[{entity_id}] Cannot set optimal preset mode: Device does not support preset mode {self.get_desired_preset_mode(entity_id)}.", level="ERROR")
-            return
+        if not self.is_preset_mode_supported(entity_id, desired_mode):
+            self.log(f"[{entity_id}] Cannot set optimal preset mode: Device does not support preset mode {desired_mode}.", level="ERROR")
+            return None
+
+        return desired_mode
 
-        self.set_preset_mode(entity_id, self.get_desired_preset_mode(entity_id))
+    def set_optimal_preset_mode(self, entity_id, state = None):
+        """Set the optimal preset mode on the entity, with checks for support and state."""
+        if state is None:
+            state = self.get_desired_climate_state([entity_id])
+        preset_mode = self.get_preset_mode_change(entity_id, state)
+        if preset_mode is not None:
+            self.set_preset_mode(entity_id, preset_mode)
 
     def get_current_hvac_mode(self, entity_id):
         """Return the current HVAC mode (state) of the climate entity."""
         return self.get_state(entity_id)
 
-    def set_optimal_hvac_mode(self, entity_id):
-        """Apply the desired HVAC mode to the entity if it's supported and needed."""
-        if self.get_desired_hvac_mode() is None:
+    def get_hvac_mode_change(self, entity_id, state):
+        """Return the hvac mode to set on the entity, or None when nothing should change."""
+        desired_mode = state.hvac_modes.get(entity_id)
+
+        if desired_mode is None:
             self.log(f"[{entity_id}] Cannot set optimal hvac mode: Desired setting is None.", level="ERROR")
-            return
+            return None
 
-        if self.is_summer() and self.is_cooling(entity_id):
+        if state.summer and self.is_cooling(entity_id):
             self.log(f"[{entity_id}] Cannot set optimal hvac mode: Device is cooling during summer.")
-            return
+            return None
 
-        if self.get_current_hvac_mode(entity_id) == self.get_desired_hvac_mode(entity_id):
+        if self.get_current_hvac_mode(entity_id) == desired_mode:
             self.log(f"[{entity_id}] Optimal hvac mode is already set.")
-            return
+            return None
 
-        self.set_hvac_mode(entity_id, self.get_desired_hvac_mode(entity_id))
+        return desired_mode
 
-    def set_optimal_temperature(self, entity_id):
-        """Enforce the desired temperature on the entity with safety checks.
+    def set_optimal_hvac_mode(self, entity_id, state = None):
+        """Apply the desired HVAC mode to the entity if it's supported and needed."""
+        if state is None:
+            state = self.get_desired_climate_state([entity_id])
+        hvac_mode = self.get_hvac_mode_change(entity_id, state)
+        if hvac_mode is not None:
+            self.set_hvac_mode(entity_id, hvac_mode)
+
+    def get_temperature_change(self, entity_id, state):
+        """Return the temperature to set on the entity, or None when nothing should change.
 
         Avoids making changes during cooling/summer or when the HVAC is off.
-        Records the change as an internal change.
         """
-        if self.get_desired_temperature() is None:
+        if state.temperature is None:
             self.log(f"[{entity_id}] Cannot set optimal temperature: Desired temperature is None.", level="ERROR")
-            return
+            return None
 
-        if self.is_summer() and self.is_cooling(entity_id):
+        if state.summer and self.is_cooling(entity_id):
             self.log(f"[{entity_id}] Cannot set optimal temperature: Device is cooling during summer.")
-            return
+            return None
 
-        if self.get_desired_hvac_mode(entity_id) == 'off':
+        if state.hvac_modes.get(entity_id) == 'off':
             self.log(f"[{entity_id}] Cannot set optimal temperature: Desired hvac mode is off.")
-            return
+            return None
 
         # if self.is_overheating():
         #     self.log(f"[{entity_id}] Cannot set optimal temperature: Room is overheating.")
-        #     return
+        #     return None
 
-        if self.get_target_temperature(entity_id) == self.get_desired_temperature():
+        if self.get_target_temperature(entity_id) == state.temperature:
             self.log(f"[{entity_id}] Optimal temperature is already set.")
-            return
+            return None
+
+        return state.temperature
+
+    def set_optimal_temperature(self, entity_id, state = None):
+        """Enforce the desired temperature on the entity with safety checks.
+
+        Records the change as an internal change.
+        """
+        if state is None:
+            state = self.get_desired_climate_state([entity_id])
+        temperature = self.get_temperature_change(entity_id, state)
+        if temperature is not None:
+            self.set_temperature(entity_id, temperature)
+
+    def get_desired_climate_state(self, entities = ()):
+        """Compute the desired climate settings of one pass in a single read.
 
-        self.set_temperature(entity_id, self.get_desired_temperature())
+        Weather, presence, openings and air quality are read once; status,
+        temperature and the per-entity hvac, fan and preset modes are derived
+        from those readings, so `update_climate` and the `set_optimal_*`
+        methods agree on one set of inputs.
+
+        Args:
+            entities (iterable): climate entity ids to compute modes for.
+
+        Returns:
+            DesiredClimateState
+        """
+        summer = self.is_summer()
+        status = self.get_current_status(summer)
+        state = DesiredClimateState(
+            status=status,
+            summer=summer,
+            temperature=self.get_desired_temperature(status),
+            external_temperature=self.get_external_temperature(),
+            aqi=self.get_aqi_measurement(),
+            voc=self.get_voc_measurement(),
+            co2=self.get_co2_measurement(),
+            night=self.is_time_in_night_window(),
+            somebody_home=self.is_somebody_at_home(),
+            open_openings=self.count_on_opening_sensors(),
+        )
+        for entity_id in entities:
+            state.hvac_modes[entity_id] = self.get_desired_hvac_mode(entity_id, state)
+            state.fan_modes[entity_id] = self.get_desired_fan_mode(entity_id, state)
+            state.preset_modes[entity_id] = self.get_desired_preset_mode(entity_id)
+        return state
+
+    def get_climate_changes(self, state, entities):
+        """Diff the desired state against the actual settings of all entities.
+
+        Entities that need the same setting changed to the same value are
+        grouped, so each group costs one service call. Hvac mode changes come
+        first, so a device is switched on before it gets its setpoint.
+
+        Args:
+            state (DesiredClimateState): desired state of the current pass.
+            entities (iterable): climate entity ids to diff.
+
+        Returns:
+            list[tuple]: (service, data key, value, entity ids) in apply order.
+        """
+        groups = {}
+        for entity_id in entities:
+            hvac_mode = self.get_hvac_mode_change(entity_id, state)
+            if hvac_mode is not None and not self.is_hvac_mode_supported(entity_id, hvac_mode):
+                self.log(f"[{entity_id}] Does not support hvac_mode {hvac_mode}", level="ERROR")
+                hvac_mode = None
+            changes = {
+                'hvac_mode': hvac_mode,
+                'temperature': self.get_temperature_change(entity_id, state),
+            }
+            if self.is_fan_mode_supported(entity_id):
+                changes['fan_mode'] = self.get_fan_mode_change(entity_id, state)
+            if self.is_preset_mode_supported(entity_id):
+                changes['preset_mode'] = self.get_preset_mode_change(entity_id, state)
+            for key, value in changes.items():
+                if value is not None:
+                    groups.setdefault((key, value), []).append(entity_id)
+
+        order = {key: i for i, (_, key) in enumerate(CLIMATE_SERVICES)}
+        services = {key: service for service, key in CLIMATE_SERVICES}
+        return [(services[key], key, value, members)
+                for (key, value), members in sorted(groups.items(), key=lambda group: order[group[0][0]])]
+
+    def apply_climate_changes(self, changes):
+        """Apply the groups of `get_climate_changes()` with one service call each.
+
+        The internal change is recorded once for the whole batch.
+
+        Returns:
+            int: number of service calls made.
+        """
+        if not changes:
+            return 0
+        for service, key, value, entities in changes:
+            self.log(f"Calling service climate/{service} with entity_id {entities} and {key}: {value}")
+            self.call_service_per_domain(service, entities, **{key: value})
+        self.record_internal_change()
+        return len(changes)
 
     def periodic_time_callback(self, kwargs):
         """Scheduled callback executed at configured times to trigger updates."""
@@ -753,12 +917,44 @@ class ClimateControl(BaseApp):
 
         super().control_change_callback(entity, attribute, old, new, kwargs)
 
+    def climate_event_callback(self, entity, attribute, old, new, kwargs):
+        """Single listener per climate entity, registered with attribute="all".
+
+        Changes of the state and of CLIMATE_CONTROL_ATTRIBUTES are passed to
+        `control_change_callback` one by one. Changes of the state and of
+        CLIMATE_RECHECK_ATTRIBUTES (re)schedule one delayed re-evaluation,
+        which runs once the entity has not changed for CLIMATE_RECHECK_DELAY
+        seconds.
+        """
+        old = old or {}
+        new = new or {}
+        old_attributes = old.get("attributes") or {}
+        new_attributes = new.get("attributes") or {}
+
+        changes = []
+        if old.get("state") != new.get("state"):
+            changes.append(("state", old.get("state"), new.get("state")))
+        for key in CLIMATE_CONTROL_ATTRIBUTES:
+            if old_attributes.get(key) != new_attributes.get(key):
+                changes.append((key, old_attributes.get(key), new_attributes.get(key)))
+
+        for key, old_value, new_value in changes:
+            self.control_change_callback(entity, key, old_value, new_value, kwargs)
+
+        if any(key == "state" or key in CLIMATE_RECHECK_ATTRIBUTES for key, _, _ in changes):
+            self.schedule_recheck((entity, "delayed"), CLIMATE_RECHECK_DELAY, self.climate_recheck, entity)
+
+    def climate_recheck(self, entity):
+        """Re-evaluate the climate once a climate entity has settled."""
+        self.sensor_change_callback(entity, "state", None, self.get_state(entity), {})
+
     def sensor_change_callback(self, entity, attribute, old, new, kwargs):
         """Handle generic sensor changes and trigger an immediate climate update."""
         self.log(f"{inspect.currentframe().f_code.co_name} from {entity}:{attribute} {old}->{new}")
 
-        self.update_climate()
+        self.request_evaluation(self.update_climate)
 
+    @cached_evaluation
     def update_climate(self):
         """Main update loop: evaluate status and apply optimal settings to devices.
 
@@ -766,32 +962,34 @@ class ClimateControl(BaseApp):
         modes when internal change policy allows it.
         """
         self.log("=== Updating climate controls ===")
+
+        state = self.get_desired_climate_state(self._climate_controls)
         
         # Status and temperature overview
-        self.log(f"Status: {self.get_current_status()} | External: {self.get_external_temperature()}°C | Outside: {self.get_outside_temperature()}°C | Max today/tomorrow: {self.get_max_outside_temperature_today()}°C/{self.get_max_outside_temperature_tomorrow()}°C")
+        self.log(f"Status: {state.status} | External: {state.external_temperature}°C | Outside: {self.get_outside_temperature()}°C | Max today/tomorrow: {self.get_max_outside_temperature_today()}°C/{self.get_max_outside_temperature_tomorrow()}°C")
         
         # Air quality measurements (only if available)
         air_quality = []
-        if self.get_aqi_measurement() is not None:
-            air_quality.append(f"AQI: {self.get_aqi_measurement()}")
-        if self.get_voc_measurement() is not None:
-            air_quality.append(f"VOC: {self.get_voc_measurement()}µg/m³")
-        if self.get_co2_measurement() is not None:
-            air_quality.append(f"CO₂: {self.get_co2_measurement()}ppm")
+        if state.aqi is not None:
+            air_quality.append(f"AQI: {state.aqi}")
+        if state.voc is not None:
+            air_quality.append(f"VOC: {state.voc}µg/m³")
+        if state.co2 is not None:
+            air_quality.append(f"CO₂: {state.co2}ppm")
         
         if air_quality:
             self.log(f"Air Quality: {' | '.join(air_quality)}")
 
         # Check for critical conditions (compact warnings)
         warnings = []
-        if not self.is_aqi_okay():
-            warnings.append(f"AQI: {self.get_aqi_measurement()}")
-        if not self.is_voc_okay():
-            warnings.append(f"VOC: {self.get_voc_measurement()}µg/m³")
-        if not self.is_co2_okay():
-            warnings.append(f"CO₂: {self.get_co2_measurement()}ppm")
-        if self.is_overheating():
-            warnings.append(f"Overheating: {self.get_external_temperature()}°C")
+        if not self.is_aqi_okay(state):
+            warnings.append(f"AQI: {state.aqi}")
+        if not self.is_voc_okay(state):
+            warnings.append(f"VOC: {state.voc}µg/m³")
+        if not self.is_co2_okay(state):
+            warnings.append(f"CO₂: {state.co2}ppm")
+        if self.is_overheating(state):
+            warnings.append(f"Overheating: {state.external_temperature}°C")
         
         if warnings:
             self.log(f"⚠️  CRITICAL CONDITIONS: {' | '.join(warnings)}", level="WARNING")
@@ -799,31 +997,26 @@ class ClimateControl(BaseApp):
         for climate_control in self._climate_controls:
 
             # Temperature status
-            self.log(f"[{climate_control}] Temp: {self.get_current_temperature(climate_control)}°C (current) | {self.get_target_temperature(climate_control)}°C (target) | {self.get_desired_temperature()}°C (desired)")
+            self.log(f"[{climate_control}] Temp: {self.get_current_temperature(climate_control)}°C (current) | {self.get_target_temperature(climate_control)}°C (target) | {state.temperature}°C (desired)")
 
             # HVAC mode status
-            self.log(f"[{climate_control}] HVAC: {self.get_current_hvac_mode(climate_control)} (current) → {self.get_desired_hvac_mode(climate_control)} (desired)")
+            self.log(f"[{climate_control}] HVAC: {self.get_current_hvac_mode(climate_control)} (current) → {state.hvac_modes[climate_control]} (desired)")
 
             # Fan and preset modes (only if supported)
             mode_info = []
             if self.is_fan_mode_supported(climate_control):
-                mode_info.append(f"Fan: {self.get_current_fan_mode(climate_control)} → {self.get_desired_fan_mode(climate_control)}")
+                mode_info.append(f"Fan: {self.get_current_fan_mode(climate_control)} → {state.fan_modes[climate_control]}")
             if self.is_preset_mode_supported(climate_control):
-                mode_info.append(f"Preset: {self.get_current_preset_mode(climate_control)} → {self.get_desired_preset_mode(climate_control)}")
+                mode_info.append(f"Preset: {self.get_current_preset_mode(climate_control)} → {state.preset_modes[climate_control]}")
             
             if mode_info:
                 self.log(f"[{climate_control}] {' | '.join(mode_info)}")
 
-            if(self.is_internal_change_allowed()):
-                self.set_optimal_temperature(climate_control)
-                self.set_optimal_hvac_mode(climate_control)
-                if self.is_fan_mode_supported(climate_control):
-                    self.set_optimal_fan_mode(climate_control)
-                if self.is_preset_mode_supported(climate_control):
-                    self.set_optimal_preset_mode(climate_control)
-            else:
-                remaining_seconds = self.get_remaining_seconds_before_internal_change_is_allowed()
-                self.log(f"[{climate_control}] Doing nothing: Internal change is not allowed for {remaining_seconds:.2f} more seconds.")
+        if(self.is_internal_change_allowed()):
+            self.apply_climate_changes(self.get_climate_changes(state, self._climate_controls))
+        else:
+            remaining_seconds = self.get_remaining_seconds_before_internal_change_is_allowed()
+            self.log(f"Doing nothing: Internal change is not allowed for {remaining_seconds:.2f} more seconds.")
 
 
     def set_temperature(self, entity_id, temperature):
@@ -899,12 +1092,12 @@ class ClimateControl(BaseApp):
         If fan_mode is None, returns True when the entity reports any fan_modes.
         """
         fan_modes = self.get_state(entity_id, attribute='fan_modes')
-        self.log(f"[{entity_id}] Got fan modes: {fan_modes}", level="DEBUG")
+        self.log_debug("[%s] Got fan modes: %s", entity_id, fan_modes)
         if fan_modes is None:
             return False
         if fan_mode is None:
             return True
-        self.log(f"[{entity_id}] Fan mode {fan_mode} in valid fan modes {fan_modes}: {fan_mode in fan_modes}", level="DEBUG")
+        self.log_debug("[%s] Fan mode %s in valid fan modes %s: %s", entity_id, fan_mode, fan_modes, fan_mode in fan_modes)
         return fan_mode in fan_modes
 
     def set_fan_mode(self, entity_id, fan_mode = 'Auto'):
@@ -937,12 +1130,12 @@ class ClimateControl(BaseApp):
         If preset_mode is None, returns True when any presets are reported.
         """
         preset_modes = self.get_state(entity_id, attribute='preset_modes')
-        self.log(f"[{entity_id}] Got preset modes: {preset_modes}", level="DEBUG")
+        self.log_debug("[%s] Got preset modes: %s", entity_id, preset_modes)
         if preset_modes is None:
             return False
         if preset_mode is None:
             return True
-        self.log(f"[{entity_id}] preset mode {preset_mode} in valid preset modes {preset_modes}: {preset_mode in preset_modes}", level="DEBUG")
+        self.log_debug("[%s] preset mode %s in valid preset modes %s: %s", entity_id, preset_mode, preset_modes, preset_mode in preset_modes)
         return preset_mode in preset_modes
 
     def set_preset_mode(self, entity_id, preset_mode = 'none'):
@@ -971,4 +1164,37 @@ class ClimateControl(BaseApp):
                         entity_id=entity_id, preset_mode=preset_mode)
 
         self.record_internal_change()
-        #none, quiet, powerful
\ No newline at end of file
+        #none, quiet, powerful
+
+
+class DesiredClimateState:
+    """Inputs and desired settings of one `ClimateControl.update_climate` pass.
+
+    Built by `ClimateControl.get_desired_climate_state()`. The input readings
+    (status, summer, external temperature, air quality, night window,
+    presence and open openings) are shared by all entities; the desired
+    hvac, fan and preset modes are kept per climate entity.
+    """
+
+    __slots__ = ("status", "summer", "temperature", "external_temperature", "aqi", "voc", "co2",
+                 "night", "somebody_home", "open_openings", "hvac_modes", "fan_modes", "preset_modes")
+
+    def __init__(self, status, summer, temperature, external_temperature=None, aqi=None, voc=None, co2=None,
+                 night=False, somebody_home=False, open_openings=0):
+        self.status = status
+        self.summer = summer
+        self.temperature = temperature
+        self.external_temperature = external_temperature
+        self.aqi = aqi
+        self.voc = voc
+        self.co2 = co2
+        self.night = night
+        self.somebody_home = somebody_home
+        self.open_openings = open_openings
+        self.hvac_modes = {}
+        self.fan_modes = {}
+        self.preset_modes = {}
+
+    def __repr__(self):
+        return (f"DesiredClimateState(status={self.status!r}, temperature={self.temperature!r}, "
+                f"hvac_modes={self.hvac_modes!r}, fan_modes={self.fan_modes!r}, preset_modes={self.preset_modes!r})")
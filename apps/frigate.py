@@ -12,12 +12,13 @@ Key configuration keys:
 See module docstring and inline examples for usage.
 """
 
-from base import BaseApp
+from base import BaseApp, cached_evaluation
 import inspect
 
 
 
 class FrigateControl(BaseApp):
+    SNAPSHOT_ENTITY_LISTS = BaseApp.SNAPSHOT_ENTITY_LISTS + ("_frigate_switches", "_frigate_cameras")
 
     def initialize(self):
         """
@@ -78,6 +79,7 @@ class FrigateControl(BaseApp):
         self.log("Startup finished")
 
 
+    @cached_evaluation
     def setup(self):
         """
         Evaluate configured sensors and decide whether to (de)activate Frigate.
@@ -154,7 +156,7 @@ class FrigateControl(BaseApp):
 
         self.log(f"{inspect.currentframe().f_code.co_name} from {entity}:{attribute} {old}->{new}")
 
-        self.setup()
+        self.request_evaluation(self.setup)
 
     def count_switches(self, state = None):
         """Return number of configured switches optionally filtered by state.
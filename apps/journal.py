@@ -0,0 +1,187 @@
+"""Append-only event journal for AlarmControl.
+
+Records are small dicts written as JSON lines to `journal_path` by a
+background writer thread, so callbacks only pay for a queue put. When the
+active file grows beyond `journal_max_bytes` it is rotated into a
+gzip-compressed columnar segment next to it (`<path>.<n>.json.gz`), which
+stores each field as one column and repeated strings (kinds, entity ids,
+states) once.
+
+Record fields:
+- ts: UTC epoch seconds
+- kind: 'sensor', 'presence', 'arming', 'trigger', 'notification' or 'state'
+- entity, old, new: entity id and transition, where applicable
+- data: optional dict with extra details
+
+`read_journal(path)` yields all records, rotated segments first, and
+`scripts/replay_journal.py` feeds a journal back through AlarmControl.
+"""
+
+from pathlib import Path
+import gzip
+import json
+import os
+import queue
+import threading
+
+
+class AlarmJournal:
+    """Background writer for an append-only JSONL journal with rotation.
+
+    `record()` never blocks: when the queue is full the record is dropped
+    and counted. The writer thread takes up to `batch_size` records at a
+    time, appends them with a single write and flushes at least every
+    `flush_interval` seconds.
+    """
+
+    COLUMNS = ("ts", "kind", "entity", "old", "new", "data")
+    ENCODED_COLUMNS = ("kind", "entity", "old", "new")
+
+    def __init__(self, path, max_bytes=5 * 1024 * 1024, batch_size=100, flush_interval=1.0,
+                 queue_size=10000, keep_segments=10):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.keep_segments = keep_segments
+        self.written = 0
+        self.dropped = 0
+        self.rotations = 0
+        self._lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=queue_size)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = threading.Thread(target=self._run, name=f"journal-{self.path.name}", daemon=True)
+        self._writer.start()
+
+    def record(self, ts, kind, entity=None, old=None, new=None, data=None):
+        """Queue a record for writing; returns False if it was dropped."""
+        item = {"ts": ts, "kind": kind, "entity": entity, "old": old, "new": new, "data": data}
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch = []
+            while True:
+                if item is None:
+                    stopping = True
+                else:
+                    batch.append(item)
+                self._queue.task_done()
+                if stopping or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._write(batch)
+
+    def _write(self, batch):
+        lines = "".join(json.dumps(item, separators=(",", ":"), default=str) + "\n" for item in batch)
+        with open(self.path, "a", encoding="utf8") as f:
+            f.write(lines)
+            size = f.tell()
+        with self._lock:
+            self.written += len(batch)
+        if size >= self.max_bytes:
+            self.rotate()
+
+    def rotate(self):
+        """Convert the active file into the next columnar segment and start a new one."""
+        if not self.path.exists():
+            return
+        records = list(read_jsonl(self.path))
+        segments = list_segments(self.path)
+        number = int(segments[-1].name[len(self.path.name) + 1:].split(".")[0]) + 1 if segments else 1
+        target = self.path.with_name(f"{self.path.name}.{number}.json.gz")
+        tmp = target.with_name(target.name + ".tmp")
+        with gzip.open(tmp, "wt", encoding="utf8") as f:
+            json.dump(encode_columns(records, self.COLUMNS, self.ENCODED_COLUMNS), f, separators=(",", ":"), default=str)
+        os.replace(tmp, target)
+        self.path.unlink()
+        with self._lock:
+            self.rotations += 1
+        if self.keep_segments:
+            for old in list_segments(self.path)[:-self.keep_segments]:
+                old.unlink()
+
+    def join(self):
+        """Block until all queued records are written."""
+        self._queue.join()
+
+    def stop(self, timeout=5):
+        """Write the queued records and stop the writer thread."""
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self._writer.join(timeout)
+
+    def get_metrics(self):
+        """Return written/dropped/rotation counters and the queue depth."""
+        with self._lock:
+            return {"written": self.written, "dropped": self.dropped,
+                    "rotations": self.rotations, "depth": self._queue.qsize()}
+
+
+def encode_columns(records, columns, encoded):
+    """Turn records into one list per column, dictionary-encoding `encoded` columns."""
+    result = {"columns": list(columns), "count": len(records), "dictionaries": {}}
+    for column in columns:
+        values = [record.get(column) for record in records]
+        if column in encoded:
+            dictionary = {}
+            result[column] = [dictionary.setdefault(value, len(dictionary)) for value in values]
+            result["dictionaries"][column] = list(dictionary)
+        else:
+            result[column] = values
+    return result
+
+
+def decode_columns(segment):
+    """Inverse of `encode_columns`, yielding record dicts."""
+    columns = {}
+    for column in segment["columns"]:
+        values = segment[column]
+        dictionary = segment["dictionaries"].get(column)
+        columns[column] = [dictionary[i] for i in values] if dictionary is not None else values
+    for i in range(segment["count"]):
+        yield {column: columns[column][i] for column in segment["columns"]}
+
+
+def read_jsonl(path):
+    """Yield records of an active JSONL journal file, skipping a torn last line."""
+    with open(path, encoding="utf8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def list_segments(path):
+    """Return the rotated segments of a journal, oldest first."""
+    path = Path(path)
+    segments = path.parent.glob(f"{path.name}.*.json.gz")
+    return sorted(segments, key=lambda p: int(p.name[len(path.name) + 1:].split(".")[0]))
+
+
+def read_journal(path):
+    """Yield all records of a journal: rotated segments first, then the active file."""
+    path = Path(path)
+    for segment in list_segments(path):
+        with gzip.open(segment, "rt", encoding="utf8") as f:
+            yield from decode_columns(json.load(f))
+    if path.exists():
+        yield from read_jsonl(path)
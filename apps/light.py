@@ -33,7 +33,7 @@ light_control:
 See module docstring and inline examples for usage.
 """
 
-from base import BaseApp
+from base import BaseApp, cached_evaluation
 import inspect
 
 
@@ -162,8 +162,9 @@ class LightControl(BaseApp):
         """Generic sensor/state change callback that triggers an update of lights."""
         self.log(f"{inspect.currentframe().f_code.co_name} from {entity}:{attribute} {old}->{new}")
 
-        self.update_lights()
+        self.request_evaluation(self.update_lights)
 
+    @cached_evaluation
     def update_lights(self):
         """Evaluate conditions and decide whether to turn lights on or off.
 
@@ -27,12 +27,13 @@ power_control:
 See module docstring and inline examples for usage.
 """
 
-from base import BaseApp
+from base import BaseApp, cached_evaluation
 import inspect
 
 
 
 class PowerControl(BaseApp):
+    SNAPSHOT_ENTITY_LISTS = BaseApp.SNAPSHOT_ENTITY_LISTS + ("_power_controls", "_standby_sensors")
 
     def initialize(self):
         """Initialize PowerControl app.
@@ -125,6 +126,7 @@ class PowerControl(BaseApp):
 
         return self.count_switches("off")
 
+    @cached_evaluation
     def update_power(self):
         """Evaluate conditions and turn power controls on or off accordingly.
 
@@ -216,4 +218,4 @@ class PowerControl(BaseApp):
         """
         self.log(f"{inspect.currentframe().f_code.co_name} from {entity}:{attribute} {old}->{new}")
 
-        self.update_power()
+        self.request_evaluation(self.update_power)
@@ -404,3 +404,122 @@ def test_control_change_callback_branches(make_alarm_with_maps):
     app.control_change_callback('alarm_control_panel.ha_alarm', 'state', 'armed_home', 'disarmed', {})
     assert getattr(app, '_notified', False) is True
 
+
+
+def test_sensor_names_use_one_pattern_per_language(make_alarm_with_maps):
+    from apps.alarm import compile_sensor_name_pattern, normalize_sensor_name, SENSOR_NAME_NOISE
+
+    pattern = compile_sensor_name_pattern(SENSOR_NAME_NOISE)
+    assert compile_sensor_name_pattern(SENSOR_NAME_NOISE) is pattern
+    assert normalize_sensor_name('Küche Fenstersensor', pattern) == 'Küche'
+    assert normalize_sensor_name('Flur_Bewegungsmelder/Radar', pattern) == 'Flur'
+
+    app = make_alarm_with_maps({}, {}, {'always': {}})
+    app._sensor_name_pattern = compile_sensor_name_pattern(('detector',))
+    app.get_state = lambda e, attribute=None: 'Hall Motion Detector'
+    assert app.optimize_sensor_name('binary_sensor.hall') == 'Hall Motion'
+
+
+def test_triggered_alarm_message_only_rebuilt_when_alerts_change(make_alarm_with_maps):
+    app = make_alarm_with_maps({'door1': 'door', 'door2': 'door'}, {}, {'armed_away': {'g1': ['door1', 'door2']}})
+    app._alarm_type = 'burglar'
+    app.get_seconds_since_update = lambda entity: 1000
+    app.get_state = lambda e, attribute=None: 'on'
+    app.is_alarm_pending = lambda: False
+    app.is_alarm_arming = lambda: False
+    app.is_alarm_triggered = lambda: True
+    alerts = {'burglar': ['door1']}
+    app.get_alerts = lambda *args, **kwargs: alerts
+    messages = []
+    app.create_alarm_message = lambda current: messages.append(dict(current)) or 'message'
+    app.set_alarm_message = lambda message: None
+
+    app.analyze_and_trigger()
+    app.analyze_and_trigger()
+    alerts = {'burglar': ['door1', 'door2']}
+    app.analyze_and_trigger()
+    assert messages == [{'burglar': ['door1']}, {'burglar': ['door1', 'door2']}]
+
+
+def test_trigger_latency_is_traced_per_stage_and_checked_against_slo(make_alarm_with_maps, monkeypatch):
+    import types
+    from apps import alarm as alarm_module
+    from apps.base import Histogram
+
+    clock = [100.0]
+    monkeypatch.setattr(alarm_module, "time", types.SimpleNamespace(monotonic=lambda: clock[0]))
+
+    app = make_alarm_with_maps({'door1': 'door'}, {'door1': 'on'}, {'armed_away': {'g1': ['door1']}})
+    app._trigger_latency_slo = 1
+    app._trigger_latency_sensor = 'sensor.alarm_trigger_latency'
+    app._trigger_latency = {stage: Histogram(alarm_module.TRIGGER_LATENCY_BUCKETS)
+                            for stage in alarm_module.TRIGGER_STAGES + ("total",)}
+    app._trigger_slo_violations = 0
+    app._trace_origin = None
+    app._alarm_type = 'burglar'
+    published = []
+    app.set_state = lambda entity, **kwargs: published.append((entity, kwargs))
+    logged = []
+    app.log = lambda message, level="INFO", *a, **k: logged.append((level, message))
+    app.request_evaluation = lambda *args, **kwargs: None
+    app.create_alarm_message = lambda alerts: 'message'
+    app.set_alarm_message = lambda message: None
+    app.call_alarm_control_panel = lambda action: clock.__setitem__(0, clock[0] + 0.05)
+
+    def trace(analyze_after):
+        app.sensor_change_callback('door1', 'state', 'off', 'on', {})
+        clock[0] += analyze_after
+        app._trace_analyze = (app._trace_origin, clock[0])
+        app._trace_origin = None
+        app.trigger_alarm('burglar', {'burglar': ['door1']})
+        clock[0] += 0.2
+        app.mark_trigger_stage("panel")
+        clock[0] += 0.01
+        app.mark_trigger_stage("siren")
+        clock[0] += 0.1
+        app.mark_trigger_stage("notify")
+        app.mark_trigger_stage("siren")
+        app.finish_trigger_trace()
+
+    trace(analyze_after=0.25)
+    assert app._trigger_slo_violations == 0
+    assert published[-1][1]['state'] == 610.0
+    assert published[-1][1]['attributes']['last_stages_ms'] == {
+        'analyze': 250.0, 'trigger': 50.0, 'panel': 200.0, 'siren': 10.0, 'notify': 100.0}
+
+    # a slow coalescing window pushes the trigger over the SLO
+    trace(analyze_after=2)
+    assert app._trigger_slo_violations == 1
+    assert any(level == "WARNING" and "above the SLO" in message for level, message in logged)
+    stats = app.get_trigger_latency_stats()
+    assert stats['total']['count'] == 2
+    assert stats['analyze']['p99_ms'] == 2500
+
+
+def test_flash_warning_and_sirens_batch_service_calls(make_alarm_with_maps):
+    app = make_alarm_with_maps({}, {}, {'always': {}})
+    lights = [f'light.room_{i}' for i in range(10)]
+    features = {'light.room_0': 44, 'light.room_1': 8}
+    app.get_state = lambda entity, attribute=None: features.get(entity) if attribute == 'supported_features' else None
+    app._alarm_lights = lights
+    calls = []
+    app.call_service = lambda service, **kwargs: calls.append((service, kwargs))
+    timers = []
+    app.run_in = lambda callback, delay, **kwargs: timers.append(callback) or len(timers)
+
+    app.start_flash_warning('red', 100)
+    assert calls == [('light/turn_on', {'entity_id': lights, 'color_name': 'red', 'brightness_pct': 100})]
+    calls.clear()
+    while timers:
+        timers.pop()({})
+    # 60 ticks: one toggle call each plus a flash call every 10 seconds
+    assert len(calls) == 66
+    assert calls[0] == ('light/toggle', {'entity_id': lights[2:]})
+    assert calls[1] == ('light/turn_on', {'entity_id': ['light.room_0', 'light.room_1'], 'flash': 'long'})
+
+    calls.clear()
+    app._burglar_siren_switches = ['switch.siren_hall', 'switch.siren_garden', 'siren.attic']
+    app.in_silent_mode = lambda: False
+    app.start_burglar_siren()
+    assert calls == [('switch/turn_on', {'entity_id': ['switch.siren_hall', 'switch.siren_garden']}),
+                     ('siren/turn_on', {'entity_id': 'siren.attic'})]
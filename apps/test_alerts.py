@@ -82,3 +82,275 @@ def test_smoke_sensor_triggers_fire_alert(make_alarm_with_maps):
     app.analyze_and_trigger()
 
     assert 'alarm_trigger' in calls
+
+
+def test_sensor_index_maps_sensors_and_follows_ignore_list(make_alarm_with_maps):
+    device_class_map = {'door1': 'door', 'leak1': 'moisture'}
+    state_map = {'door1': 'on', 'leak1': 'off'}
+    sensors = {
+        'armed_away': {'g1': ['door1'], 'g2': ['door1']},
+        'armed_home': {'g1': ['door1']},
+        'always': {'water': ['leak1']},
+    }
+    app = make_alarm_with_maps(device_class_map, state_map, sensors)
+
+    index = app.get_sensor_index()
+    assert index.memberships['door1'] == {('armed_away', 'g1'), ('armed_away', 'g2'), ('armed_home', 'g1')}
+    assert index.by_arming_state['armed_away'] == (('door1', 'door', 'burglar'),)
+    assert index.by_arming_state['always'] == (('leak1', 'moisture', 'water'),)
+    assert app.get_alerts(arming_state='armed_away') == {'burglar': ['door1']}
+
+    # appending to the ignore list rebuilds the index
+    app._sensors_ignored.append('door1')
+    assert app.is_sensor_monitored('door1') is False
+    assert app.get_sensor_index().by_arming_state['armed_away'] == ()
+    assert app.get_alerts(arming_state='armed_away') == {}
+
+
+def test_sensor_index_retries_unknown_device_class(make_alarm_with_maps):
+    device_class_map = {}
+    state_map = {'door1': 'on'}
+    app = make_alarm_with_maps(device_class_map, state_map, {'armed_away': {'g1': ['door1']}})
+
+    assert app.get_alerts(arming_state='armed_away') == {}
+
+    # the entity reports its device_class once Home Assistant has loaded it
+    device_class_map['door1'] = 'door'
+    assert app.get_alerts(arming_state='armed_away') == {'burglar': ['door1']}
+
+
+def test_sensor_meta_is_cached_until_attributes_change(make_alarm_with_maps):
+    device_class_map = {'door1': 'door'}
+    app = make_alarm_with_maps(device_class_map, {'door1': 'off'}, {'armed_away': {'g1': ['door1']}})
+    app._opening_timeout = 30
+    reads = []
+    get_state = app.get_state
+    app.get_state = lambda entity, attribute=None: reads.append((entity, attribute)) or get_state(entity, attribute=attribute)
+
+    meta = app.get_sensor_meta('door1')
+    assert (meta.device_class, meta.sensor_category, meta.alarm_category, meta.timeout) == ('door', 'door', 'burglar', 30)
+    app.get_sensor_meta('door1')
+    app.check_sensor('door1')
+    assert reads.count(('door1', 'device_class')) == 1
+
+    device_class_map['door1'] = 'moisture'
+    app.sensor_event_callback('door1', 'all',
+                              {'state': 'off', 'attributes': {'device_class': 'door'}},
+                              {'state': 'off', 'attributes': {'device_class': 'moisture'}}, {})
+    assert app.get_sensor_meta('door1').alarm_category == 'water'
+    assert app.get_sensor_index().by_arming_state['armed_away'] == (('door1', 'moisture', 'water'),)
+
+
+def test_inverted_mappings_keep_first_match(make_alarm_with_maps):
+    app = make_alarm_with_maps({}, {}, {})
+    assert app.classify_sensor('garage_door') == 'door'
+    assert app.classify_alarm('temperature') == 'fire'
+    assert app.classify_alarm(None) is None
+
+    app._sensor_mapping = {'first': ['x'], 'second': ['x']}
+    assert app.classify_sensor('x') == 'first'
+
+
+def test_live_alerts_follow_events_and_deadlines(make_alarm_with_maps):
+    from datetime import datetime, timezone, timedelta
+    from apps.base import DeadlineHeap
+
+    device_class_map = {'door1': 'door', 'door2': 'door'}
+    state_map = {'door1': 'off', 'door2': 'off'}
+    start = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    now = [start]
+    last_updated = {'door1': start - timedelta(hours=1), 'door2': start - timedelta(hours=1)}
+
+    app = make_alarm_with_maps(device_class_map, state_map, {'armed_away': {'g1': ['door1', 'door2']}})
+    app.get_state = lambda e, attribute=None: (
+        last_updated[e].isoformat() if attribute == 'last_updated'
+        else device_class_map.get(e) if attribute == 'device_class'
+        else state_map.get(e))
+    app.get_utc_time = lambda: now[0]
+    timers = []
+    app.run_in = lambda cb, delay, **kwargs: timers.append(delay) or len(timers)
+    app.cancel_timer = lambda handle: None
+    app._live_alerts = {}
+    app._alert_deadlines = DeadlineHeap()
+    app._alert_timer = None
+    app._alert_timer_deadline = None
+    app.refresh_live_alerts()
+    assert app.get_alerts(arming_state='armed_away') == {}
+
+    # door1 opens and closes again: it alerts for the opening timeout
+    state_map['door1'] = 'on'
+    last_updated['door1'] = now[0]
+    app.sensor_change_callback('door1', 'state', 'off', 'on', {})
+    assert app.get_alerts(arming_state='armed_away') == {'burglar': ['door1']}
+    now[0] += timedelta(seconds=5)
+    state_map['door1'] = 'off'
+    last_updated['door1'] = now[0]
+    app.sensor_change_callback('door1', 'state', 'on', 'off', {})
+    assert app.get_alerts(arming_state='armed_away') == {'burglar': ['door1']}
+    assert timers[-1] == 30
+
+    now[0] += timedelta(seconds=30)
+    app.alert_deadline_callback({})
+    assert app.get_alerts(arming_state='armed_away') == {}
+    assert len(app._alert_deadlines) == 0
+
+    # a timeout override still scans all sensors
+    state_map['door2'] = 'on'
+    assert app.get_alerts(timeout=0, arming_state='armed_away') == {'burglar': ['door2']}
+    assert app.get_alerts(arming_state='armed_away') == {}
+    app.audit_live_alerts()
+    assert app.get_alerts(arming_state='armed_away') == {'burglar': ['door2']}
+
+
+def test_deadline_heap_reschedules_and_pops_in_order():
+    from apps.base import DeadlineHeap
+
+    heap = DeadlineHeap()
+    heap.schedule('a', 10)
+    heap.schedule('b', 5)
+    heap.schedule('a', 3)
+    heap.schedule('c', 7)
+    heap.schedule('c', None)
+    assert heap.next_deadline() == 3
+    assert heap.pop_due(6) == ['a', 'b']
+    assert heap.next_deadline() is None
+    assert len(heap) == 0
+
+
+def _recheck_clock(app):
+    from datetime import datetime, timezone
+    from apps.base import DeadlineHeap
+
+    clock = [100.0]
+    app.get_utc_time = lambda: datetime.fromtimestamp(clock[0], timezone.utc)
+    timers = []
+    app.run_in = lambda cb, delay, **kwargs: timers.append((cb, delay)) or len(timers)
+    app.cancel_timer = lambda handle: timers.__setitem__(handle - 1, None)
+    app._rechecks = DeadlineHeap()
+    app._recheck_calls = {}
+    app._recheck_timer = None
+    app._recheck_timer_deadline = None
+    return clock, timers
+
+
+def test_sensor_event_rechecks_after_delay_through_one_timer(make_alarm_with_maps):
+    app = make_alarm_with_maps({'door1': 'door', 'door2': 'door'}, {}, {'armed_away': {'g1': ['door1', 'door2']}})
+    clock, timers = _recheck_clock(app)
+    app._armed_away_sensor_delay = 10
+    calls = []
+    app.sensor_change_callback = lambda entity, attribute, old, new, kwargs: calls.append((clock[0], entity, old, new))
+
+    app.sensor_event_callback('door1', 'all', {'state': 'off'}, {'state': 'on'}, {})
+    clock[0] = 102
+    app.sensor_event_callback('door2', 'all', {'state': 'off'}, {'state': 'on'}, {})
+    # door2 closes again before its delay is over: its re-check is replaced
+    clock[0] = 104
+    app.sensor_event_callback('door2', 'all', {'state': 'on'}, {'state': 'off'}, {})
+    assert [t for t in timers if t is not None] == [(app.recheck_timer_callback, 10)]
+
+    clock[0] = 110
+    timers.pop(0)[0]({})
+    clock[0] = 114
+    timers.pop(0)[0]({})
+    assert calls == [
+        (100, 'door1', 'off', 'on'), (102, 'door2', 'off', 'on'), (104, 'door2', 'on', 'off'),
+        (110, 'door1', 'off', 'on'), (114, 'door2', 'on', 'off'),
+    ]
+    assert timers == []
+
+    # attribute-only updates do not run the sensor checks
+    app.sensor_event_callback('door1', 'all', {'state': 'on', 'attributes': {}}, {'state': 'on', 'attributes': {'linkquality': 5}}, {})
+    assert len(calls) == 5
+
+
+def test_tracker_events_replay_staggered_presence_checks(make_alarm_with_maps):
+    app = make_alarm_with_maps({}, {}, {'always': {}})
+    clock, timers = _recheck_clock(app)
+    app._presence_delays = {'person.a': 0, 'person.b': 1}
+    calls = []
+    app.presence_change_callback = lambda entity, attribute, old, new, kwargs: calls.append((clock[0], entity, old, new))
+
+    def advance(until):
+        while app._recheck_timer is not None and app._recheck_timer_deadline <= until:
+            clock[0] = app._recheck_timer_deadline
+            callback, delay = timers[app._recheck_timer - 1]
+            timers[app._recheck_timer - 1] = None
+            callback({})
+        clock[0] = until
+
+    app.presence_event_callback('person.a', 'state', 'not_home', 'home', {})
+    app.presence_event_callback('person.b', 'state', 'not_home', 'home', {})
+    assert calls == [(100, 'person.a', 'not_home', 'home')]
+
+    # person.a leaves again: its pending 5 minute check is cancelled
+    advance(150)
+    app.presence_event_callback('person.a', 'state', 'home', 'not_home', {})
+    advance(1000)
+    assert calls[1:] == [
+        (101, 'person.b', 'not_home', 'home'),
+        (401, 'person.b', 'not_home', 'home'),
+        (450, 'person.a', 'home', 'not_home'),
+    ]
+
+
+def test_burglar_correlator_counts_distinct_sensors_and_zones():
+    from apps.alarm import BurglarCorrelator
+
+    correlator = BurglarCorrelator(60, maxlen=4)
+    correlator.add(0, 'door1', 'ground')
+    correlator.add(10, 'door1', 'ground')
+    correlator.add(20, 'window1', 'ground')
+    correlator.add(30, 'motion1', 'upstairs')
+    assert correlator.distinct_sensors(30) == 3
+    assert correlator.distinct_zones(30) == 2
+
+    # the oldest door1 event is evicted by the length bound, the second by time
+    correlator.add(40, 'motion2', 'upstairs')
+    assert correlator.distinct_sensors(40) == 4
+    assert correlator.distinct_sensors(75) == 3
+    assert correlator.get_sensors() == ['window1', 'motion1', 'motion2']
+    assert correlator.distinct_zones(95) == 1
+    correlator.clear()
+    assert correlator.distinct_sensors(95) == 0
+
+
+def test_fast_multi_zone_intrusion_triggers_above_threshold(make_alarm_with_maps):
+    from datetime import datetime, timezone, timedelta
+    from apps.alarm import BurglarCorrelator
+
+    device_class_map = {'door1': 'door', 'motion1': 'motion', 'motion2': 'motion'}
+    state_map = {'door1': 'off', 'motion1': 'off', 'motion2': 'off'}
+    app = make_alarm_with_maps(device_class_map, state_map, {'armed_away': {'g1': ['door1', 'motion1', 'motion2']}})
+    now = [datetime(2024, 1, 1, 3, 0, tzinfo=timezone.utc)]
+    app.get_utc_time = lambda: now[0]
+    app.is_alarm_armed_away = lambda: True
+    app.request_evaluation = lambda *args, **kwargs: None
+    app._armed_away_sensor_threshold = 5
+    app._burglar_window_sensors = 0
+    app._burglar_window_zones = 2
+    app._sensor_zones = {'door1': 'hall', 'motion1': 'living', 'motion2': 'living'}
+    app._burglar_correlator = BurglarCorrelator(30)
+
+    app.sensor_change_callback('motion1', 'state', 'off', 'on', {})
+    app.sensor_change_callback('motion2', 'state', 'off', 'on', {})
+    assert app.get_correlated_burglar_sensors() == []
+
+    # a zone far outside the window does not count
+    now[0] += timedelta(seconds=60)
+    app.sensor_change_callback('door1', 'state', 'off', 'on', {})
+    assert app.get_correlated_burglar_sensors() == []
+    now[0] += timedelta(seconds=5)
+    app.sensor_change_callback('motion1', 'state', 'on', 'off', {})
+    app.sensor_change_callback('motion1', 'state', 'off', 'on', {})
+    assert app.get_correlated_burglar_sensors() == ['door1', 'motion1']
+
+    triggered = []
+    app.get_alerts = lambda *args, **kwargs: {'burglar': ['motion1']}
+    app.trigger_alarm = lambda alarm_type, alerts: triggered.append((alarm_type, alerts))
+    app.get_seconds_since_update = lambda entity: 1000
+    app.get_state = lambda e, attribute=None: 'on'
+    app.is_alarm_pending = lambda: False
+    app.is_alarm_arming = lambda: False
+    app.is_alarm_triggered = lambda: False
+    app.analyze_and_trigger()
+    assert triggered == [('burglar', {'burglar': ['motion1', 'door1']})]
@@ -169,3 +169,76 @@ def test_disarm_on_device_tracker_return_home(make_alarm_with_maps):
     app.presence_change_callback(tracker, None, 'not_home', 'home', {})
 
     assert 'disarm' in calls
+
+
+def _partitioned_alarm(make_alarm_with_maps):
+    device_class_map = {'front_door': 'door', 'garage_door': 'door', 'hall_motion': 'motion'}
+    state_map = {'alarm_control_panel.garage': 'armed_away'}
+    sensors = {'armed_away': {'group1': ['front_door', 'hall_motion']}, 'always': {}}
+    app = make_alarm_with_maps(device_class_map, state_map, sensors)
+    app._sensor_listeners = {}
+    app._live_alerts = None
+    listeners = []
+    app.listen_state = lambda callback, entity, **kwargs: listeners.append((callback.__name__, entity, kwargs)) or len(listeners)
+    app.listen_event = lambda callback, **kwargs: listeners.append((callback.__name__, kwargs.get('entity_id'), kwargs))
+    app.setup_partitions({'garage': {
+        'alarm_control_panel': 'alarm_control_panel.garage',
+        'armed_away_binary_sensors': ['garage_door', 'hall_motion'],
+        'armed_away_sensor_threshold': 1,
+        'alarm_lights': ['light.garage'],
+    }})
+    return app, listeners
+
+
+def test_partitions_share_listeners_and_keep_their_own_state(make_alarm_with_maps):
+    app, listeners = _partitioned_alarm(make_alarm_with_maps)
+
+    # one listener per sensor across partitions, one per partition panel
+    sensors = [entity for name, entity, _ in listeners if name == 'sensor_event_callback']
+    assert sorted(sensors) == ['front_door', 'garage_door', 'hall_motion']
+    assert ('control_change_callback', 'alarm_control_panel.garage', {'partition': 'garage'}) in listeners
+    assert app.get_sensor_partitions('hall_motion') == ('main', 'garage')
+    assert app.get_sensor_partitions('garage_door') == ('garage',)
+
+    with app.partition_scope('garage'):
+        assert app._alarm_control_panel == 'alarm_control_panel.garage'
+        assert app.get_armed_away_sensor_threshold() == 1
+        assert sorted(app.get_sensor_index().memberships) == ['garage_door', 'hall_motion']
+    assert app._alarm_control_panel == 'alarm_control_panel.ha_alarm'
+    assert app.get_armed_away_sensor_threshold() == 2
+    assert sorted(app.get_sensor_index().memberships) == ['front_door', 'hall_motion']
+
+    # timers created in a partition come back to it
+    timers = []
+    app.run_in = lambda callback, delay, **kwargs: timers.append(kwargs) or len(timers)
+    calls = []
+    app.call_service = lambda service, **kwargs: calls.append((service, kwargs))
+    app.flash_warning({'partition': 'garage'})
+    assert calls == [('light/toggle', {'entity_id': 'light.garage'})]
+    assert timers == [{'partition': 'garage'}]
+    assert app._flash_count == 0
+    assert app._partitions['garage']['_flash_count'] == 1
+
+
+def test_partitions_dispatch_sensor_and_presence_events(make_alarm_with_maps):
+    app, _ = _partitioned_alarm(make_alarm_with_maps)
+    rechecks = []
+    app.schedule_recheck = lambda key, delay, callback, *args: rechecks.append((key, args))
+    evaluated = []
+    app.request_evaluation = lambda callback, immediate=False: callback()
+    app.analyze_and_trigger = lambda: evaluated.append(app._alarm_control_panel)
+
+    app.sensor_event_callback('garage_door', 'all', {'state': 'off'}, {'state': 'on'}, {})
+    assert evaluated == ['alarm_control_panel.garage']
+    assert rechecks == [(('garage_door', 'delayed', 'garage'), ('garage_door', 'off', 'on', 'garage'))]
+
+    evaluated.clear()
+    app.sensor_event_callback('hall_motion', 'all', {'state': 'off'}, {'state': 'on'}, {})
+    assert evaluated == ['alarm_control_panel.ha_alarm', 'alarm_control_panel.garage']
+
+    # presence and timer callbacks run once per partition
+    app.setup = lambda: evaluated.append(('setup', app._alarm_control_panel))
+    evaluated.clear()
+    app.presence_change_callback('person.anna', 'state', 'home', 'not_home', {})
+    assert evaluated == [('setup', 'alarm_control_panel.ha_alarm'), ('setup', 'alarm_control_panel.garage')]
+    assert app._active_partition is None
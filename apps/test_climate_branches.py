@@ -33,7 +33,7 @@ def test_hvac_and_fan_selection_and_aqi():
 
     # Overheat -> fan-only or off depending on occupancy
     app.get_external_temperature = lambda: 35
-    app.get_desired_temperature = lambda: 20
+    app.get_desired_temperature = lambda status=None: 20
     app.is_somebody_at_home = lambda: False
     assert app.get_desired_hvac_mode() in ('off', 'fan_only', 'heat', 'cool')
 
@@ -71,3 +71,47 @@ def test_set_optimal_flows_call_services_when_supported():
 
     # At least one service should have been called across these
     assert len(calls) >= 1
+
+
+def test_update_climate_computes_desired_state_once():
+    app, calls = make_climate_app()
+    app._climate_controls = ['climate.l1', 'climate.l2']
+    app.get_state = lambda e, attribute=None: ['Auto', 'Mid'] if attribute == 'fan_modes' else ['quiet'] if attribute == 'preset_modes' else ['heat', 'off'] if attribute == 'hvac_modes' else None
+    summer_checks = []
+    app.is_summer = lambda: summer_checks.append(1) or False
+    app.is_internal_change_allowed = lambda: True
+
+    app.update_climate()
+
+    assert len(summer_checks) == 1
+
+    state = app.get_desired_climate_state(app._climate_controls)
+    assert state.summer is False
+    assert set(state.hvac_modes) == {'climate.l1', 'climate.l2'}
+    assert state.fan_modes['climate.l1'] == 'Auto'
+    assert state.preset_modes['climate.l2'] == 'quiet'
+    assert not hasattr(state, '__dict__')
+
+
+def test_climate_changes_are_grouped_and_hvac_mode_goes_first():
+    app, calls = make_climate_app()
+    entities = ['climate.l1', 'climate.l2']
+    attributes = {'hvac_modes': ['heat', 'off'], 'temperature': 15, 'fan_modes': None, 'preset_modes': None}
+    app.get_state = lambda e, attribute=None: attributes.get(attribute) if attribute else 'off'
+    app.is_summer = lambda: False
+    app.is_cooling = lambda e: False
+    recorded = []
+    app.record_internal_change = lambda: recorded.append(1)
+
+    state = app.get_desired_climate_state(entities)
+    state.hvac_modes.update({e: 'heat' for e in entities})
+    state.temperature = 21.0
+    changes = app.get_climate_changes(state, entities)
+
+    assert changes == [('set_hvac_mode', 'hvac_mode', 'heat', entities),
+                       ('set_temperature', 'temperature', 21.0, entities)]
+
+    calls.clear()
+    assert app.apply_climate_changes(changes) == 2
+    assert len(calls) == 2
+    assert recorded == [1]
@@ -12,7 +12,7 @@ def test_warnings_for_air_quality_and_overheating():
     app.get_co2_measurement = lambda: 900
     # overheating check
     app.get_external_temperature = lambda: 60
-    app.is_overheating = lambda: True
+    app.is_overheating = lambda state=None: True
 
     # call update_climate to hit the warnings branches
     app._climate_controls = []
@@ -60,3 +60,25 @@ def test_forecast_and_max_temperature_unknown_unavailable():
     app.get_state = lambda e, attribute=None: 'unknown' if e == 'sensor.temperature_max_today' else 'unavailable' if e == 'sensor.temperature_max_tomorrow' else None
     assert app.get_max_outside_temperature_today() == 0
     assert app.get_max_outside_temperature_tomorrow() == 0
+
+
+def test_climate_event_callback_dispatches_changes_and_reschedules_one_recheck():
+    app, _ = make_climate_app()
+    controls = []
+    app.control_change_callback = lambda entity, attribute, old, new, kwargs: controls.append((attribute, old, new))
+    rechecks = []
+    app.schedule_recheck = lambda key, delay, callback, *args: rechecks.append((key, delay, args))
+
+    old = {'state': 'heat', 'attributes': {'temperature': 20, 'fan_mode': 'Auto', 'current_temperature': 19.5}}
+    new = {'state': 'heat', 'attributes': {'temperature': 22, 'fan_mode': 'Auto', 'current_temperature': 19.7}}
+    app.climate_event_callback('climate.l1', 'all', old, new, {})
+    assert controls == [('temperature', 20, 22)]
+    assert rechecks == [(('climate.l1', 'delayed'), 60, ('climate.l1',))]
+
+    # a swing change is recorded but does not re-evaluate, a reading alone does nothing
+    controls.clear()
+    rechecks.clear()
+    app.climate_event_callback('climate.l1', 'all', new, {'state': 'heat', 'attributes': {**new['attributes'], 'swing_mode': 'on'}}, {})
+    app.climate_event_callback('climate.l1', 'all', new, {'state': 'heat', 'attributes': {**new['attributes'], 'current_temperature': 20}}, {})
+    assert controls == [('swing_mode', None, 'on')]
+    assert rechecks == []
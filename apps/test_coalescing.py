@@ -0,0 +1,88 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from tests.base.factories import make_base_app
+
+
+def _make_app(window=0.25, max_latency=1.0):
+    app = make_base_app()
+    clock = [100.0]
+    app.get_utc_time = lambda: datetime.fromtimestamp(clock[0], timezone.utc)
+
+    timers = []
+    app.run_in = lambda cb, delay, **kwargs: timers.append((cb, delay, kwargs)) or len(timers)
+    app.cancel_timer = lambda handle: timers.__setitem__(handle - 1, None)
+    app._coalesce_window = window
+    app._coalesce_max_latency = max_latency
+    app._pending_evaluations = {}
+
+    runs = []
+
+    def update():
+        runs.append(clock[0])
+
+    return app, clock, timers, runs, update
+
+
+def _fire(timers):
+    cb, delay, kwargs = timers.pop(0)
+    cb(kwargs)
+
+
+def test_burst_is_coalesced_into_one_evaluation():
+    app, clock, timers, runs, update = _make_app()
+
+    for _ in range(5):
+        app.request_evaluation(update)
+        clock[0] += 0.05
+    assert runs == []
+    assert len(timers) == 1
+
+    # last trigger was 0.05s ago -> wait for the rest of the window
+    _fire(timers)
+    assert runs == []
+    assert timers[0][1] == pytest.approx(0.2)
+
+    clock[0] += 0.2
+    _fire(timers)
+    assert len(runs) == 1
+    assert app.get_evaluation_stats() == {"requested": 5, "run": 1, "pending": 0, "saved": 4}
+
+
+def test_max_latency_bounds_continuous_triggers():
+    app, clock, timers, runs, update = _make_app(window=0.25, max_latency=0.5)
+
+    app.request_evaluation(update)
+    clock[0] = 100.2
+    app.request_evaluation(update)
+    clock[0] = 100.4
+    app.request_evaluation(update)
+
+    # still busy, but only 0.1s left until the latency bound
+    _fire(timers)
+    assert runs == []
+    assert timers[0][1] == pytest.approx(0.1)
+
+    clock[0] = 100.45
+    app.request_evaluation(update)
+    clock[0] = 100.5
+    _fire(timers)
+    assert runs == [100.5]
+    assert timers == []
+
+
+def test_immediate_and_disabled_bypass_window():
+    app, clock, timers, runs, update = _make_app()
+
+    app.request_evaluation(update)
+    assert len(timers) == 1
+    # a safety-critical trigger runs now and absorbs the pending run
+    app.request_evaluation(update, immediate=True)
+    assert runs == [100.0]
+    assert timers == [None]
+    assert app.get_evaluation_stats()["saved"] == 1
+
+    app._coalesce_window = 0
+    app.request_evaluation(update)
+    assert len(runs) == 2
@@ -64,7 +64,7 @@ def test_control_change_callback_triggered_and_disarmed_branches(make_alarm_with
     app.control_change_callback('alarm', None, 'old', 'new', {})
 
     assert isinstance(app._last_disarm_timestamp, datetime)
-    assert app._sensors_ignored == []
+    assert app._sensors_ignored == set()
     assert called.get('color') == ('green', 10)
 
 
@@ -264,3 +264,61 @@ def test_count_alerts_by_arming_state_counts_correctly(make_alarm_with_maps):
 
     count = app.count_alerts_by_arming_state('armed_away')
     assert count >= 2
+
+
+def test_bridge_health_tracks_stable_since_and_flapping():
+    from apps.base import BridgeHealth
+
+    health = BridgeHealth(['bridge.a', 'bridge.b'], stable_after=300, flap_window=600, flap_changes=4)
+    health.update('bridge.a', 'on', 0, transition=False)
+    assert health.get_state(1000) == 'offline'
+    health.update('bridge.b', 'online', 100, transition=False)
+    assert health.stable_at == 400
+    assert not health.is_stable(399) and health.is_stable(400)
+
+    # attribute-only updates keep the bridge stable
+    assert not health.update('bridge.a', 'on', 500)
+    for t, state in ((1000, 'off'), (1010, 'on'), (1020, 'off')):
+        health.update('bridge.a', state, t)
+    assert health.get_state(1030) == 'offline'
+    health.update('bridge.a', 'on', 1030)
+    # four changes within the flap window: online for the whole window
+    assert health.get_state(1400) == 'flapping'
+    assert health.stable_at == 1630
+    assert health.get_state(1630) == 'stable'
+
+
+def test_bridge_changes_batch_analysis_until_stable(make_alarm_with_maps):
+    from datetime import datetime, timezone
+    from apps.base import BridgeHealth, DeadlineHeap
+
+    app = make_alarm_with_maps({}, {}, {'always': {}})
+    now = [1000.0]
+    app.get_utc_time = lambda: datetime.fromtimestamp(now[0], timezone.utc)
+    timers = []
+    app.run_in = lambda callback, delay, **kwargs: timers.append((callback, delay)) or len(timers)
+    app.cancel_timer = lambda handle: timers.__setitem__(handle - 1, None)
+    app._rechecks = DeadlineHeap()
+    app._recheck_calls = {}
+    app._recheck_timer = None
+    app._recheck_timer_deadline = None
+    app._bridge_health = BridgeHealth(['binary_sensor.zigbee2mqtt_bridge_connection_state'])
+    app._bridge_health.update('binary_sensor.zigbee2mqtt_bridge_connection_state', 'on', 0, transition=False)
+    analyzed = []
+    app.analyze_and_trigger = lambda: analyzed.append(now[0])
+    assert app.is_bridge_stable()
+
+    app.bridge_change_callback('binary_sensor.zigbee2mqtt_bridge_connection_state', 'state', 'on', 'off', {})
+    assert not app.is_bridge_stable()
+    assert app._recheck_calls == {}
+    now[0] = 1100
+    app.bridge_change_callback('binary_sensor.zigbee2mqtt_bridge_connection_state', 'state', 'off', 'on', {})
+    assert app.get_bridge_state() == 'settling'
+
+    # one re-analysis once the bridge has been online for 300 seconds
+    now[0] = 1400
+    live = [timer for timer in timers if timer is not None]
+    assert live == [(app.recheck_timer_callback, 300)]
+    live[0][0]({})
+    assert analyzed == [1400]
+    assert app.is_bridge_stable()
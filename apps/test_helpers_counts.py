@@ -1,3 +1,5 @@
+from datetime import datetime, timezone, timedelta
+
 from tests.base.factories import make_base_app
 
 
@@ -19,6 +21,30 @@ def test_get_seconds_since_update_parsing_and_logging():
     assert secs is not None and secs <= 10
 
 
+def test_last_updated_is_parsed_once_per_raw_value():
+    app = make_base_app()
+    del app.get_seconds_since_update
+    stamps = {
+        'binary_sensor.door1': (datetime.now(timezone.utc) - timedelta(seconds=30)).isoformat(),
+        'binary_sensor.door2': None,
+    }
+    app.get_state = lambda entity, attribute=None: stamps.get(entity)
+
+    first = app.get_last_updated('binary_sensor.door1')
+    assert app.get_last_updated('binary_sensor.door1') is first
+    assert 25 < app.get_seconds_since_update('binary_sensor.door1') < 60
+
+    # a new raw value refreshes the cached timestamp
+    stamps['binary_sensor.door1'] = (datetime.now(timezone.utc) - timedelta(seconds=2)).isoformat()
+    assert app.get_last_updated('binary_sensor.door1') is not first
+    assert app.get_seconds_since_update('binary_sensor.door1') < 10
+
+    ages = app.get_seconds_since_update_many(['binary_sensor.door1', 'binary_sensor.door2'])
+    assert ages['binary_sensor.door1'] < 10
+    assert ages['binary_sensor.door2'] is None
+    assert 'binary_sensor.door2' not in app._last_updated_cache
+
+
 def test_media_and_illumination_counting():
     app = make_base_app()
     app._media_players = ['media.player.a', 'media.player.b']
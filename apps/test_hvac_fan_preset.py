@@ -51,7 +51,7 @@ def test_get_desired_fan_mode_and_desired_hvac_mode():
 
     # desired hvac mode selection: simulate overheat
     app.get_external_temperature = lambda: 30
-    app.get_desired_temperature = lambda: 20
+    app.get_desired_temperature = lambda status=None: 20
     # assume nobody home -> fan_only conditions not met and should return 'off'
     app.is_somebody_at_home = lambda: False
     assert app.get_desired_hvac_mode() == 'off'
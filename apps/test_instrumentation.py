@@ -0,0 +1,115 @@
+import pytest
+
+from apps.base import BaseApp, Histogram
+from tests.base.factories import make_base_app
+
+
+class _Backend:
+    """Stands in for the hass.Hass registration and service API."""
+
+    def get_state(self, entity_id=None, attribute=None, default=None, **kwargs):
+        return "on"
+
+    def call_service(self, service, **kwargs):
+        self.services.append(service)
+
+    def listen_state(self, callback, *args, **kwargs):
+        self.registered.append(callback)
+
+    run_every = listen_event = listen_state
+
+
+class _InstrumentedApp(BaseApp, _Backend):
+    pass
+
+
+def _make_app(rate=1.0):
+    app = make_base_app()
+    app.__class__ = _InstrumentedApp
+    for name in ("get_state", "call_service", "listen_state", "listen_event", "run_every"):
+        app.__dict__.pop(name, None)
+    app.name = "alarm"
+    app.args = {"callback_sample_rate": rate}
+    app.services = []
+    app.registered = []
+    app.setup_callback_instrumentation()
+    return app
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = Histogram((1, 5, 10))
+    for value in (0, 1, 2, 7, 50):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [(1, 2), (5, 3), (10, 4), (float("inf"), 5)]
+    assert histogram.quantile(0.5) == 5
+    assert histogram.quantile(0.99) == 10
+    assert histogram.sum == 60
+
+
+def test_callbacks_are_wrapped_and_counted():
+    app = _make_app()
+
+    def sensor_change_callback(entity, attribute, old, new, kwargs):
+        app.get_state("binary_sensor.door1")
+        app.get_state("binary_sensor.door2")
+        app.call_service("light/turn_on", entity_id="light.l1")
+
+    def periodic_time_callback(kwargs):
+        raise RuntimeError("boom")
+
+    app.listen_state(sensor_change_callback, "binary_sensor.door1")
+    app.run_every(periodic_time_callback, "now", 60)
+    wrapped, periodic = app.registered[-2:]
+    assert wrapped.__name__ == "sensor_change_callback"
+
+    wrapped("binary_sensor.door1", "state", "off", "on", {})
+    wrapped("binary_sensor.door1", "state", "on", "off", {})
+    with pytest.raises(RuntimeError):
+        periodic({})
+
+    stats = app.get_callback_stats()
+    assert stats["sensor_change_callback"]["invocations"] == 2
+    assert stats["sensor_change_callback"]["get_state_avg"] == 2
+    assert stats["sensor_change_callback"]["call_service_avg"] == 1
+    assert stats["periodic_time_callback"]["errors"] == 1
+    # counting stops outside of callbacks
+    app.get_state("binary_sensor.door1")
+    assert app._callback_counts is None
+
+
+def test_sampling_and_disabled_instrumentation():
+    app = _make_app(rate=0.25)
+    calls = []
+    app.listen_state(lambda *args: calls.append(args), "binary_sensor.door1")
+    wrapped = app.registered[-1]
+    for _ in range(8):
+        wrapped("binary_sensor.door1", "state", "off", "on", {})
+    summary = app.get_callback_stats()["<lambda>"]
+    assert (summary["invocations"], summary["sampled"]) == (8, 2)
+    assert len(calls) == 8
+
+    app = _make_app(rate=0)
+    callback = lambda *args: None  # noqa: E731
+    app.listen_state(callback, "binary_sensor.door1")
+    assert app.registered[-1] is callback
+
+
+def test_prometheus_text_and_sensor(tmp_path):
+    app = _make_app()
+    app._callback_stats_file = str(tmp_path / "appdaemon.prom")
+    published = {}
+    app.set_state = lambda entity, **kwargs: published.update(entity=entity, **kwargs)
+
+    app.listen_state(lambda *args: None, "binary_sensor.door1")
+    app.registered[-1]("binary_sensor.door1", "state", "off", "on", {})
+    app.callback_stats_event_callback("callback_stats", {"app": "other"}, {})
+    assert published == {}
+    app.callback_stats_event_callback("callback_stats", {}, {})
+
+    assert published["entity"] == "sensor.alarm_callback_stats"
+    assert published["state"] == 1
+    text = (tmp_path / "appdaemon.prom").read_text()
+    assert '# TYPE appdaemon_callback_duration_seconds histogram' in text
+    assert 'appdaemon_callback_duration_seconds_bucket{app="alarm",callback="<lambda>",le="+Inf"} 1' in text
+    assert 'appdaemon_callback_invocations_total{app="alarm",callback="<lambda>"} 1' in text
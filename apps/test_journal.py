@@ -0,0 +1,106 @@
+import gzip
+import json
+from datetime import datetime, timezone
+
+from apps.alarm import UnavailabilityLog
+from apps.journal import AlarmJournal, list_segments, read_journal
+
+
+def test_journal_batches_rotates_to_columnar_segments_and_reads_back(tmp_path):
+    path = tmp_path / 'alarm.jsonl'
+    journal = AlarmJournal(path, max_bytes=400, batch_size=5, flush_interval=0.05)
+    for i in range(20):
+        journal.record(1000.0 + i, 'sensor', 'binary_sensor.door', 'off' if i % 2 else 'on', 'on' if i % 2 else 'off',
+                       {'device_class': 'door'})
+    journal.record(1020.0, 'trigger', data={'alarm_type': 'burglar'})
+    journal.stop()
+
+    segments = list_segments(path)
+    assert segments and journal.get_metrics()['rotations'] == len(segments)
+    with gzip.open(segments[0], 'rt', encoding='utf8') as f:
+        segment = json.load(f)
+    # repeated strings are stored once per segment
+    assert segment['dictionaries']['entity'] == ['binary_sensor.door']
+
+    records = list(read_journal(path))
+    assert [r['ts'] for r in records] == [1000.0 + i for i in range(21)]
+    assert records[1] == {'ts': 1001.0, 'kind': 'sensor', 'entity': 'binary_sensor.door',
+                          'old': 'off', 'new': 'on', 'data': {'device_class': 'door'}}
+    assert records[-1]['data'] == {'alarm_type': 'burglar'}
+    assert journal.get_metrics()['written'] == 21
+
+
+def test_alarm_state_is_restored_from_journal(make_alarm_with_maps, tmp_path):
+    path = tmp_path / 'alarm.jsonl'
+    now = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+    app = make_alarm_with_maps({}, {}, {'always': {}})
+    app.get_utc_time = lambda: now
+    app._journal = AlarmJournal(path)
+    app._sensors_ignored = {'binary_sensor.window'}
+    app._sensors_unavailable = UnavailabilityLog()
+    app._sensors_unavailable.start('binary_sensor.door', now.timestamp() - 60)
+    app._sensors_unavailable.end('binary_sensor.door', now.timestamp() - 30)
+    app._sensors_unavailable.start('binary_sensor.door', now.timestamp())
+    app._sensors_quarantined = frozenset({'binary_sensor.door'})
+    app._last_disarm_timestamp = now
+    app._alarm_type = 'burglar'
+    app._alarm_message = 'Attention burglar alarm!'
+    app.record_journal_state()
+    app._journal.stop()
+
+    restored = make_alarm_with_maps({}, {}, {'always': {}})
+    restored.restore_from_journal(str(path))
+    assert restored._sensors_ignored == {'binary_sensor.window'}
+    assert restored._sensors_unavailable.get('binary_sensor.door') == {'start': now, 'end': None}
+    assert restored._sensors_unavailable.periods('binary_sensor.door') == [
+        (now.timestamp() - 60, now.timestamp() - 30), (now.timestamp(), None)]
+    assert restored._sensors_quarantined == {'binary_sensor.door'}
+    assert restored._last_disarm_timestamp == now
+    assert restored.get_alarm_type() == 'burglar'
+    assert restored.get_alarm_message() == 'Attention burglar alarm!'
+
+
+def test_terminate_stops_journal_sirens_and_disarms(make_alarm_with_maps, tmp_path):
+    app = make_alarm_with_maps({}, {}, {'always': {}})
+    app._journal = AlarmJournal(tmp_path / 'alarm.jsonl')
+    calls = []
+    app.stop_burglar_siren = lambda: calls.append('burglar_siren_off')
+    app.stop_fire_siren = lambda: calls.append('fire_siren_off')
+    app.is_alarm_disarmed = lambda: False
+    app.disarm_alarm = lambda: calls.append('disarm')
+
+    app.terminate()
+
+    assert calls == ['burglar_siren_off', 'fire_siren_off', 'disarm']
+    assert not app._journal._writer.is_alive()
+
+
+def test_terminate_disarms_and_silences_every_partition(make_alarm_with_maps, tmp_path):
+    state_map = {'alarm_control_panel.home': 'triggered', 'alarm_control_panel.garage': 'armed_away'}
+    app = make_alarm_with_maps({'front_door': 'door', 'garage_door': 'door'}, state_map,
+                               {'armed_away': {'group1': ['front_door']}, 'always': {}})
+    app._sensor_listeners = {}
+    app._live_alerts = None
+    app.listen_state = lambda *args, **kwargs: None
+    app.listen_event = lambda *args, **kwargs: None
+    app._alarm_control_panel = 'alarm_control_panel.home'
+    app._burglar_siren_switches = ['switch.house_siren']
+    app._fire_siren_switches = ['switch.house_fire_siren']
+    app.setup_partitions({'garage': {
+        'alarm_control_panel': 'alarm_control_panel.garage',
+        'armed_away_binary_sensors': ['garage_door'],
+        'burglar_siren_switches': ['switch.garage_siren'],
+        'fire_siren_switches': ['switch.garage_fire_siren'],
+    }})
+    app._journal = AlarmJournal(tmp_path / 'alarm.jsonl')
+    calls = []
+    app.call_service = lambda service, **kwargs: calls.append((service, kwargs['entity_id']))
+
+    app.terminate()
+
+    assert ('alarm_control_panel/alarm_disarm', 'alarm_control_panel.home') in calls
+    assert ('alarm_control_panel/alarm_disarm', 'alarm_control_panel.garage') in calls
+    for siren in ('switch.house_siren', 'switch.house_fire_siren', 'switch.garage_siren', 'switch.garage_fire_siren'):
+        assert ('switch/turn_off', siren) in calls
+    assert not app._journal._writer.is_alive()
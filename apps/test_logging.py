@@ -0,0 +1,54 @@
+import logging
+
+from tests.base.factories import make_base_app
+
+
+class _Logger:
+    def __init__(self, level):
+        self.level = level
+
+    def isEnabledFor(self, level):
+        return level >= self.level
+
+
+def _capture(app):
+    logged = []
+    app.log = lambda message, level="INFO", *a, **k: logged.append((level, message))
+    return logged
+
+
+def test_log_debug_formats_only_when_enabled():
+    app = make_base_app()
+    logged = _capture(app)
+    app.get_main_log = lambda: _Logger(logging.INFO)
+
+    def expensive():
+        raise AssertionError("must not be built when DEBUG is off")
+
+    app.log_debug(expensive)
+    app.log_debug("%s is %s", "light.l1", "on")
+    assert logged == []
+
+    app.get_main_log = lambda: _Logger(logging.DEBUG)
+    app.refresh_log_level()
+    app.log_debug("%s is %s", "light.l1", "on")
+    app.log_debug(lambda: "built lazily")
+    assert logged == [("DEBUG", "light.l1 is on"), ("DEBUG", "built lazily")]
+
+
+def test_log_level_is_cached_and_defaults_to_debug():
+    app = make_base_app()
+    # without an AppDaemon logger DEBUG output is kept
+    assert app.is_debug_enabled() is True
+
+    lookups = []
+
+    def get_main_log():
+        lookups.append(1)
+        return _Logger(logging.WARNING)
+
+    app.get_main_log = get_main_log
+    app.refresh_log_level()
+    for _ in range(5):
+        assert app.is_debug_enabled() is False
+    assert len(lookups) == 1
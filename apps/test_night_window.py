@@ -156,3 +156,62 @@ def test_night_starts_earlier_if_tomorrow_workday(make_base_app, monkeypatch):
     start, end = app.get_night_times()
     assert start == "22:00:00"
     assert end == "08:30:00"
+
+
+def _make_scheduled_app(make_base_app, now, today_workday, tomorrow_workday):
+    from apps.base import NightSchedule
+
+    app = make_base_app()
+    app._night_start = "23:15:00"
+    app._night_end = "08:30:00"
+    app._night_start_workday = "22:15:00"
+    app._night_end_workday = "06:30:00"
+    app._local_timezone = timezone.utc
+    app.is_workday_today = lambda: today_workday
+    app.is_workday_tomorrow = lambda: tomorrow_workday
+    app.get_utc_time = lambda: now[0]
+    app._night_schedule = NightSchedule(app)
+    return app
+
+
+def test_night_schedule_uses_each_nights_workday(make_base_app):
+    # today is a workday (night ends 06:30), tomorrow is not (night starts 23:15)
+    now = [datetime(2024, 5, 10, 6, 0, tzinfo=timezone.utc)]
+    app = _make_scheduled_app(make_base_app, now, True, False)
+
+    assert app.is_time_in_night_window() is True
+    assert app.get_seconds_until_night_end() == 30 * 60
+
+    now[0] = datetime(2024, 5, 10, 6, 30, tzinfo=timezone.utc)
+    assert app.is_time_in_night_window() is False
+
+    now[0] = datetime(2024, 5, 10, 22, 30, tzinfo=timezone.utc)
+    assert app.is_time_in_night_window() is False
+
+    now[0] = datetime(2024, 5, 10, 23, 15, tzinfo=timezone.utc)
+    assert app.is_time_in_night_window() is True
+    # tomorrow is not a workday -> night ends at 08:30
+    assert app.get_seconds_until_night_end() == (9 * 60 + 15) * 60
+
+
+def test_night_schedule_is_resolved_once_per_day_and_invalidated(make_base_app):
+    now = [datetime(2024, 5, 10, 12, 0, tzinfo=timezone.utc)]
+    app = _make_scheduled_app(make_base_app, now, False, False)
+    lookups = []
+    app.is_workday_tomorrow = lambda: lookups.append(1) or False
+
+    for hour in (12, 18, 22):
+        now[0] = datetime(2024, 5, 10, hour, 30, tzinfo=timezone.utc)
+        assert app.is_time_in_night_window() is False
+    assert len(lookups) == 1
+
+    # workday sensor turned on -> tomorrow's night starts at 22:15
+    app.is_workday_tomorrow = lambda: lookups.append(1) or True
+    app.night_schedule_callback("binary_sensor.workday_tomorrow", "state", "off", "on", {})
+    assert app.is_time_in_night_window() is True
+    assert len(lookups) == 2
+
+    # a new local day resolves the windows again
+    now[0] = datetime(2024, 5, 11, 12, 0, tzinfo=timezone.utc)
+    assert app.is_time_in_night_window() is False
+    assert len(lookups) == 3
@@ -184,3 +184,80 @@ def test_notify_allows_media_at_night_for_urgent_prio(make_base_app, monkeypatch
     # media helpers should be called for urgent prio
     assert called["tts"] >= 1
     assert called["alexa"] >= 1
+
+
+def test_async_notifications_are_dispatched_per_channel():
+    import threading
+    from apps.base import NotificationDispatcher
+
+    app = make_base_app()
+    app._telegram_user_ids = ["1", "2"]
+    app.is_time_in_night_window = lambda: False
+    app.in_silent_mode = lambda: False
+    app.error = lambda *a, **k: None
+    lock = threading.Lock()
+    original = app.call_service
+
+    def call_service(service, **kwargs):
+        with lock:
+            original(service, **kwargs)
+
+    app.call_service = call_service
+    app._notification_dispatcher = NotificationDispatcher(app, concurrency={"telegram": 2}, retries=0)
+    try:
+        app.notify("urgent message", title="Alarm", prio=0)
+        app._notification_dispatcher.join()
+    finally:
+        app.terminate()
+
+    services = [s[0] for s in app._called["services"]]
+    assert services.count("telegram_bot/send_message") == 2
+    assert "notify/mobile_app_phone_1" in services
+    assert "persistent_notification/create" in services
+    assert "tts/speak" in services
+
+    metrics = app.get_notification_metrics()
+    assert metrics["telegram"]["sent"] == 2
+    assert metrics["telegram"]["depth"] == 0
+    assert metrics["persistent"]["failed"] == 0
+
+
+def test_dispatcher_retries_orders_by_prio_and_handles_full_queue():
+    import threading
+    from apps.base import NotificationDispatcher
+
+    app = make_base_app()
+    app.log = lambda *a, **k: None
+    dispatcher = NotificationDispatcher(app, queue_size=2, retries=1, backoff=0)
+    gate = threading.Event()
+    delivered = []
+
+    # block the telegram worker so jobs pile up behind it
+    dispatcher.submit("telegram", 1, gate.wait)
+    while dispatcher.get_metrics()["telegram"]["depth"]:
+        pass
+    dispatcher.submit("telegram", 2, delivered.append, "debug")
+    dispatcher.submit("telegram", 0, delivered.append, "urgent")
+    # queue is full: normal messages are dropped, urgent ones run inline
+    assert dispatcher.submit("telegram", 1, delivered.append, "dropped") is False
+    assert dispatcher.submit("telegram", 0, delivered.append, "inline") is True
+    assert delivered == ["inline"]
+
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("timeout")
+
+    dispatcher.submit("mobile", 1, flaky)
+    gate.set()
+    dispatcher.join()
+    dispatcher.stop()
+
+    assert delivered == ["inline", "urgent", "debug"]
+    assert len(attempts) == 2
+    metrics = dispatcher.get_metrics()
+    assert metrics["telegram"]["dropped"] == 1
+    assert metrics["mobile"]["retried"] == 1
+    assert metrics["mobile"]["sent"] == 1
@@ -0,0 +1,154 @@
+import threading
+
+from apps.base import BaseApp, cached_evaluation
+from tests.base.factories import make_base_app
+
+
+class _StateBackend:
+    """Stands in for hass.Hass.get_state and counts backend reads."""
+
+    states = {
+        "binary_sensor.door1": "on",
+        "binary_sensor.door2": "off",
+    }
+
+    def get_state(self, entity_id=None, attribute=None, default=None, **kwargs):
+        self.backend_reads.append((entity_id, attribute))
+        if entity_id is None:
+            return {entity: {"state": state, "attributes": {"device_class": "door"},
+                             "last_updated": "2024-01-01T00:00:00+00:00"}
+                    for entity, state in self.states.items()}
+        value = self.states.get(entity_id) if attribute is None else None
+        return default if value is None else value
+
+    def call_service(self, service, **kwargs):
+        self.service_calls.append((service, kwargs))
+
+
+class _CachedApp(BaseApp, _StateBackend):
+
+    @cached_evaluation
+    def evaluate(self):
+        return [self.get_state("binary_sensor.door1") for _ in range(3)]
+
+
+def _make_app():
+    app = make_base_app()
+    app.__class__ = _CachedApp
+    # drop the factory stub so BaseApp.get_state is used
+    del app.get_state
+    app.__dict__.pop("call_service", None)
+    app.backend_reads = []
+    app.service_calls = []
+    return app
+
+
+def test_get_state_passes_through_outside_scope():
+    app = _make_app()
+
+    assert app.get_state("binary_sensor.door1") == "on"
+    assert app.get_state("binary_sensor.door1") == "on"
+    assert len(app.backend_reads) == 2
+    assert app.get_state_cache_stats()["hits"] == 0
+
+
+def test_evaluation_scope_reads_each_entity_once():
+    app = _make_app()
+
+    assert app.evaluate() == ["on", "on", "on"]
+    assert app.backend_reads == [("binary_sensor.door1", None)]
+
+    stats = app.get_state_cache_stats()
+    assert stats["evaluations"] == 1
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+
+    # the cache is dropped after the pass
+    app.evaluate()
+    assert len(app.backend_reads) == 2
+
+
+def test_evaluation_scope_applies_default_and_nests():
+    app = _make_app()
+
+    with app.evaluation_scope():
+        assert app.get_state("sensor.missing") is None
+        assert app.get_state("sensor.missing", default="unknown") == "unknown"
+        with app.evaluation_scope():
+            assert app.get_state("binary_sensor.door2") == "off"
+        assert app.get_state("binary_sensor.door2") == "off"
+
+    assert app.backend_reads == [("sensor.missing", None), ("binary_sensor.door2", None)]
+    assert app.get_state_cache_stats()["evaluations"] == 1
+
+
+def test_snapshot_answers_reads_with_one_backend_call():
+    app = _make_app()
+    app._state_snapshot_mode = "always"
+
+    with app.evaluation_scope():
+        assert app.get_state("binary_sensor.door1") == "on"
+        assert app.get_state("binary_sensor.door2", attribute="device_class") == "door"
+        assert app.get_state("binary_sensor.door2", attribute="last_updated") == "2024-01-01T00:00:00+00:00"
+        assert app.get_state("sensor.missing", default="unknown") == "unknown"
+
+    assert app.backend_reads == [(None, None)]
+    assert app.get_state_cache_stats()["snapshots"] == 1
+    # outside of a scope reads go to the backend again
+    assert app.get_state("binary_sensor.door1") == "on"
+    assert app.backend_reads[-1] == ("binary_sensor.door1", None)
+
+
+def test_auto_strategy_depends_on_configured_share_of_namespace():
+    app = _make_app()
+    app._state_snapshot_mode = "auto"
+    app._state_snapshot_min_entities = 1
+    app._state_snapshot_ratio = 0.5
+    app._opening_sensors = ["binary_sensor.door1"]
+    assert app.use_state_snapshot() is True
+
+    app = _make_app()
+    app._state_snapshot_mode = "auto"
+    app._state_snapshot_min_entities = 1
+    app._state_snapshot_ratio = 10
+    app._opening_sensors = ["binary_sensor.door1"]
+    assert app.use_state_snapshot() is False
+    app.evaluate()
+    assert (None, None) not in app.backend_reads[1:]
+
+
+def test_auto_strategy_skips_small_apps():
+    app = _make_app()
+    app._state_snapshot_mode = "auto"
+    app._state_snapshot_min_entities = 50
+    app._opening_sensors = ["binary_sensor.door1"]
+    assert app.use_state_snapshot() is False
+    assert app.backend_reads == []
+
+
+def test_call_service_from_another_thread_leaves_the_pass_alone():
+    app = _make_app()
+    with app.evaluation_scope():
+        app._callback_counts = [0, 0]
+        app._callback_counts_thread = threading.get_ident()
+        app.get_state("binary_sensor.door1")
+        snapshot = app._state_snapshot = {"binary_sensor.door1": {"state": "on"}}
+
+        worker = threading.Thread(target=lambda: (
+            app.call_service("media_player/volume_set", entity_id="binary_sensor.door1", volume_level=0.5),
+            app.get_state("binary_sensor.door2")))
+        worker.start()
+        worker.join()
+
+        assert len(app.service_calls) == 1
+        assert app._callback_counts == [1, 0]
+        assert app._state_snapshot is snapshot
+        assert ("binary_sensor.door1", None, None) in app._state_cache
+        assert ("binary_sensor.door2", None, None) not in app._state_cache
+
+        # the owning thread still drops the cached read of its targets
+        app.call_service("light/turn_on", entity_id="binary_sensor.door1")
+        assert app._callback_counts == [1, 1]
+        assert ("binary_sensor.door1", None, None) not in app._state_cache
+        assert app._state_snapshot is None
+        app._callback_counts = None
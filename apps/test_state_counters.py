@@ -0,0 +1,93 @@
+from datetime import datetime, timezone, timedelta
+
+from apps.base import StateCounter
+from tests.base.factories import make_base_app
+
+
+def _iso(seconds_ago):
+    return (datetime.now(timezone.utc) - timedelta(seconds=seconds_ago)).isoformat()
+
+
+def test_state_counter_counts_and_recent_index():
+    now = datetime.now(timezone.utc)
+    counter = StateCounter(['binary_sensor.a', 'binary_sensor.b', 'binary_sensor.c'])
+    counter.update('binary_sensor.a', 'off', now - timedelta(seconds=600))
+    counter.update('binary_sensor.b', 'off', now - timedelta(seconds=20))
+    counter.update('binary_sensor.c', 'on', now - timedelta(seconds=5))
+
+    assert counter.count('on') == 1
+    assert counter.count('off') == 2
+    assert counter.count_recent(30, now) == 2
+    assert counter.count_recent(30, now, exclude_state='on') == 1
+    assert counter.last_updated() == now - timedelta(seconds=5)
+
+    assert counter.update('binary_sensor.c', 'off', now) is True
+    assert counter.count('on') == 0
+    assert counter.count('off') == 3
+
+
+def test_counts_use_counters_and_fall_back_to_scan():
+    app = make_base_app()
+    del app.get_seconds_since_update
+    states = {
+        'binary_sensor.door1': ('on', _iso(600)),
+        'binary_sensor.door2': ('off', _iso(10)),
+        'binary_sensor.motion1': ('off', _iso(120)),
+        'device_tracker.phone1': ('home', _iso(3600)),
+    }
+
+    def get_state(entity, attribute=None):
+        state, last_updated = states.get(entity, (None, None))
+        return last_updated if attribute == 'last_updated' else state
+
+    listeners = []
+    app.get_state = get_state
+    app.listen_state = lambda cb, entity, **kwargs: listeners.append((entity, kwargs))
+    app.run_every = lambda cb, start, interval: None
+    app._state_counters = {}
+    app.setup_state_counters()
+
+    assert {entity for entity, _ in listeners} == {
+        'binary_sensor.door1', 'binary_sensor.door2', 'binary_sensor.motion1',
+        'device_tracker.phone1', 'sensor.awake1', 'light.l1', 'vacuum.cleaner1'}
+
+    # door2 is off but was updated within the opening timeout
+    assert app.count_on_opening_sensors() == 2
+    assert app.count_home_device_trackers() == 1
+    assert 100 < app.get_last_motion() < 200
+
+    # state events keep the counters current without further get_state reads
+    app.get_state = None
+    app.state_counter_callback('binary_sensor.motion1', 'all', None,
+                               {'state': 'on', 'last_updated': _iso(0)},
+                               {'categories': ['_motion_sensors']})
+    app.state_counter_callback('device_tracker.phone1', 'all', None,
+                               {'state': 'not_home', 'last_updated': _iso(0)},
+                               {'categories': ['_device_trackers']})
+    assert app.count_on_motion_sensors() == 1
+    assert app.get_last_motion() == 0
+    assert app.count_home_device_trackers() == 0
+
+    # a reassigned list no longer matches its counter
+    app.get_state = get_state
+    app._device_trackers = ['device_tracker.phone1']
+    assert app.count_home_device_trackers() == 1
+
+
+def test_reconcile_fixes_drift():
+    app = make_base_app()
+    states = {'light.l1': 'on'}
+    app.get_state = lambda entity, attribute=None: None if attribute else states.get(entity)
+    app.listen_state = lambda cb, entity, **kwargs: None
+    app.run_every = lambda cb, start, interval: None
+    logs = []
+    app.log = lambda msg, level='INFO', *a, **k: logs.append((level, msg))
+    app.setup_state_counters()
+    assert app.count_on_lights() == 1
+
+    # an event was missed
+    states['light.l1'] = 'off'
+    assert app.count_on_lights() == 1
+    app.reconcile_state_counters()
+    assert app.count_on_lights() == 0
+    assert any(level == 'WARNING' for level, _ in logs)
@@ -48,3 +48,55 @@ def test_check_sensor_not_ignored_when_unavailability_older_than_timeout(make_al
 
     assert app.check_sensor('s3', desired_state='off', timeout=10) is False
 
+
+
+def test_unavailability_log_keeps_a_bounded_ring_per_sensor():
+    from apps.alarm import UnavailabilityLog
+
+    log = UnavailabilityLog(capacity=3)
+    for i in range(10):
+        assert log.start('s1', 100.0 * i)
+        assert not log.start('s1', 100.0 * i + 1)
+        log.end('s1', 100.0 * i + 10)
+    assert log.start('s1', 1000.0)
+
+    # only the newest periods are kept, in a fixed-size array
+    assert log.periods('s1') == [(800.0, 810.0), (900.0, 910.0), (1000.0, None)]
+    assert len(log._rings['s1']) == 6
+    assert log.is_unavailable('s1')
+    assert log.count_since('s1', 850) == 2
+    assert log.get('s1') == {'start': datetime.fromtimestamp(1000, timezone.utc), 'end': None}
+    assert UnavailabilityLog.from_dict(log.to_dict(), 3).periods('s1') == log.periods('s1')
+
+
+def test_flapping_sensor_is_quarantined_and_released(make_alarm_with_maps):
+    from apps.alarm import UnavailabilityLog
+
+    app = make_alarm_with_maps({'s1': 'door', 's2': 'door'}, {'s1': 'off', 's2': 'off'},
+                               {'armed_away': {'g1': ['s1', 's2']}})
+    now = [datetime(2024, 1, 1, tzinfo=timezone.utc)]
+    app.get_utc_time = lambda: now[0]
+    app._sensors_ignored = set()
+    app._sensors_unavailable = UnavailabilityLog()
+    app._sensors_quarantined = frozenset()
+    app._unavailable_quarantine_count = 3
+    app._unavailable_quarantine_window = 3600
+    app.is_sensor_monitored = lambda sensor: False
+
+    for _ in range(3):
+        app.sensor_change_callback('s1', 'state', 'off', 'unavailable', {})
+        now[0] += timedelta(minutes=5)
+        app.sensor_change_callback('s1', 'state', 'unavailable', 'off', {})
+    assert app._sensors_quarantined == {'s1'}
+    assert app.get_unavailable_stats() == {'s1': 3}
+
+    # the ignore set is cleared on disarm, the quarantine is not
+    app._sensors_ignored = set()
+    assert app.get_sensor_index().by_arming_state['armed_away'] == (('s2', 'door', 'burglar'),)
+
+    app.release_quarantined_sensors()
+    assert app._sensors_quarantined == {'s1'}
+    now[0] += timedelta(hours=1)
+    app.release_quarantined_sensors()
+    assert app._sensors_quarantined == frozenset()
+    assert [sensor for sensor, *_ in app.get_sensor_index().by_arming_state['armed_away']] == ['s1', 's2']
@@ -76,7 +76,7 @@ class WeatherWarning(BaseApp):
 
         If 'date' is naive (no tzinfo) it is assumed to be in UTC.
         """
-        now = datetime.now(timezone.utc)
+        now = self.get_utc_time()
 
         if date.tzinfo is None:  # If 'date' is naive, assume UTC
             date = date.replace(tzinfo=timezone.utc)
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for hot paths in the apps.
+
+The apps are loaded against the in-memory Home Assistant of
+`scripts/harness.py`, so no AppDaemon installation is needed. The `replay`
+scenario drives all apps with a recorded (`--trace`) or synthetic
+state_changed trace in virtual time.
+
+Run this from the repo root: `python3 scripts/benchmark.py [scenario ...]`
+"""
+from pathlib import Path
+from datetime import timedelta
+import argparse
+import logging
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import harness  # noqa: E402
+
+
+def make_alarm_app(replay, sensor_count):
+    """Build an AlarmControl with `sensor_count` closed door/window/motion sensors."""
+    from alarm import AlarmControl
+
+    stamp = replay.clock.now - timedelta(hours=1)
+    classes = ['door', 'window', 'motion', 'smoke', 'moisture']
+    states = {'alarm_control_panel.home': ('armed_away', {})}
+    sensors = []
+    for i in range(sensor_count):
+        device_class = classes[i % len(classes)]
+        entity = f'binary_sensor.{device_class}_{i}'
+        states[entity] = ('off', {'device_class': device_class})
+        sensors.append(entity)
+    replay.hub.seed(states)
+    for state in replay.hub.states.values():
+        state['last_updated'] = state['last_changed'] = stamp.isoformat()
+
+    app = replay.make_app(AlarmControl, 'alarm')
+    app._sensors = {'armed_away': {'bench': sensors}, 'always': {}}
+    app._sensor_mapping = {
+        'door': ['door', 'garage_door', 'opening'],
+        'window': ['window'],
+        'motion': ['motion', 'moving', 'occupancy', 'presence'],
+        'tamper': ['tamper', 'sound', 'vibration'],
+        'environmental': ['carbon_monoxide', 'gas', 'heat', 'moisture', 'smoke', 'safety', 'temperature'],
+    }
+    app._alarm_mapping = {
+        'burglar': ['door', 'garage_door', 'opening', 'window', 'motion', 'moving', 'occupancy', 'presence', 'tamper', 'sound', 'vibration'],
+        'fire': ['carbon_monoxide', 'gas', 'heat', 'smoke', 'temperature'],
+        'water': ['moisture'],
+        'safety': ['safety'],
+    }
+    app._sensors_ignored = []
+    app._sensors_unavailable = {}
+    app._fire_temperature_threshold = 50
+    app._alarm_control_panel = 'alarm_control_panel.home'
+    app._vacuum_cleaners = []
+    app._opening_timeout = 30
+    app._motion_timeout = 300
+    return app
+
+
+def bench(fn, repeat):
+    """Return the best-of-three mean wall time of `fn` in milliseconds."""
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        elapsed = (time.perf_counter() - start) * 1000 / repeat
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def scenario_alerts(args):
+    """get_alerts over N sensors with DEBUG disabled, full scan and live set."""
+    from base import DeadlineHeap
+
+    app = make_alarm_app(harness.Replay(), args.sensors)
+    result = app.get_alerts(arming_state='armed_away')
+    assert result == {}, result
+    ms = bench(lambda: app.get_alerts(arming_state='armed_away'), args.repeat)
+    print(f"get_alerts over {args.sensors} sensors (DEBUG off, scan): {ms:.3f} ms/call")
+
+    app._live_alerts = {}
+    app._alert_deadlines = DeadlineHeap()
+    app._alert_timer = None
+    app._alert_timer_deadline = None
+    app.refresh_live_alerts()
+    ms = bench(lambda: app.get_alerts(arming_state='armed_away'), args.repeat)
+    print(f"get_alerts over {args.sensors} sensors (DEBUG off, live): {ms:.3f} ms/call")
+    sensor = app._sensors['armed_away']['bench'][0]
+    ms = bench(lambda: app.update_sensor_alert(sensor), args.repeat)
+    print(f"update_sensor_alert for one sensor: {ms:.4f} ms/call")
+
+
+def scenario_replay(args):
+    """Replay a state_changed trace through all apps in virtual time."""
+    replay = harness.Replay(log_level=logging.DEBUG if args.debug else logging.INFO)
+    states, apps = harness.synthetic_house(args.scale)
+    for _, _, app_args in apps.values():
+        app_args['callback_sample_rate'] = args.sample_rate
+    replay.hub.seed(states)
+    replay.load(apps)
+    if args.trace:
+        trace = harness.load_trace(args.trace)
+    else:
+        trace = harness.synthetic_trace(states, events=args.events, seed=args.seed)
+
+    wall = replay.run(trace)
+    print(f"replayed {replay.events} events in {wall * 1000:.1f} ms ({replay.events / wall:.0f} events/s)")
+    print(f"{'app':<10} {'callbacks':>9} {'cb/s':>9} {'get_state/ev':>12} {'services':>8} {'p50 ms':>8} {'p99 ms':>8} {'errors':>6}")
+    for name, metrics in replay.report().items():
+        print(f"{name:<10} {metrics['callbacks']:>9} {metrics['callbacks_per_sec']:>9.0f} "
+              f"{metrics['get_state_per_event']:>12.2f} {metrics['service_calls']:>8} "
+              f"{metrics['p50_ms']:>8.3f} {metrics['p99_ms']:>8.3f} {metrics['errors']:>6}")
+
+    if args.sample_rate > 0:
+        print(f"\n{'callback':<40} {'calls':>7} {'avg ms':>8} {'p99 ms':>8} {'get_state':>9} {'services':>8}")
+        for name, app in replay.apps.items():
+            for callback, stats in app.get_callback_stats().items():
+                if stats['invocations']:
+                    print(f"{name + '.' + callback:<40} {stats['invocations']:>7} {stats['latency_avg_ms']:>8.3f} "
+                          f"{stats['latency_p99_ms']:>8.3f} {stats['get_state_avg']:>9.2f} {stats['call_service_avg']:>8.2f}")
+
+
+def scenario_startup(args):
+    """AlarmControl start-up cost: listeners, memory and timers during a trace."""
+    import importlib
+    import tracemalloc
+
+    # keep the module import out of the measurement
+    importlib.import_module('alarm')
+
+    states, apps = harness.synthetic_house(args.scale)
+    replay = harness.Replay()
+    replay.hub.seed(states)
+    tracemalloc.start()
+    began = time.perf_counter()
+    replay.load(apps, only={'alarm'})
+    wall = time.perf_counter() - began
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    listeners = sum(1 for listener in replay.hub.state_listeners.values() if listener.app is replay.apps['alarm'])
+    print(f"alarm initialize: {wall * 1000:.1f} ms, {listeners} state listeners, peak {peak / 1024:.0f} KiB")
+
+    trace = harness.synthetic_trace(states, events=args.events, seed=args.seed)
+    scheduled = replay.clock.scheduled
+    replay.run(trace)
+    print(f"timers scheduled while replaying {replay.events} events: {replay.clock.scheduled - scheduled}")
+
+
+def partition_configs(states, apps):
+    """Split the synthetic alarm into house, garage and shed: as three apps and as one partitioned app."""
+    args = apps['alarm'][2]
+    doors = args['armed_away_binary_sensors'][:len(args['armed_away_binary_sensors']) // 3]
+    motions = [sensor for sensor in args['armed_away_binary_sensors'] if 'motion' in sensor]
+    split = {
+        'house': {'alarm_control_panel': 'alarm_control_panel.home',
+                  'armed_home_binary_sensors': args['armed_home_binary_sensors'],
+                  'armed_away_binary_sensors': args['armed_away_binary_sensors'],
+                  'fire_binary_sensors': args['fire_binary_sensors'],
+                  'water_binary_sensors': args['water_binary_sensors']},
+        'garage': {'alarm_control_panel': 'alarm_control_panel.garage',
+                   'armed_away_binary_sensors': doors, 'armed_away_sensor_threshold': 1},
+        'shed': {'alarm_control_panel': 'alarm_control_panel.shed',
+                 'armed_away_binary_sensors': motions[:len(motions) // 2]},
+    }
+    states['alarm_control_panel.garage'] = ('disarmed', {})
+    states['alarm_control_panel.shed'] = ('disarmed', {})
+    shared = {key: value for key, value in args.items() if not key.startswith(('armed_', 'fire_', 'water_', 'alarm_control_panel'))}
+    separate = {name: ('alarm', 'AlarmControl', {**shared, **config}) for name, config in split.items()}
+    partitioned = {'alarm': ('alarm', 'AlarmControl', {**shared, **split['house'],
+                                                       'partitions': {'garage': split['garage'], 'shed': split['shed']}})}
+    return separate, partitioned
+
+
+def scenario_partitions(args):
+    """Three AlarmControl apps vs one app with three partitions."""
+    states, apps = harness.synthetic_house(args.scale)
+    separate, partitioned = partition_configs(states, apps)
+    trace = harness.synthetic_trace(states, events=args.events, seed=args.seed)
+    print(f"{'setup':<12} {'listeners':>9} {'callbacks':>9} {'get_state/ev':>12} {'wall ms':>8}")
+    for label, configs in (('3 apps', separate), ('partitions', partitioned)):
+        replay = harness.Replay()
+        replay.hub.seed(states)
+        replay.load(configs)
+        listeners = len(replay.hub.state_listeners)
+        wall = replay.run(trace)
+        metrics = replay.report().values()
+        callbacks = sum(m['callbacks'] for m in metrics)
+        reads = sum(m['get_state_per_event'] for m in metrics)
+        print(f"{label:<12} {listeners:>9} {callbacks:>9} {reads:>12.2f} {wall * 1000:>8.1f}")
+
+
+def scenario_climate(args):
+    """State reads of one ClimateControl.update_climate pass over the synthetic house."""
+    states, apps = harness.synthetic_house(args.scale)
+    replay = harness.Replay()
+    replay.hub.seed(states)
+    replay.load(apps, only={'climate'})
+    app = replay.apps['climate']
+    stats = replay.hub.stats['climate']
+    listeners = sum(1 for listener in replay.hub.state_listeners.values() if listener.app is app)
+    print(f"{len(app._climate_controls)} climate entities: {listeners} state listeners")
+    passes = 3 * args.repeat
+    backend = stats.get_state
+    app._callback_counts = [0, 0]
+    ms = bench(app.update_climate, args.repeat)
+    calls = app._callback_counts[0]
+    app._callback_counts = None
+    print(f"update_climate: {ms:.3f} ms/pass, "
+          f"{calls / passes:.1f} get_state calls/pass, {(stats.get_state - backend) / passes:.1f} backend reads/pass")
+
+    # every device drifted from the desired settings, e.g. after a power cut
+    for entity in app._climate_controls:
+        replay.hub.states[entity]['state'] = 'off'
+        replay.hub.states[entity]['attributes'].update(temperature=15, fan_mode='High', preset_mode='none')
+    services = stats.services
+    app.update_climate()
+    print(f"service calls to correct {len(app._climate_controls)} drifted entities: {stats.services - services}")
+
+
+def make_snapshot_app(replay, entities, mode):
+    """Build an initialized BaseApp whose lists hold `entities` sensors and lights."""
+    from base import BaseApp, cached_evaluation
+
+    class SnapshotApp(BaseApp):
+
+        @cached_evaluation
+        def evaluate(self):
+            return (self.count_on_opening_sensors(), self.count_on_motion_sensors(),
+                    self.count_home_device_trackers(), self.count_on_lights())
+
+    per_list = max(1, entities // 4)
+    args = {
+        'opening_sensors': [f'binary_sensor.door_{i}' for i in range(per_list)],
+        'motion_sensors': [f'binary_sensor.motion_{i}' for i in range(per_list)],
+        'device_trackers': [f'person.resident_{i}' for i in range(per_list)],
+        'lights': [f'light.room_{i}' for i in range(per_list)],
+        'state_snapshot': mode,
+    }
+    states = {entity: ('off', {'friendly_name': entity}) for key in ('opening_sensors', 'motion_sensors', 'lights') for entity in args[key]}
+    states.update({entity: ('home', {}) for entity in args['device_trackers']})
+    replay.hub.seed(states)
+    app = replay.make_app(SnapshotApp, 'snapshot', args)
+    app.initialize()
+    return app
+
+
+def scenario_snapshot(args):
+    """One evaluation pass with per-entity reads vs a namespace snapshot."""
+    sizes = [20, 40, 60, 100, 200, 500]
+    print(f"namespace of {args.namespace} entities; ms per evaluation")
+    print(f"{'entities':>8} {'per-entity':>10} {'snapshot':>10} {'auto':>10}")
+    for size in sizes:
+        results = []
+        for mode in ('never', 'always', 'auto'):
+            replay = harness.Replay()
+            replay.hub.seed({f'sensor.other_{i}': (str(i), {'unit_of_measurement': 'W'}) for i in range(args.namespace)})
+            app = make_snapshot_app(replay, size, mode)
+            results.append(bench(app.evaluate, args.repeat))
+        auto = 'snapshot' if app.use_state_snapshot() else 'per-entity'
+        print(f"{size:>8} {results[0]:>10.3f} {results[1]:>10.3f} {auto:>10}")
+
+
+SCENARIOS = {
+    'alerts': scenario_alerts,
+    'climate': scenario_climate,
+    'partitions': scenario_partitions,
+    'snapshot': scenario_snapshot,
+    'replay': scenario_replay,
+    'startup': scenario_startup,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('scenarios', nargs='*', help=f"scenarios to run (default: all of {', '.join(sorted(SCENARIOS))})")
+    parser.add_argument('--sensors', type=int, default=500, help='number of sensors to simulate')
+    parser.add_argument('--repeat', type=int, default=50, help='iterations per measurement')
+    parser.add_argument('--trace', help='JSONL state_changed trace to replay (default: synthetic)')
+    parser.add_argument('--events', type=int, default=2000, help='synthetic trace length')
+    parser.add_argument('--seed', type=int, default=1, help='synthetic trace seed')
+    parser.add_argument('--namespace', type=int, default=1000, help='unrelated entities in the snapshot scenario')
+    parser.add_argument('--scale', type=int, default=1, help='synthetic house size multiplier')
+    parser.add_argument('--debug', action='store_true', help='replay with DEBUG logging enabled')
+    parser.add_argument('--sample-rate', type=float, default=0, help='callback instrumentation sample rate for replay')
+    args = parser.parse_args()
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    harness.install()
+    for name in args.scenarios or sorted(SCENARIOS):
+        SCENARIOS[name](args)
+
+
+if __name__ == '__main__':
+    main()
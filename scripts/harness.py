@@ -0,0 +1,706 @@
+"""Deterministic replay harness for the apps.
+
+The harness replaces `appdaemon.plugins.hass.hassapi.Hass` with an in-memory
+implementation so the apps can be driven offline:
+
+- `VirtualClock` runs `run_in`, `run_every`, `run_daily` and the `duration`
+  timers of `listen_state` in virtual time.
+- `HassHub` is a small Home Assistant state machine. It applies the effects
+  of the services the apps call (lights, switches, climate, alarm panel) and
+  dispatches state changes to the registered listeners.
+- `load_trace` reads recorded `state_changed` events (JSONL), and
+  `synthetic_house`/`synthetic_trace` generate a seeded stand-in.
+- `Replay` wires it together and collects per-app metrics: callbacks,
+  callback latency, backend `get_state` reads and service calls.
+
+Call `install()` before importing any app module. Some apps iterate over
+sets, so run with a fixed `PYTHONHASHSEED` when comparing counts between
+runs.
+"""
+from collections import defaultdict, deque
+from datetime import datetime, time as dt_time, timedelta, timezone
+from pathlib import Path
+import copy
+import heapq
+import importlib
+import itertools
+import json
+import logging
+import random
+import sys
+import time
+import types
+
+ROOT = Path(__file__).resolve().parents[1]
+APPS = ROOT / 'apps'
+
+ON_OFF_DOMAINS = ('light', 'switch', 'fan', 'input_boolean', 'siren', 'automation')
+ALARM_ACTIONS = {
+    'alarm_arm_home': 'armed_home',
+    'alarm_arm_away': 'armed_away',
+    'alarm_arm_night': 'armed_night',
+    'alarm_arm_vacation': 'armed_vacation',
+    'alarm_disarm': 'disarmed',
+    'alarm_trigger': 'triggered',
+}
+
+
+class VirtualClock:
+    """Virtual UTC time with a heap of pending timers."""
+
+    def __init__(self, start):
+        self.now = start
+        self._timers = []
+        self._cancelled = set()
+        self._handles = itertools.count(1)
+        self.scheduled = 0
+
+    def schedule(self, when, callback):
+        """Run `callback()` once the clock reaches `when`; returns a handle."""
+        handle = next(self._handles)
+        self.scheduled += 1
+        heapq.heappush(self._timers, (when, handle, callback))
+        return handle
+
+    def cancel(self, handle):
+        self._cancelled.add(handle)
+
+    def is_pending(self, handle):
+        return handle not in self._cancelled and any(h == handle for _, h, _ in self._timers)
+
+    def advance(self, until, on_step=None):
+        """Move the clock to `until`, firing due timers in order.
+
+        Args:
+            until (datetime): target time.
+            on_step (callable|None): called after every fired timer.
+        """
+        while self._timers and self._timers[0][0] <= until:
+            when, handle, callback = heapq.heappop(self._timers)
+            if handle in self._cancelled:
+                self._cancelled.discard(handle)
+                continue
+            self.now = max(self.now, when)
+            callback()
+            if on_step is not None:
+                on_step()
+        self.now = max(self.now, until)
+
+
+class AppStats:
+    """Metrics collected for one app."""
+
+    def __init__(self):
+        self.callbacks = 0
+        self.errors = 0
+        self.latencies = []
+        self.get_state = 0
+        self.services = 0
+        self.logs = defaultdict(int)
+
+    def percentile(self, q):
+        if not self.latencies:
+            return 0.0
+        values = sorted(self.latencies)
+        return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+    def summary(self, events):
+        busy = sum(self.latencies)
+        return {
+            'callbacks': self.callbacks,
+            'errors': self.errors,
+            'callbacks_per_sec': self.callbacks / busy if busy else 0.0,
+            'get_state_per_event': self.get_state / events if events else 0.0,
+            'service_calls': self.services,
+            'p50_ms': self.percentile(0.5) * 1000,
+            'p99_ms': self.percentile(0.99) * 1000,
+        }
+
+
+class _StateListener:
+
+    def __init__(self, app, callback, entity, attribute, new, old, duration, oneshot, kwargs):
+        self.app = app
+        self.callback = callback
+        self.entity = entity
+        self.attribute = attribute
+        self.new = new
+        self.old = old
+        self.duration = duration
+        self.oneshot = oneshot
+        self.kwargs = kwargs
+        self.pending = {}
+
+    def matches_entity(self, entity_id):
+        if self.entity is None:
+            return True
+        if '.' not in self.entity:
+            return entity_id.split('.', 1)[0] == self.entity
+        return entity_id == self.entity
+
+    def values(self, old_state, new_state):
+        if self.attribute == 'all':
+            return old_state, new_state
+        if self.attribute is None:
+            return (old_state or {}).get('state'), (new_state or {}).get('state')
+        return (_attribute(old_state, self.attribute), _attribute(new_state, self.attribute))
+
+
+def _attribute(state, attribute):
+    if state is None:
+        return None
+    if attribute in state and attribute != 'attributes':
+        return state[attribute]
+    return state.get('attributes', {}).get(attribute)
+
+
+class HassHub:
+    """In-memory Home Assistant state machine shared by all harness apps."""
+
+    def __init__(self, clock, tz='UTC', log_level=logging.INFO, echo_logs=False):
+        self.clock = clock
+        self.tz = tz
+        self.log_level = log_level
+        self.echo_logs = echo_logs
+        self.states = {}
+        self.state_listeners = {}
+        self.event_listeners = {}
+        self.service_calls = []
+        self.stats = defaultdict(AppStats)
+        self._handles = itertools.count(1)
+        self._queue = deque()
+        self._timers = {}
+
+    # -- state -----------------------------------------------------------
+
+    def set_state(self, entity_id, state=None, attributes=None, replace=False):
+        """Update an entity and queue the state change for the listeners."""
+        old = self.states.get(entity_id)
+        now = self.clock.now.isoformat()
+        new = copy.deepcopy(old) if old is not None else {
+            'entity_id': entity_id, 'state': None, 'attributes': {},
+            'last_changed': now, 'last_updated': now}
+        if state is not None:
+            new['state'] = str(state) if not isinstance(state, str) else state
+        if attributes is not None:
+            new['attributes'] = dict(attributes) if replace else {**new['attributes'], **attributes}
+        if old is not None and old['state'] == new['state'] and old['attributes'] == new['attributes']:
+            return
+        if old is None or old['state'] != new['state']:
+            new['last_changed'] = now
+        new['last_updated'] = now
+        self.states[entity_id] = new
+        self._queue.append((entity_id, old, new))
+
+    def seed(self, states):
+        """Set initial states without notifying listeners."""
+        now = self.clock.now.isoformat()
+        for entity_id, (state, attributes) in states.items():
+            self.states[entity_id] = {
+                'entity_id': entity_id, 'state': state, 'attributes': dict(attributes or {}),
+                'last_changed': now, 'last_updated': now}
+
+    def drain(self):
+        """Dispatch queued state changes, including those caused by callbacks."""
+        while self._queue:
+            entity_id, old, new = self._queue.popleft()
+            self._dispatch_state(entity_id, old, new)
+            self._dispatch_event('state_changed', {'entity_id': entity_id, 'old_state': old, 'new_state': new})
+
+    def _dispatch_state(self, entity_id, old_state, new_state):
+        for handle, listener in list(self.state_listeners.items()):
+            if not listener.matches_entity(entity_id):
+                continue
+            old, new = listener.values(old_state, new_state)
+            if listener.attribute != 'all' and old == new:
+                continue
+
+            # a pending duration timer is cancelled by any further change
+            pending = listener.pending.pop(entity_id, None)
+            if pending is not None:
+                self.clock.cancel(pending)
+
+            if listener.old is not None and listener.old != old:
+                continue
+            if listener.new is not None and listener.new != new:
+                continue
+
+            attribute = listener.attribute or 'state'
+            if listener.duration:
+                def fire(listener=listener, handle=handle, entity_id=entity_id, old=old, new=new):
+                    listener.pending.pop(entity_id, None)
+                    if handle in self.state_listeners:
+                        self._fire_state(handle, listener, entity_id, attribute, old, new)
+                listener.pending[entity_id] = self.clock.schedule(
+                    self.clock.now + timedelta(seconds=float(listener.duration)), fire)
+            else:
+                self._fire_state(handle, listener, entity_id, attribute, old, new)
+
+    def _fire_state(self, handle, listener, entity_id, attribute, old, new):
+        if listener.oneshot:
+            self.state_listeners.pop(handle, None)
+        self.invoke(listener.app, listener.callback, entity_id, attribute, old, new, dict(listener.kwargs))
+
+    def _dispatch_event(self, event, data):
+        for app, callback, name, filters in list(self.event_listeners.values()):
+            if name is not None and name != event:
+                continue
+            if any(key in data and data[key] != value for key, value in filters.items()):
+                continue
+            self.invoke(app, callback, event, data, dict(filters))
+
+    def fire_event(self, event, **data):
+        self._dispatch_event(event, data)
+
+    # -- callbacks and timers --------------------------------------------
+
+    def invoke(self, app, callback, *args):
+        """Run an app callback, timing it and recording errors like AppDaemon."""
+        stats = self.stats[app.name]
+        start = time.perf_counter()
+        try:
+            callback(*args)
+        except Exception as e:
+            stats.errors += 1
+            if self.echo_logs:
+                print(f"{app.name}: callback {getattr(callback, '__name__', callback)} failed: {e!r}")
+        stats.latencies.append(time.perf_counter() - start)
+        stats.callbacks += 1
+
+    def schedule(self, app, callback, when, kwargs, interval=None):
+        handle = next(self._handles)
+        self._schedule(handle, app, callback, when, kwargs, interval)
+        return handle
+
+    def _schedule(self, handle, app, callback, when, kwargs, interval):
+        def fire():
+            self._timers.pop(handle, None)
+            if interval:
+                self._schedule(handle, app, callback, when + timedelta(seconds=interval), kwargs, interval)
+            self.invoke(app, callback, dict(kwargs))
+        self._timers[handle] = self.clock.schedule(when, fire)
+
+    def cancel_timer(self, handle):
+        clock_handle = self._timers.pop(handle, None)
+        if clock_handle is not None:
+            self.clock.cancel(clock_handle)
+
+    # -- services --------------------------------------------------------
+
+    def call_service(self, app, service, kwargs):
+        """Record a service call and apply its effect on the state machine."""
+        self.stats[app.name].services += 1
+        data = dict(kwargs.get('service_data') or {})
+        data.update({k: v for k, v in kwargs.items() if k not in ('service_data', 'namespace')})
+        self.service_calls.append((self.clock.now, app.name, service, data))
+
+        domain, action = service.split('/', 1)
+        entities = data.get('entity_id') or []
+        if isinstance(entities, str):
+            entities = [entities]
+
+        for entity_id in entities:
+            entity_domain = entity_id.split('.', 1)[0]
+            if action in ('turn_on', 'turn_off', 'toggle') and entity_domain in ON_OFF_DOMAINS:
+                state = 'on' if action == 'turn_on' else 'off'
+                if action == 'toggle':
+                    state = 'off' if self.states.get(entity_id, {}).get('state') == 'on' else 'on'
+                attributes = {k: v for k, v in data.items() if k != 'entity_id'}
+                self.set_state(entity_id, state, attributes if state == 'on' else None)
+            elif domain == 'camera' and action in ('turn_on', 'turn_off'):
+                self.set_state(entity_id, 'streaming' if action == 'turn_on' else 'idle')
+            elif domain == 'climate':
+                if action == 'set_hvac_mode':
+                    self.set_state(entity_id, data['hvac_mode'], {'hvac_mode': data['hvac_mode']})
+                elif action == 'set_temperature':
+                    self.set_state(entity_id, data.get('hvac_mode'), {'temperature': data['temperature']})
+                elif action.startswith('set_') and action[4:] in data:
+                    self.set_state(entity_id, None, {action[4:]: data[action[4:]]})
+            elif domain == 'alarm_control_panel' and action in ALARM_ACTIONS:
+                self.set_state(entity_id, ALARM_ACTIONS[action])
+            elif domain == 'media_player' and action == 'volume_set':
+                self.set_state(entity_id, None, {'volume_level': data.get('volume_level')})
+
+
+class HarnessHass:
+    """Stand-in for `hassapi.Hass` backed by a `HassHub`."""
+
+    hub = None
+
+    # -- logging ---------------------------------------------------------
+
+    def log(self, message, level='INFO', *args, ascii_encode=True, **kwargs):
+        self.hub.stats[self.name].logs[level] += 1
+        if self.hub.echo_logs and logging.getLevelName(level) >= self.hub.log_level:
+            print(f"{self.hub.clock.now.isoformat()} {level} {self.name}: {message}")
+
+    def error(self, message, level='WARNING', *args, **kwargs):
+        self.log(message, level='ERROR')
+
+    def get_main_log(self):
+        logger = logging.getLogger(f'harness.{self.name}')
+        logger.setLevel(self.hub.log_level)
+        return logger
+
+    def set_log_level(self, level):
+        self.hub.log_level = logging.getLevelName(level)
+
+    # -- state -----------------------------------------------------------
+
+    def get_state(self, entity_id=None, attribute=None, default=None, copy=True, **kwargs):
+        self.hub.stats[self.name].get_state += 1
+        states = self.hub.states
+        if entity_id is None:
+            return {k: dict(v) for k, v in states.items()}
+        if '.' not in entity_id:
+            return {k: dict(v) for k, v in states.items() if k.startswith(entity_id + '.')}
+        state = states.get(entity_id)
+        if state is None:
+            return default
+        if attribute is None:
+            return state['state']
+        if attribute == 'all':
+            return __import__('copy').deepcopy(state) if copy else state
+        value = _attribute(state, attribute)
+        return default if value is None else value
+
+    def set_state(self, entity_id, state=None, attributes=None, replace=False, **kwargs):
+        self.hub.set_state(entity_id, state, attributes, replace)
+
+    def listen_state(self, callback, entity_id=None, attribute=None, new=None, old=None,
+                     duration=None, oneshot=False, **kwargs):
+        handle = next(self.hub._handles)
+        self.hub.state_listeners[handle] = _StateListener(
+            self, callback, entity_id, attribute, new, old, duration, oneshot, kwargs)
+        return handle
+
+    def cancel_listen_state(self, handle):
+        listener = self.hub.state_listeners.pop(handle, None)
+        if listener is not None:
+            for pending in listener.pending.values():
+                self.hub.clock.cancel(pending)
+
+    def listen_event(self, callback, event=None, **kwargs):
+        handle = next(self.hub._handles)
+        self.hub.event_listeners[handle] = (self, callback, event, kwargs)
+        return handle
+
+    def cancel_listen_event(self, handle):
+        self.hub.event_listeners.pop(handle, None)
+
+    def fire_event(self, event, **kwargs):
+        self.hub.fire_event(event, **kwargs)
+
+    # -- services --------------------------------------------------------
+
+    def call_service(self, service, **kwargs):
+        self.hub.call_service(self, service, kwargs)
+
+    def turn_on(self, entity_id, **kwargs):
+        self.call_service(f"{entity_id.split('.', 1)[0]}/turn_on", entity_id=entity_id, **kwargs)
+
+    def turn_off(self, entity_id, **kwargs):
+        self.call_service(f"{entity_id.split('.', 1)[0]}/turn_off", entity_id=entity_id, **kwargs)
+
+    def toggle(self, entity_id, **kwargs):
+        self.call_service(f"{entity_id.split('.', 1)[0]}/toggle", entity_id=entity_id, **kwargs)
+
+    # -- time ------------------------------------------------------------
+
+    def get_now(self):
+        return self.hub.clock.now
+
+    def get_timezone(self):
+        return self.hub.tz
+
+    def parse_time(self, value, name=None, aware=False):
+        return datetime.strptime(value, '%H:%M:%S').time()
+
+    def now_is_between(self, start_time, end_time, name=None):
+        now = self.hub.clock.now.astimezone(self.get_local_timezone()).time()
+        start = self.parse_time(start_time)
+        end = self.parse_time(end_time)
+        if start <= end:
+            return start <= now <= end
+        return now >= start or now <= end
+
+    def run_in(self, callback, delay, **kwargs):
+        return self.hub.schedule(self, callback, self.hub.clock.now + timedelta(seconds=float(delay)), kwargs)
+
+    def run_at(self, callback, start, **kwargs):
+        return self.hub.schedule(self, callback, start, kwargs)
+
+    def run_every(self, callback, start, interval, **kwargs):
+        now = self.hub.clock.now
+        if isinstance(start, datetime):
+            when = start
+        elif start == 'now':
+            when = now
+        else:
+            when = now + timedelta(seconds=float(start.split('+', 1)[1]))
+        return self.hub.schedule(self, callback, when, kwargs, interval=interval)
+
+    def run_daily(self, callback, start, **kwargs):
+        tz = self.get_local_timezone()
+        local_now = self.hub.clock.now.astimezone(tz)
+        when = datetime.combine(local_now.date(), start if isinstance(start, dt_time) else self.parse_time(start), tzinfo=tz)
+        if when <= local_now:
+            when += timedelta(days=1)
+        return self.hub.schedule(self, callback, when.astimezone(timezone.utc), kwargs, interval=24 * 3600)
+
+    def cancel_timer(self, handle):
+        self.hub.cancel_timer(handle)
+
+    def timer_running(self, handle):
+        return handle in self.hub._timers
+
+
+def install():
+    """Register HarnessHass as `appdaemon.plugins.hass.hassapi.Hass`."""
+    hassapi = types.ModuleType('appdaemon.plugins.hass.hassapi')
+    hassapi.Hass = HarnessHass
+    plugins_hass = types.ModuleType('appdaemon.plugins.hass')
+    plugins_hass.hassapi = hassapi
+    plugins = types.ModuleType('appdaemon.plugins')
+    plugins.hass = plugins_hass
+    appdaemon = types.ModuleType('appdaemon')
+    appdaemon.plugins = plugins
+    sys.modules['appdaemon'] = appdaemon
+    sys.modules['appdaemon.plugins'] = plugins
+    sys.modules['appdaemon.plugins.hass'] = plugins_hass
+    sys.modules['appdaemon.plugins.hass.hassapi'] = hassapi
+    if str(APPS) not in sys.path:
+        sys.path.insert(0, str(APPS))
+
+    # route the apps' notion of "now" through the virtual clock
+    base = importlib.import_module('base')
+    base.BaseApp.get_utc_time = lambda self: self.hub.clock.now
+
+
+def load_trace(path):
+    """Read a JSONL trace and return [(offset_seconds, entity_id, state, attributes)].
+
+    Two line formats are accepted:
+    - `{"t": 12.5, "entity_id": "light.x", "state": "on", "attributes": {...}}`
+    - Home Assistant `state_changed` events as exported from the websocket API,
+      `{"event_type": "state_changed", "time_fired": "...", "data": {"entity_id": ..., "new_state": {...}}}`;
+      offsets are relative to the first event.
+    """
+    events = []
+    first = None
+    with open(path, encoding='utf8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            item = json.loads(line)
+            if 'event_type' in item:
+                if item['event_type'] != 'state_changed':
+                    continue
+                fired = datetime.fromisoformat(item['time_fired'].replace('Z', '+00:00'))
+                first = first or fired
+                new_state = item['data'].get('new_state') or {}
+                events.append(((fired - first).total_seconds(), item['data']['entity_id'],
+                               new_state.get('state'), new_state.get('attributes')))
+            else:
+                events.append((float(item.get('t', item.get('offset', 0))), item['entity_id'],
+                               item.get('state'), item.get('attributes')))
+    events.sort(key=lambda e: e[0])
+    return events
+
+
+def synthetic_house(scale=1):
+    """Return (initial_states, app_configs) for a synthetic installation.
+
+    `scale` multiplies the number of sensors, lights and climate devices.
+    """
+    states = {
+        'alarm_control_panel.home': ('disarmed', {}),
+        'sun.sun': ('above_horizon', {'elevation': 30}),
+        'input_boolean.vacation_mode': ('off', {}),
+        'input_boolean.guest_mode': ('off', {}),
+        'binary_sensor.zigbee2mqtt_bridge_connection_state': ('on', {}),
+        'sensor.outside_temperature': ('12', {}),
+    }
+    doors = [f'binary_sensor.door_{i}' for i in range(4 * scale)]
+    windows = [f'binary_sensor.window_{i}' for i in range(8 * scale)]
+    motions = [f'binary_sensor.motion_{i}' for i in range(6 * scale)]
+    smokes = [f'binary_sensor.smoke_{i}' for i in range(2 * scale)]
+    leaks = [f'binary_sensor.leak_{i}' for i in range(2 * scale)]
+    trackers = [f'person.resident_{i}' for i in range(3)]
+    lights = [f'light.room_{i}' for i in range(10 * scale)]
+    plugs = [f'switch.plug_{i}' for i in range(4 * scale)]
+    climates = [f'climate.room_{i}' for i in range(3 * scale)]
+    cameras = [f'camera.cam_{i}' for i in range(2 * scale)]
+    illumination = [f'sensor.illumination_{i}' for i in range(2)]
+
+    for entity in doors:
+        states[entity] = ('off', {'device_class': 'door', 'friendly_name': entity.split('.')[1].replace('_', ' ')})
+    for entity in windows:
+        states[entity] = ('off', {'device_class': 'window', 'friendly_name': entity.split('.')[1].replace('_', ' ')})
+    for entity in motions:
+        states[entity] = ('off', {'device_class': 'motion', 'friendly_name': entity.split('.')[1].replace('_', ' ')})
+    for entity in smokes:
+        states[entity] = ('off', {'device_class': 'smoke'})
+    for entity in leaks:
+        states[entity] = ('off', {'device_class': 'moisture'})
+    for i, entity in enumerate(trackers):
+        states[entity] = ('home', {'friendly_name': f'Resident{i} Example'})
+    for entity in lights + plugs:
+        states[entity] = ('off', {})
+    for entity in climates:
+        states[entity] = ('heat', {'hvac_mode': 'heat', 'hvac_modes': ['off', 'heat', 'cool', 'fan_only'],
+                                   'temperature': 20, 'current_temperature': 20.5,
+                                   'fan_modes': ['Auto', 'Mid', 'HighMid', 'High'], 'fan_mode': 'Auto',
+                                   'preset_modes': ['none', 'quiet'], 'preset_mode': 'quiet'})
+    for entity in cameras:
+        states[entity] = ('idle', {})
+    for entity in illumination:
+        states[entity] = ('100', {})
+
+    common = {
+        'device_trackers': trackers,
+        'vacation_control': 'input_boolean.vacation_mode',
+        'guest_control': 'input_boolean.guest_mode',
+        'alarm_control_panel': 'alarm_control_panel.home',
+    }
+    apps = {
+        'alarm': ('alarm', 'AlarmControl', {
+            **common,
+            'armed_home_binary_sensors': doors + windows,
+            'armed_away_binary_sensors': doors + windows + motions,
+            'fire_binary_sensors': smokes,
+            'water_binary_sensors': leaks,
+            'alarm_lights': lights[:2],
+        }),
+        'climate': ('climate', 'ClimateControl', {
+            **common,
+            'opening_sensors': windows,
+            'motion_sensors': motions,
+            'climate_controls': climates,
+            'outside_temperature_sensor': 'sensor.outside_temperature',
+        }),
+        'light': ('light', 'LightControl', {
+            **common,
+            'motion_sensors': motions,
+            'illumination_sensors': illumination,
+            'lights': lights,
+        }),
+        'power': ('power', 'PowerControl', {
+            **common,
+            'motion_sensors': motions,
+            'power_controls': plugs,
+        }),
+        'frigate': ('frigate', 'FrigateControl', {
+            **common,
+            'opening_sensors': doors,
+            'motion_sensors': motions,
+            'frigate_cameras': cameras,
+        }),
+        'welcome': ('welcome', 'WelcomeControl', {
+            **common,
+            'door_sensor': doors[0],
+            'inside_motion_sensor': motions[0],
+            'outside_motion_sensor': motions[1],
+        }),
+        'awtrix': ('awtrix', 'AwtrixControl', {
+            **common,
+            'motion_sensors': motions,
+            'awtrix_prefixes': ['awtrix/living'],
+        }),
+    }
+    return states, apps
+
+
+def synthetic_trace(states, events=2000, hours=6, seed=1):
+    """Generate a seeded trace of plausible sensor activity for `synthetic_house`."""
+    rng = random.Random(seed)
+    motions = [e for e in states if e.startswith('binary_sensor.motion_')]
+    openings = [e for e in states if e.startswith(('binary_sensor.door_', 'binary_sensor.window_'))]
+    trackers = [e for e in states if e.startswith('person.')]
+    illumination = [e for e in states if e.startswith('sensor.illumination_')]
+
+    trace = []
+    span = hours * 3600
+    while len(trace) < events:
+        t = rng.uniform(0, span)
+        kind = rng.random()
+        if kind < 0.55:
+            # motion burst: several sensors on, then off after a while
+            for entity in rng.sample(motions, k=min(len(motions), rng.randint(1, 3))):
+                start = t + rng.uniform(0, 2)
+                trace.append((start, entity, 'on', None))
+                trace.append((start + rng.uniform(30, 240), entity, 'off', None))
+        elif kind < 0.8:
+            entity = rng.choice(openings)
+            trace.append((t, entity, 'on', None))
+            trace.append((t + rng.uniform(5, 600), entity, 'off', None))
+        elif kind < 0.9:
+            entity = rng.choice(illumination)
+            trace.append((t, entity, str(rng.randint(0, 400)), None))
+        elif kind < 0.97:
+            trace.append((t, 'sun.sun', None, {'elevation': round(rng.uniform(-20, 50), 1)}))
+        else:
+            entity = rng.choice(trackers)
+            trace.append((t, entity, 'not_home', None))
+            trace.append((t + rng.uniform(600, 3600), entity, 'home', None))
+    trace.sort(key=lambda e: e[0])
+    return trace[:events]
+
+
+class Replay:
+    """Load apps against a `HassHub` and replay a trace through them."""
+
+    def __init__(self, start=None, tz='UTC', log_level=logging.INFO, echo_logs=False):
+        install()
+        start = start or datetime(2024, 1, 15, 6, 0, tzinfo=timezone.utc)
+        self.clock = VirtualClock(start)
+        self.hub = HassHub(self.clock, tz=tz, log_level=log_level, echo_logs=echo_logs)
+        self.apps = {}
+        self.events = 0
+
+    def make_app(self, cls, name, args=None):
+        """Create an app instance bound to this hub without initializing it."""
+        app = object.__new__(cls)
+        app.name = name
+        app.hub = self.hub
+        app.args = dict(args or {})
+        return app
+
+    def load(self, configs, only=None):
+        """Instantiate and initialize apps from {name: (module, class, args)}."""
+        for name, (module, class_name, args) in configs.items():
+            if only and name not in only:
+                continue
+            cls = getattr(importlib.import_module(module), class_name)
+            app = self.make_app(cls, name, args)
+            self.apps[name] = app
+            self.hub.invoke(app, app.initialize)
+        self.settle(60)
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.hub.stats.clear()
+        self.hub.service_calls.clear()
+        self.events = 0
+
+    def settle(self, seconds):
+        """Advance virtual time, running timers and queued state changes."""
+        self.hub.drain()
+        self.clock.advance(self.clock.now + timedelta(seconds=seconds), on_step=self.hub.drain)
+
+    def run(self, trace, settle=900):
+        """Replay `trace` and return the wall time spent in seconds."""
+        start = self.clock.now
+        began = time.perf_counter()
+        for offset, entity_id, state, attributes in trace:
+            self.clock.advance(start + timedelta(seconds=offset), on_step=self.hub.drain)
+            self.hub.set_state(entity_id, state, attributes)
+            self.hub.drain()
+            self.events += 1
+        self.settle(settle)
+        return time.perf_counter() - began
+
+    def report(self):
+        """Return {app_name: metrics} for the apps loaded."""
+        return {name: self.hub.stats[name].summary(self.events) for name in self.apps}
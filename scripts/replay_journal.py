@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Replay an AlarmControl journal through the alarm logic in virtual time.
+
+Sensor and presence transitions and user arming changes from the journal (see
+`apps/journal.py`) are fed to a fresh AlarmControl running on the
+in-memory Home Assistant of `scripts/harness.py`. Triggered/pending panel
+states are left out, since they are what the replay should decide. The
+triggers of the replay are printed next to the recorded ones, which makes
+"what would have happened with these settings" runs possible without
+touching the live system.
+
+Run this from the repo root:
+  python3 scripts/replay_journal.py /config/alarm_journal.jsonl --config sample_config/apps.yaml --app alarm
+  python3 scripts/replay_journal.py journal.jsonl --set armed_away_sensor_threshold=3
+
+Without `--config` the sensors of the journal are used as armed_home and
+armed_away sensors. `--config` needs PyYAML.
+"""
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+import argparse
+import json
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import harness  # noqa: E402
+
+# panel states caused by the alarm logic itself
+OUTCOME_STATES = ('pending', 'triggered')
+BRIDGE = 'binary_sensor.zigbee2mqtt_bridge_connection_state'
+
+
+def load_app_args(config, app):
+    """Return the args of `app` from an AppDaemon apps.yaml."""
+    import yaml
+
+    data = yaml.safe_load(Path(config).read_text(encoding='utf8')) or {}
+    args = dict(data[app])
+    args.pop('module', None)
+    args.pop('class', None)
+    return args
+
+
+def build_replay(records, args):
+    """Seed a harness Replay from the journal and return (replay, trace)."""
+    first = records[0]['ts']
+    states = {}
+    trace = []
+    for record in records:
+        if record['kind'] not in ('sensor', 'presence', 'arming'):
+            continue
+        entity = record['entity']
+        attributes = dict(record.get('data') or {}) if record['kind'] == 'sensor' else None
+        if entity not in states:
+            # presence records written at start have no old state
+            states[entity] = (record['old'] if record['old'] is not None else record['new'], attributes)
+        if record['kind'] == 'arming' and record['new'] in OUTCOME_STATES:
+            continue
+        trace.append((record['ts'] - first, entity, record['new'], attributes))
+
+    kinds = {record['entity']: record['kind'] for record in records if record['kind'] in ('sensor', 'presence', 'arming')}
+    panels = [e for e, kind in kinds.items() if kind == 'arming']
+    sensors = [e for e, kind in kinds.items() if kind == 'sensor']
+    args.setdefault('device_trackers', [e for e, kind in kinds.items() if kind == 'presence'])
+    args.setdefault('alarm_control_panel', panels[0] if panels else 'alarm_control_panel.home')
+    args.setdefault('armed_home_binary_sensors', sensors)
+    args.setdefault('armed_away_binary_sensors', sensors)
+    states.setdefault(args['alarm_control_panel'], ('disarmed', None))
+    for bridge in args.get('bridge_entities', [BRIDGE]):
+        states.setdefault(bridge, ('on', None))
+    # the replay must not write into the journal it reads
+    args.pop('journal_path', None)
+
+    start = datetime.fromtimestamp(first, timezone.utc)
+    replay = harness.Replay(start=start)
+    replay.hub.seed(states)
+    stamp = (start - timedelta(hours=1)).isoformat()
+    for state in replay.hub.states.values():
+        state['last_updated'] = state['last_changed'] = stamp
+
+    # like Replay.load, but without settling, so trace offsets keep their wall-clock time
+    from alarm import AlarmControl
+    app = replay.make_app(AlarmControl, 'alarm', args)
+    replay.apps['alarm'] = app
+    replay.hub.invoke(app, app.initialize)
+    replay.hub.drain()
+    return replay, trace
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('journal', help='journal path (rotated segments are read too)')
+    parser.add_argument('--config', help='apps.yaml with the AlarmControl args')
+    parser.add_argument('--app', default='alarm', help='app name in --config')
+    parser.add_argument('--set', action='append', default=[], metavar='KEY=JSON',
+                        help='override an app arg, e.g. armed_away_sensor_threshold=3')
+    args = parser.parse_args()
+
+    harness.install()
+    from journal import read_journal
+
+    records = sorted(read_journal(args.journal), key=lambda r: r['ts'])
+    if not records:
+        parser.error(f"no records in {args.journal}")
+
+    app_args = load_app_args(args.config, args.app) if args.config else {}
+    for item in args.set:
+        key, _, value = item.partition('=')
+        try:
+            app_args[key] = json.loads(value)
+        except ValueError:
+            app_args[key] = value
+
+    replay, trace = build_replay(records, app_args)
+    app = replay.apps['alarm']
+    start = replay.clock.now
+    replayed = []
+    trigger_alarm = app.trigger_alarm
+
+    def record_trigger(alarm_type, alerts={}):
+        replayed.append(((replay.clock.now - start).total_seconds(), alarm_type))
+        trigger_alarm(alarm_type, alerts)
+
+    app.trigger_alarm = record_trigger
+    replay.run(trace)
+
+    first = records[0]['ts']
+    recorded = [(r['ts'] - first, r['data'].get('alarm_type')) for r in records if r['kind'] == 'trigger']
+
+    print(f"replayed {len(trace)} events from {len(records)} journal records")
+    print(f"recorded triggers: {len(recorded)}")
+    for offset, alarm_type in recorded:
+        print(f"  +{offset:10.1f}s {alarm_type}")
+    print(f"replayed triggers: {len(replayed)}")
+    for offset, alarm_type in replayed:
+        print(f"  +{offset:10.1f}s {alarm_type}")
+    return 0 if len(recorded) == len(replayed) else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())